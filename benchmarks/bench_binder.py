@@ -0,0 +1,80 @@
+"""
+Compares the generic parameter binder of discord_cli.command.Command with the
+binders generated by Command_System.compile on a representative set of commands.
+
+Run with: python benchmarks/bench_binder.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+
+async def function(client, message, params, *argv, **kwargs):
+    pass
+
+def build_command_system():
+    cs = dcli.Command_System('Benchmark')
+
+    rank = cs.command('rank', function = function)
+
+    give = cs.command('give', function = function)
+    give.argument.user_mention('user')
+    give.argument.integer('amount', min = 1)
+    give.option.word('reason', word = 'reason')
+    give.tag('silent')
+
+    queue = cs.command('queue')
+    queue_list = queue.command('list', function = function)
+    queue_list.option.integer('page', min = 1)
+    queue_list.option.integer('size', min = 1, max = 50)
+    queue_list.tag('verbose')
+    queue_list.tag('all', word = 'all')
+
+    event = cs.command('event', function = function)
+    event.argument.date('day')
+    event.argument.time('start')
+    event.option.integer('length', word = 'length')
+    event.option.channel_mention('channel', word = 'channel')
+    event.option.role_mention('role', word = 'role')
+    event.option.enum('repeat', ['daily', 'weekly', 'monthly'], letter = 'x', word = 'repeat')
+    event.tag('ping')
+    event.tag('quiet')
+
+    return cs, [
+        (rank, []),
+        (give, ['<@95584437231689728>', '250', '--reason', 'thanks', '-s']),
+        (queue_list, ['-p', '3', '-s', '25', '-v', '--all']),
+        (event, ['01/02/2020', '18:30:00', '--length', '90', '-c', '<#291649024409468928>', '--role', '<@&357235474869387276>', '--repeat', 'weekly', '-pq']),
+    ]
+
+async def measure(cases, number):
+    result = []
+    for command, params in cases:
+        best = None
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(number):
+                await command._parse_params(params)
+            elapsed = (time.perf_counter() - start) / number
+            best = elapsed if best is None else min(best, elapsed)
+        result.append(best)
+    return result
+
+async def main():
+    cs, cases = build_command_system()
+    interpreted = await measure(cases, 5000)
+    cs.compile()
+    compiled = await measure(cases, 5000)
+
+    print('{:<12} {:>18} {:>16} {:>9}'.format('command', 'interpreted (us)', 'compiled (us)', 'speedup'))
+    for (command, _), slow, fast in zip(cases, interpreted, compiled):
+        print('{:<12} {:>18.2f} {:>16.2f} {:>8.2f}x'.format(command.command_string, slow * 1e6, fast * 1e6, slow / fast))
+
+if __name__ == '__main__':
+    asyncio.run(main())
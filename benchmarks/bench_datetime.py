@@ -0,0 +1,52 @@
+"""
+Compares the precompiled date and time formats used by discord_cli.parsers.Date_Parser
+and discord_cli.parsers.Time_Parser with the previous regex and datetime.strptime path.
+
+Run with: python benchmarks/bench_datetime.py
+"""
+
+import os
+import re
+import sys
+import timeit
+from datetime import datetime
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_cli.parsers import Date_Parser, Time_Parser
+
+def strptime_date(input_string):
+    if not re.match('\\d\\d/\\d\\d/\\d\\d', input_string):
+        raise ValueError('must represent a date')
+    return datetime.strptime(input_string, '%d/%m/%Y')
+
+def strptime_time(input_string):
+    if not re.match('\\d\\d:\\d\\d:\\d\\d', input_string):
+        raise ValueError('must represent a time')
+    return datetime.strptime(input_string, '%H:%M:%S')
+
+def measure(function, value, number = 20000):
+    return min(timeit.repeat(lambda: function(value), number = number, repeat = 5)) / number
+
+def main():
+    date_parser = Date_Parser(None, None, True, False)
+    time_parser = Time_Parser(None, None, True, False)
+    custom_date_parser = Date_Parser(None, None, True, False, ['%Y-%m-%d', '%d/%m/%Y'])
+    twelve_hour_parser = Time_Parser(None, None, True, False, ['%I:%M %p'])
+
+    cases = [
+        ('date %d/%m/%Y', lambda x: strptime_date(x), date_parser.parse_sync, '25/12/2019'),
+        ('time %H:%M:%S', lambda x: strptime_time(x), time_parser.parse_sync, '18:30:05'),
+        ('date, 2nd format', lambda x: datetime.strptime(x, '%d/%m/%Y'), custom_date_parser.parse_sync, '25/12/2019'),
+        ('time %I:%M %p', lambda x: datetime.strptime(x, '%I:%M %p'), twelve_hour_parser.parse_sync, '06:30 PM'),
+    ]
+
+    print('{:<18} {:>15} {:>15} {:>9}'.format('case', 'strptime (us)', 'compiled (us)', 'speedup'))
+    for name, old, new, value in cases:
+        slow = measure(old, value)
+        fast = measure(new, value)
+        print('{:<18} {:>15.2f} {:>15.2f} {:>8.2f}x'.format(name, slow * 1e6, fast * 1e6, slow / fast))
+
+if __name__ == '__main__':
+    main()
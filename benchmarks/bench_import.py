@@ -0,0 +1,56 @@
+"""
+Measures how long `import discord_cli` takes in a fresh interpreter, using python -X importtime,
+and lists the modules which took the longest to import. If discord is installed, the time taken
+to import it as well is measured too, which is what importing discord_cli used to cost.
+
+Run with: python benchmarks/bench_import.py
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(statement):
+    """
+    Returns : dict - module name : cumulative import time in microseconds, for each module the statement imported
+    """
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd = ROOT, stderr = subprocess.PIPE, universal_newlines = True, check = True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def best_times(statement, number):
+    """
+    Returns : dict - The import times of the run in which the statement took the least time overall
+    """
+
+    runs = [import_times(statement) for _ in range(number)]
+    return min(runs, key = lambda times: sum(times[name] for name in times if '.' not in name))
+
+def main(number = 5, top = 10):
+    times = best_times('import discord_cli', number)
+    print('{:<36} {:>12}'.format('import discord_cli', 'time (ms)'))
+    print('{:<36} {:>12.1f}'.format('discord_cli', times['discord_cli'] / 1e3))
+    print('{:<36} {:>12}'.format('imports discord', str('discord' in times)))
+    print()
+
+    print('{:<36} {:>12}'.format('slowest modules', 'time (ms)'))
+    for name in sorted(times, key = times.get, reverse = True)[:top]:
+        print('{:<36} {:>12.1f}'.format(name, times[name] / 1e3))
+
+    try:
+        times = best_times('import discord_cli, discord', number)
+    except subprocess.CalledProcessError:
+        return
+    print()
+    print('{:<36} {:>12.1f}'.format('discord_cli and discord', (times['discord_cli'] + times['discord']) / 1e3))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures the memory taken by command trees of 100k commands, in bytes per command, using
+tracemalloc. Each shape is a tree of 1000 groups of 99 commands.
+
+    bare        : commands with a function and nothing else
+    parameters  : commands with an integer argument, a word option and a tag
+    permissions : commands with a shared permission, in groups with a permission of their own
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+
+async def function(client, message, params):
+    pass
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_bare(cs, i, j):
+    cs._root.sub_commands['group' + name(i)].command('command' + name(j), function = function)
+
+def build_parameters(cs, i, j):
+    command = cs._root.sub_commands['group' + name(i)].command('command' + name(j), function = function)
+    command.argument.integer('count')
+    command.option.word('target')
+    command.tag('verbose')
+
+MODERATOR = perms.Manage_Messages() | perms.Kick_Members()
+
+def build_permissions(cs, i, j):
+    group = cs._root.sub_commands['group' + name(i)]
+    if j == 0:
+        group.permission(perms.User_Permission(i))
+    command = group.command('command' + name(j), function = function)
+    command.permission(MODERATOR)
+
+def measure(build, groups = 1000, commands_per_group = 99):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cs = dcli.Command_System('Benchmark')
+    for i in range(groups):
+        cs.command('group' + name(i))
+        for j in range(commands_per_group):
+            build(cs, i, j)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    count = groups * (commands_per_group + 1)
+    return count, (after - before) / count, cs
+
+def main():
+    print('{:<16} {:>10} {:>16}'.format('shape', 'commands', 'bytes / command'))
+    for shape, build in (('bare', build_bare), ('parameters', build_parameters), ('permissions', build_permissions)):
+        count, per_command, _ = measure(build)
+        print('{:<16} {:>10} {:>16.0f}'.format(shape, count, per_command))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares getting pages of the command tree by rendering the whole tree and splitting it into
+pages afterwards with discord_cli.pagination, which renders the tree only as far as the page.
+Reading the first page, the seventh page and every page are timed, and the peak memory taken
+to read the first page is measured with tracemalloc.
+
+Run with: python benchmarks/bench_pagination.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+
+async def function(client, message, params):
+    pass
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_command_system(groups, commands_per_group):
+    cs = dcli.Command_System('Benchmark')
+    for i in range(groups):
+        group = cs.command('group' + name(i))
+        for j in range(commands_per_group):
+            command = group.command('command' + name(j), 'A command', function = function)
+            command.argument.integer('count', 'How many times to run', min = 1)
+            command.tag('verbose', 'Show more output')
+    return cs
+
+def split_pages(text, max_size):
+    pages = []
+    page = None
+    for line in text.splitlines():
+        if page is not None and len(page) + 1 + len(line) <= max_size:
+            page += '\n' + line
+        else:
+            if page is not None:
+                pages.append(page)
+            page = line
+    if page is not None:
+        pages.append(page)
+    return pages
+
+def measure(function, number):
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def main(number = 5, index = 6):
+    for groups, commands_per_group in ((10, 10), (50, 50), (100, 100)):
+        cs = build_command_system(groups, commands_per_group)
+        pages = split_pages(cs.tree_string(True), 2000)
+        assert pages[index] == cs.tree_pages(True).page(index)
+        assert pages == list(cs.tree_pages(True))
+
+        print('{:<28} {:>14} {:>14} {:>9}'.format('{} commands, {} pages'.format(groups * (commands_per_group + 1), len(pages)), 'split', 'lazy', 'speedup'))
+        for label, read in (
+                ('first page (ms)', lambda pages: pages[0] if isinstance(pages, list) else pages.page(0)),
+                ('page 7 (ms)', lambda pages: pages[index] if isinstance(pages, list) else pages.page(index)),
+                ('every page (ms)', lambda pages: list(pages))):
+            split_time = measure(lambda: read(split_pages(cs.tree_string(True), 2000)), number)
+            lazy_time = measure(lambda: read(cs.tree_pages(True)), number)
+            print('{:<28} {:>14.2f} {:>14.2f} {:>8.2f}x'.format(label, split_time * 1e3, lazy_time * 1e3, split_time / lazy_time))
+
+        split_peak = peak_memory(lambda: split_pages(cs.tree_string(True), 2000)[0])
+        lazy_peak = peak_memory(lambda: cs.tree_pages(True).page(0))
+        print('{:<28} {:>14.0f} {:>14.0f} {:>8.2f}x'.format('first page peak (KiB)', split_peak / 1024, lazy_peak / 1024, split_peak / lazy_peak))
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Measures the memory taken by the parsers of 100k parameters, in bytes per parameter, using
+tracemalloc, when each parameter builds it's own parser and when parsers with the same
+configuration are shared through discord_cli.parsers.get_parser, as the builders do.
+
+Run with: python benchmarks/bench_parsers.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli.parsers as parsers
+
+# The configurations of the parameters, repeated in turn
+CONFIGURATIONS = (
+    (parsers.Integer_Parser, 1, 100, True, True),
+    (parsers.Word_Parser, None, None, True, True),
+    (parsers.Float_Parser, 0.0, 1.0, True, False),
+    (parsers.String_Parser, 1, 200, True, True),
+    (parsers.Enum_Parser, ['fast', 'slow', 'safe']),
+    (parsers.Date_Parser, None, None, True, True, None),
+    (parsers.User_Mention_Parser,),
+)
+
+def build_separate(count):
+    return [configuration[0](*configuration[1:]) for configuration in (CONFIGURATIONS[i % len(CONFIGURATIONS)] for i in range(count))]
+
+def build_shared(count):
+    return [parsers.get_parser(*configuration) for configuration in (CONFIGURATIONS[i % len(CONFIGURATIONS)] for i in range(count))]
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(count)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count, result
+
+def main(count = 100000):
+    separate, separate_parsers = measure(build_separate, count)
+    shared, shared_parsers = measure(build_shared, count)
+    assert separate_parsers == shared_parsers
+
+    print('{:<24} {:>18} {:>10}'.format('{} parameters'.format(count), 'bytes / parameter', 'parsers'))
+    print('{:<24} {:>18.0f} {:>10}'.format('a parser each', separate, len(set(map(id, separate_parsers)))))
+    print('{:<24} {:>18.0f} {:>10}'.format('shared parsers', shared, len(set(map(id, shared_parsers)))))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Measures building, compiling, evaluating and writing permission trees of 10, 1000 and
+100000 leaves. The trees are built with the & and | operators, so they are left-deep
+binary trees as deep as they have leaves. Both the trees and their compiled forms are
+evaluated without recursion, so the depth of the tree is not limited by the recursion limit.
+
+The message and member below stand in for discord.py objects.
+
+Run with: python benchmarks/bench_permission_trees.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli.permissions as perms
+from discord_cli.permission_compiler import compile_permission
+
+class Permissions(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.kick_members = value & perms.Kick_Members.flag != 0
+        self.ban_members = value & perms.Ban_Members.flag != 0
+        self.manage_roles = value & perms.Manage_Roles.flag != 0
+
+class Member(object):
+
+    def __init__(self, id, value):
+        self.id = id
+        self.value = value
+
+    def permissions_in(self, channel):
+        return Permissions(self.value)
+
+class Guild(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class Message(object):
+
+    def __init__(self, author):
+        self.author = author
+        self.channel = None
+        self.guild = Guild(1)
+
+async def never(client, message):
+    return False
+
+def leaf(i, check):
+    kind = i % 5
+    if kind == 0:
+        return perms.User_Permission(1000 + i)
+    if kind == 1:
+        return perms.Kick_Members()
+    if kind == 2:
+        return perms.Guild_Permission(2000 + i)
+    if kind == 3:
+        return check
+    return perms.Ban_Members()
+
+def or_chain(leaves):
+    check = perms.Custom_Permission(never)
+    permission = leaf(0, check)
+    for i in range(1, leaves):
+        permission = permission | leaf(i, check)
+    return permission
+
+def alternating(leaves):
+    check = perms.Custom_Permission(never)
+    permission = leaf(0, check)
+    for i in range(1, leaves):
+        if i // 4 % 2 == 0:
+            permission = permission | leaf(i, check)
+        else:
+            permission = permission & leaf(i, check)
+    return permission
+
+def seconds(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+async def async_seconds(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        await function()
+    return (time.perf_counter() - start) / number
+
+async def main():
+    message = Message(Member(1, perms.Manage_Roles.flag))
+    print('{:<12} {:>7} {:>11} {:>13} {:>13} {:>16} {:>11}'.format('shape', 'leaves', 'build (ms)', 'compile (ms)', 'tree (ms)', 'compiled (ms)', 'str (ms)'))
+    for shape in (or_chain, alternating):
+        for leaves in (10, 1000, 100000):
+            number = max(1, 10000 // leaves)
+            build = seconds(lambda: shape(leaves), number)
+            tree = shape(leaves)
+            compile_time = seconds(lambda: compile_permission(tree), number)
+            compiled = compile_permission(tree)
+            assert await tree.evaluate(None, message) == await compiled.evaluate(None, message)
+            tree_time = await async_seconds(lambda: tree.evaluate(None, message), number)
+            compiled_time = await async_seconds(lambda: perms.Permission_Context(None, message).evaluate(compiled), number)
+            string = seconds(lambda: str(tree), number)
+            print('{:<12} {:>7} {:>11.3f} {:>13.3f} {:>13.3f} {:>16.3f} {:>11.3f}'.format(
+                shape.__name__, leaves, build * 1e3, compile_time * 1e3, tree_time * 1e3, compiled_time * 1e3, string * 1e3))
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""
+Compares evaluating permission trees as they were built with evaluating the trees compiled
+by discord_cli.permission_compiler, which check every discord permission in a group against
+a single discord.Permissions lookup.
+
+The message and member below stand in for discord.py objects. Each lookup of the member's
+permissions walks a list of roles, like discord.Member.permissions_in does.
+
+The help listing case compares evaluating the permissions of 50 subcommands one by one with
+evaluating them in the single discord_cli.permissions.Permission_Context used by usage_message.
+
+Run with: python benchmarks/bench_permissions.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+from discord_cli.permission_compiler import compile_permission
+
+FLAGS = {str(cls()): cls.flag for cls in perms.Discord_Permission.__subclasses__() if cls.flag is not None}
+
+class Permissions(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def __getattr__(self, name):
+        try:
+            flag = FLAGS[name]
+        except KeyError:
+            raise AttributeError(name)
+        return self.value & flag == flag
+
+class Member(object):
+
+    def __init__(self, id, roles):
+        self.id = id
+        self.roles = roles
+        self.lookups = 0
+
+    def permissions_in(self, channel):
+        self.lookups += 1
+        value = 0
+        for role in self.roles:
+            value |= role
+        return Permissions(value)
+
+class Message(object):
+
+    def __init__(self, author):
+        self.author = author
+        self.channel = None
+        self.guild = None
+
+async def staff(client, message):
+    return False
+
+async def database_lookup(client, message):
+    # Stands in for a query which takes a while to return
+    return sum(range(2000)) < 0
+
+def allowlist(user_ids):
+    permission = perms.User_Permission(user_ids[0])
+    for user_id in user_ids[1:]:
+        permission = permission | perms.User_Permission(user_id)
+    return permission
+
+TREES = [
+    ('kick & ban | admin', (perms.Kick_Members() & perms.Ban_Members()) | perms.Administrator()),
+    ('moderator', perms.Manage_Messages() & perms.Kick_Members() & perms.Ban_Members() & perms.Manage_Nicknames() | perms.Administrator() | perms.Manage_Guild()),
+    ('mixed', perms.User_Permission(1) | (perms.Manage_Roles() & perms.Manage_Channels()) | perms.Custom_Permission(staff) | perms.Administrator()),
+    ('expensive custom', perms.Custom_Permission(database_lookup) | perms.User_Permission(2)),
+    ('300 user allowlist', allowlist(list(range(100, 400))) | perms.Administrator()),
+]
+
+async def measure(permission, message, number):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await permission.evaluate(None, message)
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def main(number = 20000):
+    roles = [1 << 11, 1 << 10, 1 << 16, 1 << 6]
+    print('{:<20} {:>12} {:>15} {:>9} {:>15}'.format('tree', 'tree (us)', 'compiled (us)', 'speedup', 'lookups'))
+    for name, tree in TREES:
+        compiled = compile_permission(tree)
+        tree_member = Member(2, roles)
+        compiled_member = Member(2, roles)
+        assert await tree.evaluate(None, Message(tree_member)) == await compiled.evaluate(None, Message(compiled_member))
+        lookups = '{} -> {}'.format(tree_member.lookups, compiled_member.lookups)
+        tree_time = await measure(tree, Message(tree_member), number)
+        compiled_time = await measure(compiled, Message(compiled_member), number)
+        print('{:<20} {:>12.3f} {:>15.3f} {:>8.2f}x {:>15}'.format(name, tree_time * 1e6, compiled_time * 1e6, tree_time / compiled_time, lookups))
+
+async def function(client, message, params):
+    pass
+
+async def help_listing(number = 200):
+    cs = dcli.Command_System('Benchmark')
+    parent = cs.command('admin')
+    staff_permission = perms.Custom_Permission(staff)
+    for i in range(50):
+        sub_command = parent.command('sub' + chr(ord('a') + i // 26) + chr(ord('a') + i % 26), function = function)
+        sub_command.permission(perms.Manage_Guild() | perms.Administrator())
+        sub_command.permission(staff_permission & perms.Kick_Members())
+
+    async def separately(message):
+        for sub_command in parent._sub_commands.values():
+            await sub_command._permission_builder.evaluate(None, message)
+
+    async def in_context(message):
+        await parent.usage_message(None, message)
+
+    print()
+    print('{:<20} {:>12} {:>15} {:>9} {:>15}'.format('help listing', 'each (us)', 'context (us)', 'speedup', 'lookups'))
+    members = [Member(2, [1 << 11, 1 << 5]), Member(2, [1 << 11, 1 << 5])]
+    await separately(Message(members[0]))
+    await in_context(Message(members[1]))
+    lookups = '{} -> {}'.format(members[0].lookups, members[1].lookups)
+    times = []
+    for evaluate in (separately, in_context):
+        best = None
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(number):
+                await evaluate(Message(Member(2, [1 << 11, 1 << 5])))
+            elapsed = (time.perf_counter() - start) / number
+            best = elapsed if best is None else min(best, elapsed)
+        times.append(best)
+    print('{:<20} {:>12.3f} {:>15.3f} {:>8.2f}x {:>15}'.format('50 subcommands', times[0] * 1e6, times[1] * 1e6, times[0] / times[1], lookups))
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    asyncio.run(help_listing())
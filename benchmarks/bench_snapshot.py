@@ -0,0 +1,75 @@
+"""
+Compares building a command system of 10k commands with the builders, which validate every name
+and check every parameter against the others of it's command, with loading a snapshot of it,
+both from the snapshot dictionary and from the JSON written by discord_cli.snapshot.dump.
+
+Run with: python benchmarks/bench_snapshot.py
+"""
+
+import io
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+import discord_cli.snapshot as snapshot
+
+async def function(client, message, params):
+    pass
+
+async def is_moderator(client, message):
+    return False
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_command_system(groups, commands_per_group):
+    cs = dcli.Command_System('Benchmark')
+    moderator = perms.Manage_Messages() | perms.Custom_Permission(is_moderator)
+    for i in range(groups):
+        group = cs.command('group' + name(i), 'A group of commands')
+        group.permission(perms.Kick_Members() | perms.User_Permission(i))
+        for j in range(commands_per_group):
+            command = group.command('command' + name(j), 'A command', function = function)
+            command.argument.integer('count', 'How many times to run', min = 1, max = 100)
+            command.argument.word('target', 'What to run it on')
+            command.option.enum('mode', ['fast', 'slow', 'safe'], 'How to run it', word = 'mode')
+            command.option.date('since', 'When to start from', word = 'since')
+            command.tag('verbose', 'Show more output', word = 'verbose')
+            command.tag('quiet', 'Show less output')
+            if j % 2 == 0:
+                command.permission(moderator)
+    return cs
+
+def measure(function, number):
+    best = None
+    for _ in range(number):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(number = 3):
+    cs = build_command_system(100, 99)
+    data = snapshot.export_snapshot(cs)
+    stream = io.StringIO()
+    snapshot.dump(cs, stream)
+    text = stream.getvalue()
+    assert snapshot.load(io.StringIO(text)).tree_string(True) == cs.tree_string(True)
+
+    build_time = measure(lambda: build_command_system(100, 99), number)
+    import_time = measure(lambda: snapshot.import_snapshot(data), number)
+    load_time = measure(lambda: snapshot.load(io.StringIO(text)), number)
+
+    print('{:<36} {:>10}'.format('10000 commands', 'time (ms)'))
+    print('{:<36} {:>10.1f}'.format('build with the builders', build_time * 1e3))
+    print('{:<36} {:>10.1f} {:>8.2f}x'.format('import_snapshot from a dict', import_time * 1e3, build_time / import_time))
+    print('{:<36} {:>10.1f} {:>8.2f}x'.format('load from JSON ({:.1f} MiB)'.format(len(text) / 2 ** 20), load_time * 1e3, build_time / load_time))
+
+if __name__ == '__main__':
+    main()
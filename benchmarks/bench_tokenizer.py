@@ -0,0 +1,93 @@
+"""
+Compares the tokenizer used by discord_cli.command_system.Command_System against
+the original character by character implementation for messages of up to 4000
+characters (the Nitro message length limit).
+
+Run with: python benchmarks/bench_tokenizer.py
+"""
+
+import os
+import sys
+import timeit
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_cli.tokenizer import split_command_string
+
+LENGTHS = [250, 500, 1000, 2000, 4000]
+
+def legacy_split_command_string(command_string):
+    """
+    The original implementation which builds each element one character at a time
+    """
+
+    result = []
+    char_ptr = -1
+    current_string = ''
+    within_quotes = False
+    escape_next_char = False
+    escape_char = False
+
+    while True:
+        char_ptr += 1
+        if char_ptr == len(command_string):
+            if current_string != '':
+                result.append(current_string)
+            break
+
+        escape_char = escape_next_char
+        escape_next_char = False
+        char = command_string[char_ptr]
+
+        if char == ' ' and within_quotes == False and escape_char == False:
+            if current_string == '':
+                continue
+            result.append(current_string)
+            current_string = ''
+            continue
+        if char == '\\' and escape_char == False:
+            escape_next_char = True
+            continue
+        if char == '"' and escape_char == False:
+            if within_quotes == False and current_string != '':
+                raise ValueError('A quote used to start escaping text must follow a space')
+            if within_quotes == True and char_ptr + 1 < len(command_string) and command_string[char_ptr + 1] != ' ':
+                raise ValueError('A quote used to end escaping text must be followed by a space')
+            within_quotes = not within_quotes
+            continue
+        current_string += char
+
+    return result
+
+def words_message(length):
+    return ('queue add song ' + 'word ' * length)[:length]
+
+def quoted_message(length):
+    return 'paste "' + 'x' * (length - 8) + '"'
+
+def code_block_message(length):
+    line = 'if (a \\"b\\") { return c; }\\n '
+    return 'eval "' + (line * length)[:length - 7] + '"'
+
+MESSAGES = [
+    ('words', words_message),
+    ('quoted', quoted_message),
+    ('code block', code_block_message),
+]
+
+def measure(function, message, number):
+    return min(timeit.repeat(lambda: function(message), number = number, repeat = 5)) / number
+
+def main():
+    print('{:<12} {:>6} {:>14} {:>14} {:>12} {:>12}'.format('message', 'chars', 'legacy (us)', 'linear (us)', 'legacy ns/c', 'linear ns/c'))
+    for name, build in MESSAGES:
+        for length in LENGTHS:
+            message = build(length)
+            legacy = measure(legacy_split_command_string, message, 200)
+            linear = measure(split_command_string, message, 200)
+            print('{:<12} {:>6} {:>14.1f} {:>14.1f} {:>12.1f} {:>12.1f}'.format(
+                name, len(message), legacy * 1e6, linear * 1e6, legacy * 1e9 / len(message), linear * 1e9 / len(message)))
+
+if __name__ == '__main__':
+    main()
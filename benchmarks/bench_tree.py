@@ -0,0 +1,108 @@
+"""
+Compares rendering the command tree recursively with string concatenation, as tree_string used
+to, with the iterative renderer, both joined into a string and written line by line to a stream.
+Peak memory is measured with tracemalloc while writing to a stream which discards it's input.
+
+Run with: python benchmarks/bench_tree.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+
+class Null_Stream(object):
+
+    def write(self, text):
+        return len(text)
+
+async def function(client, message, params):
+    pass
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_command_system(groups, commands_per_group):
+    cs = dcli.Command_System('Benchmark')
+    for i in range(groups):
+        group = cs.command('group' + name(i))
+        group.permission(perms.Manage_Roles() | perms.User_Permission(i))
+        for j in range(commands_per_group):
+            command = group.command('command' + name(j), 'A command', function = function)
+            command.argument.integer('count', 'How many times to run', min = 1)
+            command.option.word('target', 'What to run it on')
+            command.tag('verbose', 'Show more output')
+    return cs
+
+def recursive_tree_string(command, details = False, prefix = '', include_name = True):
+    result = ''
+    if include_name:
+        result += prefix + '+ ' + command.name + '\n'
+
+    command_prefix = prefix + '| ' if command.sub_command_count != 0 else prefix + '  '
+
+    if details:
+        if command._argument_builder.argument_count != 0:
+            result += command_prefix + 'Arguments:\n'
+            for arg in command._argument_builder.arguments:
+                result += command_prefix + '  ' + str(arg) + '\n'
+        if command._option_builder.option_count != 0:
+            result += command_prefix + 'Options:\n'
+            for opt in command._option_builder.options:
+                result += command_prefix + '  ' + str(opt) + '\n'
+        if command._tag_builder.tag_count != 0:
+            result += command_prefix + 'Tags:\n'
+            for tag in command._tag_builder.tags:
+                result += command_prefix + '  ' + str(tag) + '\n'
+        if command._permission_builder.permission_count != 0:
+            result += command_prefix + 'Permissions:\n'
+            for perm in command._permission_builder.permissions:
+                result += command_prefix + '  ' + str(perm) + '\n'
+
+    for i, (command_name, command_obj) in enumerate(command.sub_commands.items()):
+        result += '{0}| \n{0}+-+ {1}\n'.format(prefix, command_name)
+        new_prefix = prefix + '| ' if i < command.sub_command_count - 1 else prefix + '  '
+        result += recursive_tree_string(command_obj, details = details, prefix = new_prefix, include_name = False)
+
+    return result
+
+def measure(function, number):
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main(number = 5):
+    print('{:<16} {:>16} {:>12} {:>12} {:>16} {:>16}'.format('details=True', 'recursive (ms)', 'join (ms)', 'write (ms)', 'recursive (KiB)', 'write (KiB)'))
+    for groups, commands_per_group in ((10, 10), (50, 50), (100, 100)):
+        cs = build_command_system(groups, commands_per_group)
+        root = cs._root
+        assert recursive_tree_string(root, True) == cs.tree_string(True)
+
+        recursive_time = measure(lambda: recursive_tree_string(root, True), number)
+        join_time = measure(lambda: cs.tree_string(True), number)
+        write_time = measure(lambda: cs.write_tree(Null_Stream(), True), number)
+        recursive_peak = peak_memory(lambda: recursive_tree_string(root, True))
+        write_peak = peak_memory(lambda: cs.write_tree(Null_Stream(), True))
+        print('{:<16} {:>16.2f} {:>12.2f} {:>12.2f} {:>16.1f} {:>16.1f}'.format('{} commands'.format(groups * (commands_per_group + 1)),
+            recursive_time * 1e3, join_time * 1e3, write_time * 1e3, recursive_peak / 1024, write_peak / 1024))
+
+if __name__ == '__main__':
+    main()
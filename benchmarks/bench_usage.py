@@ -0,0 +1,115 @@
+"""
+Compares rendering usage messages from scratch with the rendered usage messages cached on each
+command, which are kept until the command changes, one for each set of visible sub commands.
+
+The message and member below stand in for discord.py objects.
+
+Run with: python benchmarks/bench_usage.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+
+class Permissions(object):
+
+    def __init__(self, value):
+        self.value = value
+
+class Member(object):
+
+    def __init__(self, id, value):
+        self.id = id
+        self.value = value
+
+    def permissions_in(self, channel):
+        return Permissions(self.value)
+
+class Snowflake(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class Message(object):
+
+    def __init__(self, author):
+        self.author = author
+        self.guild = Snowflake(1)
+        self.channel = Snowflake(2)
+
+async def function(client, message, params):
+    pass
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_command_system(commands):
+    cs = dcli.Command_System('Benchmark')
+    group = cs.command('group', 'Commands which are grouped together', function = function)
+    group.argument.integer('count', 'How many times to run', min = 1, max = 10)
+    group.argument.word('target', 'What to run it on')
+    group.option.float('scale', 'How much to scale by', min = 0)
+    group.option.enum('mode', ['fast', 'slow', 'safe'], 'How to run it')
+    group.tag('verbose', 'Show more output')
+    group.tag('quiet', 'Show less output')
+    for i in range(commands):
+        command = group.command('command' + name(i), function = function)
+        if i % 3 == 0:
+            command.permission(perms.Kick_Members())
+    return cs, group
+
+def uncached(group, sub_commands):
+    # Forget the rendered messages so they are rendered again
+    group._usage_revision = None
+    return group._usage_message(sub_commands)
+
+async def measure(function, number):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def measure_sync(function, number):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def main(number = 2000):
+    print('{:<28} {:>12} {:>12} {:>9}'.format('', 'render (us)', 'cached (us)', 'speedup'))
+    for commands in (0, 20, 200):
+        cs, group = build_command_system(commands)
+        cs.set_permission_cache(1024, ttl = 60)
+        message = Message(Member(1, 0))
+        sub_commands = [x for x in group.sub_commands.values() if x._permission_builder.permission_count == 0]
+
+        assert uncached(group, sub_commands) == group._usage_message(sub_commands)
+
+        render_time = measure_sync(lambda: uncached(group, sub_commands), number)
+        cached_time = measure_sync(lambda: group._usage_message(sub_commands), number)
+        print('{:<28} {:>12.1f} {:>12.1f} {:>8.2f}x'.format('render, {} subcommands'.format(commands), render_time * 1e6, cached_time * 1e6, render_time / cached_time))
+
+        async def help_uncached():
+            group._usage_revision = None
+            return await cs.usage_message(None, message, 'group')
+        render_time = await measure(help_uncached, number)
+        cached_time = await measure(lambda: cs.usage_message(None, message, 'group'), number)
+        print('{:<28} {:>12.1f} {:>12.1f} {:>8.2f}x'.format('help, {} subcommands'.format(commands), render_time * 1e6, cached_time * 1e6, render_time / cached_time))
+
+if __name__ == '__main__':
+    asyncio.run(main())
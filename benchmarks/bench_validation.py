@@ -0,0 +1,99 @@
+"""
+Compares the compiled validator chains used by the parsers in discord_cli.parsers with the
+previous chains, which called each validator in turn and matched string patterns with re.match.
+
+Run with: python benchmarks/bench_validation.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_cli.parsers import Enum_Parser, Integer_Parser, String_Parser, User_Mention_Parser, Word_Parser
+
+def legacy_validate_string(string):
+    if not isinstance(string, str):
+        raise TypeError('expected str instance')
+    if len(string) == 0:
+        raise ValueError('must not have 0 length')
+
+def legacy_validate_length(string, min_length, max_length, include_min_length, include_max_length):
+    if min_length is not None:
+        if include_min_length and len(string) < min_length:
+            raise ValueError('too short')
+        if not include_min_length and len(string) <= min_length:
+            raise ValueError('too short')
+    if max_length is not None:
+        if include_max_length and len(string) > max_length:
+            raise ValueError('too long')
+        if not include_max_length and len(string) >= max_length:
+            raise ValueError('too long')
+
+def legacy_validate_bounds(value, min, max, include_min, include_max):
+    if min is not None:
+        if include_min and value < min or not include_min and value <= min:
+            raise ValueError('too small')
+    if max is not None:
+        if include_max and value > max or not include_max and value >= max:
+            raise ValueError('too large')
+
+def legacy_word(string):
+    legacy_validate_string(string)
+    if not re.match('^[a-zA-Z]+$', string):
+        raise ValueError('must represent a word')
+    legacy_validate_length(string, 2, 16, True, True)
+    return string
+
+def legacy_string(string):
+    legacy_validate_string(string)
+    legacy_validate_length(string, None, 100, True, True)
+    return string
+
+def legacy_integer(string):
+    try:
+        int(string)
+    except ValueError:
+        raise ValueError('must represent an integer')
+    result = int(string)
+    legacy_validate_bounds(result, 0, 100, True, False)
+    return result
+
+def legacy_user_mention(string):
+    legacy_validate_string(string)
+    if not re.match('<@!?[0-9]+>', string):
+        raise ValueError('must represent a user mention')
+    for c in '<@!>':
+        string = string.replace(c, '')
+    return int(string)
+
+def legacy_enum(string, values = ['red', 'green', 'blue', 'cyan', 'magenta', 'yellow', 'black', 'white']):
+    legacy_validate_string(string)
+    if string not in values:
+        raise ValueError('not found')
+    return string
+
+def measure(function, value, number = 50000):
+    return min(timeit.repeat(lambda: function(value), number = number, repeat = 5)) / number
+
+def main():
+    cases = [
+        ('word', legacy_word, Word_Parser(2, 16, True, True).parse_sync, 'parameter'),
+        ('string', legacy_string, String_Parser(None, 100, True, True).parse_sync, 'some text'),
+        ('integer', legacy_integer, Integer_Parser(0, 100, True, False).parse_sync, '42'),
+        ('user mention', legacy_user_mention, User_Mention_Parser().parse_sync, '<@!123456789012345678>'),
+        ('enum', legacy_enum, Enum_Parser(['red', 'green', 'blue', 'cyan', 'magenta', 'yellow', 'black', 'white']).parse_sync, 'white'),
+    ]
+
+    print('{:<14} {:>13} {:>15} {:>9}'.format('parser', 'legacy (us)', 'compiled (us)', 'speedup'))
+    for name, legacy, compiled, value in cases:
+        assert legacy(value) == compiled(value)
+        legacy_time = measure(legacy, value)
+        compiled_time = measure(compiled, value)
+        print('{:<14} {:>13.3f} {:>15.3f} {:>8.2f}x'.format(name, legacy_time * 1e6, compiled_time * 1e6, legacy_time / compiled_time))
+
+if __name__ == '__main__':
+    main()
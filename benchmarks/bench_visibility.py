@@ -0,0 +1,112 @@
+"""
+Compares listing the commands a user can see by walking the command tree and evaluating
+every command's permissions with the bitsets of discord_cli.visibility, which are computed
+once per user, guild and channel and cached in the permission decision cache. Both are measured
+without a decision cache, the default, in which help and completion only evaluate the commands
+they need, and with one.
+
+The message and member below stand in for discord.py objects.
+
+Run with: python benchmarks/bench_visibility.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Lets the benchmark run from a checkout, without installing discord_cli
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord_cli as dcli
+import discord_cli.permissions as perms
+
+class Permissions(object):
+
+    def __init__(self, value):
+        self.value = value
+
+class Member(object):
+
+    def __init__(self, id, value):
+        self.id = id
+        self.value = value
+
+    def permissions_in(self, channel):
+        return Permissions(self.value)
+
+class Snowflake(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class Message(object):
+
+    def __init__(self, author):
+        self.author = author
+        self.guild = Snowflake(1)
+        self.channel = Snowflake(2)
+
+async def function(client, message, params):
+    pass
+
+def name(i):
+    return ''.join(chr(ord('a') + int(x)) for x in str(i))
+
+def build_command_system(groups, commands_per_group):
+    cs = dcli.Command_System('Benchmark')
+    gated = [perms.Kick_Members(), perms.Manage_Roles() | perms.Administrator(), perms.User_Permission(5)]
+    for i in range(groups):
+        group = cs.command('group' + name(i))
+        if i % 4 == 3:
+            group.permission(perms.Administrator())
+        for j in range(commands_per_group):
+            command = group.command('command' + name(j), function = function)
+            if j % 3 == 0:
+                command.permission(gated[(i + j) % len(gated)])
+    return cs
+
+async def walk(command, message):
+    visible = []
+    for sub_command in command.sub_commands.values():
+        if await sub_command._permission_builder.evaluate(None, message):
+            visible.append(sub_command)
+            visible.extend(await walk(sub_command, message))
+    return visible
+
+async def measure(function, number):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def main(number = 200):
+    for cache_size in (None, 1024):
+        cs = build_command_system(50, 20)
+        if cache_size is not None:
+            cs.set_permission_cache(cache_size, ttl = 60)
+        message = Message(Member(1, perms.Kick_Members.flag))
+
+        assert await walk(cs._root, message) == await cs.visible_commands(None, message)
+
+        print('{:<28} {:>12} {:>15} {:>9}'.format('1050 commands, ' + ('no cache' if cache_size is None else 'cache'), 'walk (us)', 'bitset (us)', 'speedup'))
+        walk_time = await measure(lambda: walk(cs._root, message), number)
+        bitset_time = await measure(lambda: cs.visible_commands(None, message), number)
+        print('{:<28} {:>12.1f} {:>15.1f} {:>8.2f}x'.format('list visible commands', walk_time * 1e6, bitset_time * 1e6, walk_time / bitset_time))
+
+        group = next(iter(cs._root.sub_commands.values()))
+        walk_time = await measure(lambda: group.usage_message(None, message), number)
+        bitset_time = await measure(lambda: cs.usage_message(None, message, group.name), number)
+        print('{:<28} {:>12.1f} {:>15.1f} {:>8.2f}x'.format('help for a group', walk_time * 1e6, bitset_time * 1e6, walk_time / bitset_time))
+
+        walk_time = await measure(lambda: walk(group, message), number)
+        bitset_time = await measure(lambda: cs.complete(None, message, group.name + ' command'), number)
+        print('{:<28} {:>12.1f} {:>15.1f} {:>8.2f}x'.format('complete a group\'s commands', walk_time * 1e6, bitset_time * 1e6, walk_time / bitset_time))
+        print()
+
+if __name__ == '__main__':
+    asyncio.run(main())
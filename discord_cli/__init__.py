@@ -4,5 +4,6 @@ from discord_cli.argument_builder import Argument_Builder
 from discord_cli.option_builder import Option_Builder
 from discord_cli.tag_builder import Tag_Builder
 from discord_cli.permission_builder import Permission_Builder
+from discord_cli.pagination import Paginator
 
 import discord_cli.permissions as perms
\ No newline at end of file
@@ -1,7 +1,12 @@
+from types import MappingProxyType
+
 import discord_cli.parsers as parsers
 import discord_cli.exceptions as exceptions
 import discord_cli.validation as validation
 
+# The name table of the empty argument builder, which cannot be added to
+_EMPTY_TABLE = MappingProxyType({})
+
 class Argument(object):
 
     """
@@ -12,6 +17,8 @@ class Argument(object):
     The datatype is determined by the parser which it is given.
     """
 
+    __slots__ = ('_name', '_description', '_parser')
+
     def __init__(self, name, description, parser):
         """
         name        : str                               - The name of the argument
@@ -53,6 +60,14 @@ class Argument(object):
         
         return self._description
     
+    @property
+    def parser(self):
+        """
+        Returns : discord_cli.parsers.Base_Parser - The parser used to parse this argument
+        """
+
+        return self._parser
+
     async def parse(self, input_string):
         """
         Parses an input string into the datatype specified by the parser
@@ -84,16 +99,25 @@ class Argument_Builder(object):
 
     This class is referenced by the discord_cli.command.Command class
     after construction for parsing command strings ready to be executed.
+
+    Commands without arguments share EMPTY_ARGUMENT_BUILDER, whose
+    tables are immutable, until their first argument is added.
     """
 
+    __slots__ = ('_command', '_name_table', '_arguments', '_argument_count', '_first_is_text')
+
     def __init__(self, command):
         """
-        command : discord_cli.command.Command - The command the argument builder belongs to
+        command : discord_cli.command.Command | None - The command the argument builder belongs to (If None, the builder is empty and cannot be added to)
         """
 
         self._command = command
-        self._name_table = {}
-        self._arguments = []
+        if command is None:
+            self._name_table = _EMPTY_TABLE
+            self._arguments = ()
+        else:
+            self._name_table = {}
+            self._arguments = []
         self._argument_count = 0
 
         self._first_is_text = False
@@ -113,6 +137,7 @@ class Argument_Builder(object):
         self._arguments.append(argument)
         self._name_table[argument.name] = argument
         self._argument_count += 1
+        self._command._touch()
 
     def integer(self, name, description = None, min = None, max = None, include_min = True, include_max = False):
         """
@@ -128,7 +153,7 @@ class Argument_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Integer_Parser(min, max, include_min, include_max)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Integer_Parser, min, max, include_min, include_max)))
     
     def word(self, name, description = None, min_length = None, max_length = None, include_min_length = True, include_max_length = False):
         """
@@ -148,7 +173,7 @@ class Argument_Builder(object):
             raise exceptions.Ambiguous_Parameter_Error('Cannot add word argument to {} as it has sub commands'.format(self._command.command_string))
         if self._argument_count == 0:
             self._first_is_text = True
-        self._add_argument(Argument(name, description, parsers.Word_Parser(min_length, max_length, include_min_length, include_max_length)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Word_Parser, min_length, max_length, include_min_length, include_max_length)))
     
     def float(self, name, description = None, min = None, max = None, include_min = True, include_max = False):
         """
@@ -164,7 +189,7 @@ class Argument_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Float_Parser(min, max, include_min, include_max)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Float_Parser, min, max, include_min, include_max)))
 
     def string(self, name, description = None, min_length = None, max_length = None, include_min_length = True, include_max_length = False):
         """
@@ -184,7 +209,7 @@ class Argument_Builder(object):
             raise exceptions.Ambiguous_Parameter_Error('Cannot add string argument to {} as it has sub commands'.format(self._command.command_string))
         if self._argument_count == 0:
             self._first_is_text = True
-        self._add_argument(Argument(name, description, parsers.String_Parser(min_length, max_length, include_min_length, include_max_length)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.String_Parser, min_length, max_length, include_min_length, include_max_length)))
 
     def user_mention(self, name, description = None):
         """
@@ -195,7 +220,7 @@ class Argument_Builder(object):
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
-        self._add_argument(Argument(name, description, parsers.User_Mention_Parser()))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.User_Mention_Parser)))
 
     def channel_mention(self, name, description = None):
         """
@@ -207,7 +232,7 @@ class Argument_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Channel_Mention_Parser()))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Channel_Mention_Parser)))
 
     def role_mention(self, name, description = None):
         """
@@ -219,39 +244,41 @@ class Argument_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Role_Mention_Parser()))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Role_Mention_Parser)))
     
-    def date(self, name, description = None, min = None, max = None, include_min = True, include_max = False):
+    def date(self, name, description = None, min = None, max = None, include_min = True, include_max = False, formats = None):
         """
         Adds a date argument into the array of arguments
 
         name            : str           - The name of the date argument
         description     : str | None    - A description of the date argument
-        min             : str | None    - The lower bound of valid inputs in form '%d/%m/%Y'
-        max             : str | None    - The upper bound of valid inputs in form '%d/%m/%Y'
+        min             : str | None    - The lower bound of valid inputs in one of the formats
+        max             : str | None    - The upper bound of valid inputs in one of the formats
         include_min     : bool          - Whether to include the minimum as valid
         include_max     : bool          - Whether to include the maximum as valid
+        formats         : list | None   - The accepted formats using the directives %d, %m, %Y and %y (If None, ['%d/%m/%Y'])
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Date_Parser(min, max, include_min, include_max)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Date_Parser, min, max, include_min, include_max, formats)))
     
-    def time(self, name, description = None, min = None, max = None, include_min = True, include_max = False):
+    def time(self, name, description = None, min = None, max = None, include_min = True, include_max = False, formats = None):
         """
         Adds a time argument into the array of arguments
 
         name            : str           - The name of the time argument
         description     : str | None    - A description of the time argument
-        min             : str | None    - The lower bound of valid inputs in form '%H:%M:%S'
-        max             : str | None    - The upper bound of valid inputs in form '%H:%M:%S'
+        min             : str | None    - The lower bound of valid inputs in one of the formats
+        max             : str | None    - The upper bound of valid inputs in one of the formats
         include_min     : bool          - Whether to include the minimum as valid
         include_max     : bool          - Whether to include the maximum as valid
+        formats         : list | None   - The accepted formats using the directives %H, %I, %M, %S, %f and %p (If None, ['%H:%M:%S'])
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_argument(Argument(name, description, parsers.Time_Parser(min, max, include_min, include_max)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Time_Parser, min, max, include_min, include_max, formats)))
 
     def enum(self, name, values, description = None):
         """
@@ -268,7 +295,7 @@ class Argument_Builder(object):
             raise exceptions.Ambiguous_Parameter_Error('Cannot add enum argument to {} as it has sub commands'.format(self._command.command_string))
         if self._argument_count == 0:
             self._first_is_text = True
-        self._add_argument(Argument(name, description, parsers.Enum_Parser(values)))
+        self._add_argument(Argument(name, description, parsers.get_parser(parsers.Enum_Parser, values)))
 
     @property
     def arguments(self):
@@ -300,4 +327,7 @@ class Argument_Builder(object):
         Returns : bool - Whether the first argument can be confused with a sub command
         """
 
-        return self._first_is_text
\ No newline at end of file
+        return self._first_is_text
+
+# Shared by every command which has no arguments
+EMPTY_ARGUMENT_BUILDER = Argument_Builder(None)
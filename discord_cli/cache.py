@@ -0,0 +1,339 @@
+import time
+from collections import OrderedDict
+
+import discord_cli.exceptions as exceptions
+
+class LRU_Cache(object):
+
+    """
+    A bounded mapping which discards the least recently used entry when it is full.
+
+    The cache counts hits, misses and evictions so that its effectiveness can be
+    monitored while a bot is running.
+    """
+
+    def __init__(self, max_size):
+        """
+        max_size : int - The maximum amount of entries held by the cache
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise exceptions.Type_Error('max_size expected int instance, {} found'.format(max_size.__class__.__name__))
+        if max_size < 1:
+            raise exceptions.Value_Error('max_size must be greater than 0')
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, default = None):
+        """
+        Gets the value associated with a key and marks it as the most recently used
+
+        key     : object    - The key of the entry
+        default : object    - The value returned if there is no entry for the key
+        Returns : object    - The value associated with the key or default
+        """
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Associates a value with a key, evicting the least recently used entry if the cache is full
+
+        key     : object    - The key of the entry
+        value   : object    - The value to be associated with the key
+        """
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last = False)
+            self._evictions += 1
+
+    def clear(self):
+        """
+        Removes every entry from the cache. The counters are kept.
+        """
+
+        self._entries.clear()
+
+    def __len__(self):
+        """
+        Returns : int - The amount of entries in the cache
+        """
+
+        return len(self._entries)
+
+    @property
+    def max_size(self):
+        """
+        Returns : int - The maximum amount of entries held by the cache
+        """
+
+        return self._max_size
+
+    @property
+    def hits(self):
+        """
+        Returns : int - The amount of lookups which found an entry
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Returns : int - The amount of lookups which did not find an entry
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        Returns : int - The amount of entries discarded to make room for new ones
+        """
+
+        return self._evictions
+
+class Permission_Decision_Cache(object):
+
+    """
+    A bounded mapping from a permission builder and the user, guild and channel of a message to
+    whether the user met the builder's permissions, so the permissions are not evaluated again
+    for every command invoked by the same user in the same channel.
+
+    Decisions expire after a fixed amount of time. They can also be invalidated when something
+    which affects them changes, by calling the invalidate methods from the bot's event handlers:
+
+        on_member_update(before, after)         -> invalidate_member(after.id, after.guild.id)
+        on_guild_role_update(before, after)     -> invalidate_guild(after.guild.id)
+        on_guild_channel_update(before, after)  -> invalidate_channel(after.id)
+
+    Only use the decision cache if every custom permission depends on nothing but the user,
+    guild and channel, since a cached decision is used for any message which shares them.
+
+    The decision cache also holds the bitsets of the commands each user can see, see
+    discord_cli.visibility, so they are invalidated along with the decisions.
+    """
+
+    def __init__(self, max_size, ttl):
+        """
+        max_size    : int           - The maximum amount of decisions held by the cache
+        ttl         : int | float   - The amount of seconds a decision is kept for
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise exceptions.Type_Error('max_size expected int instance, {} found'.format(max_size.__class__.__name__))
+        if max_size < 1:
+            raise exceptions.Value_Error('max_size must be greater than 0')
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool):
+            raise exceptions.Type_Error('ttl expected int or float instance, {} found'.format(ttl.__class__.__name__))
+        if ttl <= 0:
+            raise exceptions.Value_Error('ttl must be greater than 0')
+
+        self._max_size = max_size
+        self._ttl = ttl
+
+        # (builder, user id, guild id, channel id) : (decision, expiry time)
+        self._entries = OrderedDict()
+        # id : set of keys, for invalidation
+        self._by_user = {}
+        self._by_guild = {}
+        self._by_channel = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key):
+        """
+        Gets the decision associated with a key and marks it as the most recently used
+
+        key     : tuple                 - The permission builder and the user, guild and channel ids
+        Returns : bool | int | None     - The decision, or None if there is no decision or it has expired
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[0]
+
+    def put(self, key, decision):
+        """
+        Associates a decision with a key, evicting the least recently used decision if the cache is full
+
+        key         : tuple         - The permission builder and the user, guild and channel ids
+        decision    : bool | int    - Whether the user met the permissions, or the bitset of the commands the user can see
+        """
+
+        if key not in self._entries:
+            _, user_id, guild_id, channel_id = key
+            self._by_user.setdefault(user_id, set()).add(key)
+            self._by_guild.setdefault(guild_id, set()).add(key)
+            self._by_channel.setdefault(channel_id, set()).add(key)
+        self._entries[key] = (decision, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def invalidate_member(self, user_id, guild_id = None):
+        """
+        Removes the decisions made for a user, such as when their roles change
+
+        user_id     : int           - The id of the user
+        guild_id    : int | None    - The id of the guild the change happened in (if None, every guild)
+        """
+
+        keys = self._by_user.get(user_id, ())
+        if guild_id is not None:
+            keys = [x for x in keys if x[2] == guild_id]
+        self._invalidate(keys)
+
+    def invalidate_guild(self, guild_id):
+        """
+        Removes the decisions made within a guild, such as when a role changes
+
+        guild_id : int - The id of the guild
+        """
+
+        self._invalidate(self._by_guild.get(guild_id, ()))
+
+    def invalidate_channel(self, channel_id):
+        """
+        Removes the decisions made within a channel, such as when it's permission overwrites change
+
+        channel_id : int - The id of the channel
+        """
+
+        self._invalidate(self._by_channel.get(channel_id, ()))
+
+    def clear(self):
+        """
+        Removes every decision from the cache. The counters are kept.
+        """
+
+        self._entries.clear()
+        self._by_user.clear()
+        self._by_guild.clear()
+        self._by_channel.clear()
+
+    def _invalidate(self, keys):
+        """
+        Removes the decisions associated with some keys
+        """
+
+        for key in list(keys):
+            self._remove(key)
+            self._invalidations += 1
+
+    def _remove(self, key):
+        """
+        Removes a decision and it's index entries
+        """
+
+        del self._entries[key]
+        _, user_id, guild_id, channel_id = key
+        for index, index_key in ((self._by_user, user_id), (self._by_guild, guild_id), (self._by_channel, channel_id)):
+            keys = index[index_key]
+            keys.discard(key)
+            if len(keys) == 0:
+                del index[index_key]
+
+    def __len__(self):
+        """
+        Returns : int - The amount of decisions in the cache
+        """
+
+        return len(self._entries)
+
+    @property
+    def max_size(self):
+        """
+        Returns : int - The maximum amount of decisions held by the cache
+        """
+
+        return self._max_size
+
+    @property
+    def ttl(self):
+        """
+        Returns : int | float - The amount of seconds a decision is kept for
+        """
+
+        return self._ttl
+
+    @property
+    def hits(self):
+        """
+        Returns : int - The amount of lookups which found a decision
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Returns : int - The amount of lookups which did not find a decision, including expired decisions
+        """
+
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """
+        Returns : float - The fraction of lookups which found a decision (0.0 if there have been no lookups)
+        """
+
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups != 0 else 0.0
+
+    @property
+    def evictions(self):
+        """
+        Returns : int - The amount of decisions discarded to make room for new ones
+        """
+
+        return self._evictions
+
+    @property
+    def expirations(self):
+        """
+        Returns : int - The amount of decisions discarded because they were too old
+        """
+
+        return self._expirations
+
+    @property
+    def invalidations(self):
+        """
+        Returns : int - The amount of decisions discarded by the invalidate methods
+        """
+
+        return self._invalidations
@@ -1,13 +1,47 @@
 import re
+import asyncio
+import weakref
+from types import MappingProxyType
 from inspect import iscoroutinefunction
+from itertools import chain
 
+import discord_cli.compiler as compiler
 import discord_cli.exceptions as exceptions
+import discord_cli.permissions as permissions
 import discord_cli.validation as validation
 
-from discord_cli.argument_builder import Argument_Builder
-from discord_cli.option_builder import Option_Builder
-from discord_cli.tag_builder import Tag_Builder
-from discord_cli.permission_builder import Permission_Builder
+from discord_cli.argument_builder import Argument_Builder, EMPTY_ARGUMENT_BUILDER
+from discord_cli.option_builder import Option_Builder, EMPTY_OPTION_BUILDER
+from discord_cli.tag_builder import Tag_Builder, EMPTY_TAG_BUILDER
+from discord_cli.permission_builder import Permission_Builder, EMPTY_PERMISSION_BUILDER
+from discord_cli.cache import LRU_Cache
+
+# The sub command table of commands without sub commands
+_EMPTY_TABLE = MappingProxyType({})
+
+class Parameter(object):
+
+    """
+    A parameter is a single element of a command string after it has been classified
+    as the value of an argument, an option along with it's value or a tag.
+    """
+
+    __slots__ = ('kind', 'target', 'value')
+
+    ARGUMENT = 0
+    OPTION = 1
+    TAG = 2
+
+    def __init__(self, kind, target, value):
+        """
+        kind    : int           - One of Parameter.ARGUMENT, Parameter.OPTION or Parameter.TAG
+        target  : object        - The argument, option or tag that the parameter is for
+        value   : str | None    - The string to be parsed for the argument or option, None for tags
+        """
+
+        self.kind = kind
+        self.target = target
+        self.value = value
 
 class Command(object):
 
@@ -19,8 +53,26 @@ class Command(object):
     a description which explains what the command / command tree is used for.
 
     All commands can also contain sub commands. For example, `git add` is a sub command of `git`.
+
+    Commands are kept compact so that trees of many thousands of commands stay small: the builders
+    and the sub command table are shared empty ones until something is first added to them.
+
+    A command refers to it's parent through a weak reference, so a tree is held only from it's root
+    down. The only reference cycles left are between a command and the builders it has allocated,
+    see discord_cli.command_system.Command_System.finalize.
     """
 
+    __slots__ = (
+        '_name', '_description', '_parent', '_function', '_command_string',
+        '_argument_builder', '_option_builder', '_tag_builder', '_permission_builder',
+        '_sub_commands', '_sub_command_count', '_revision', '_binder', '_binder_revision',
+        '_parser_concurrency', '_parser_semaphore', '_usage_revision', '_usage_static', '_usage_messages',
+        '__weakref__',
+    )
+
+    # The amount of usage messages kept per command, one for each set of visible sub commands
+    USAGE_CACHE_SIZE = 16
+
     def __init__(self, name, description = None, parent = None, command_string = None, function = None):
         """
         name            : str                                   - The name of the command
@@ -46,29 +98,57 @@ class Command(object):
         if function is not None and not iscoroutinefunction(function):
             raise exceptions.Not_Async_Function_Error('Command function must be an async function')
 
+        self._initialize(name, description, parent, command_string, function)
+
+    def _initialize(self, name, description, parent, command_string, function):
+        """
+        Sets up a command whose inputs have already been validated, such as one loaded from a snapshot
+        """
+
         self._name = name
         self._description = description
 
-        self._parent = parent
+        # Weak, so the tree holds no reference cycles for the garbage collector to scan
+        self._parent = None if parent is None else weakref.ref(parent)
         self._function = function
 
         self._command_string = command_string
 
-        self._argument_builder = Argument_Builder(self)
-        self._option_builder = Option_Builder(self)
-        self._tag_builder = Tag_Builder(self)
-        self._permission_builder = Permission_Builder(self)
+        self._argument_builder = EMPTY_ARGUMENT_BUILDER
+        self._option_builder = EMPTY_OPTION_BUILDER
+        self._tag_builder = EMPTY_TAG_BUILDER
+        self._permission_builder = EMPTY_PERMISSION_BUILDER
 
-        self._sub_commands = {}
+        self._sub_commands = _EMPTY_TABLE
         self._sub_command_count = 0
+
+        self._revision = 0
+
+        self._binder = None
+        self._binder_revision = None
+
+        self._parser_concurrency = None
+        self._parser_semaphore = None
+
+        self._usage_revision = None
+        self._usage_static = None
+        self._usage_messages = None
     
+    @property
+    def revision(self):
+        """
+        Returns : int - A counter which increases whenever this command or one of it's descendants is changed
+        """
+
+        return self._revision
+
     @property
     def parent(self):
         """
-        Returns : discord_cli.command.Command - The parent command of this command
+        Returns : discord_cli.command.Command | None - The parent command of this command (None for the root command, or once the parent no longer exists)
         """
 
-        return self._parent
+        return None if self._parent is None else self._parent()
 
     @property
     def name(self):
@@ -129,6 +209,8 @@ class Command(object):
         if self._function is None:
             raise exceptions.Cannot_Add_Parameters_Error('Can\'t add argument to command without function assigned to it')
 
+        if self._argument_builder is EMPTY_ARGUMENT_BUILDER:
+            self._argument_builder = Argument_Builder(self)
         return self._argument_builder
 
     @property
@@ -142,6 +224,8 @@ class Command(object):
         if self._function is None:
             raise exceptions.Cannot_Add_Parameters_Error('Can\'t add option to command without function assigned to it')
 
+        if self._option_builder is EMPTY_OPTION_BUILDER:
+            self._option_builder = Option_Builder(self)
         return self._option_builder
     
     def tag(self, name, description = None, letter = None, word = None):
@@ -160,6 +244,8 @@ class Command(object):
         if self._function is None:
             raise exceptions.Cannot_Add_Parameters_Error('Can\'t add tag to command without function assigned to it')
 
+        if self._tag_builder is EMPTY_TAG_BUILDER:
+            self._tag_builder = Tag_Builder(self)
         self._tag_builder.tag(name, description, letter, word)
     
     def permission(self, permission):
@@ -171,6 +257,8 @@ class Command(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid     
         """
 
+        if self._permission_builder is EMPTY_PERMISSION_BUILDER:
+            self._permission_builder = Permission_Builder(self)
         self._permission_builder.permission(permission)
 
     async def get_command(self, client, message, *argv):
@@ -185,207 +273,201 @@ class Command(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid or user does not have sufficient permissions for command
         """
 
-        if len(argv) == 0:
-            return self, []
-        if argv[0] in self._sub_commands:
-            sub_command = self._sub_commands[argv[0]]
-            if not await sub_command._permission_builder.evaluate(client, message):
+        command, params = await self.resolve_command(client, message, iter(argv))
+        return command, list(params)
+
+    async def resolve_command(self, client, message, elements, context = None):
+        """
+        Gets a command specified by the identifiers at the start of an iterator of command string elements
+
+        Only the identifiers which make up the path to the command, and the element which
+        follows them, are taken from the iterator. The remaining elements are left in the
+        iterator so they are only produced once the parameters are needed.
+
+        client      : discord.Client                                - The discord bot client
+        message     : discord.Message                               - A message from a user in a channel to specify permissions
+        elements    : iterator                                      - The elements of the command string
+        context     : discord_cli.permissions.Permission_Context    - The context of the invocation (if None, a new context is used)
+        Returns     : discord_cli.command.Command, iterator         - The command, the remaining elements
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid or user does not have sufficient permissions for command
+        """
+
+        if context is None:
+            context = permissions.Permission_Context(client, message)
+
+        elements = iter(elements)
+        command = self
+        for element in elements:
+            sub_command = command._sub_commands.get(element)
+            if sub_command is None:
+                return command, chain((element,), elements)
+            if not await sub_command._permission_builder.evaluate(client, message, context):
                 raise exceptions.Insufficient_Permissions_Error('Insufficient permissions')
-            return await sub_command.get_command(client, message, *argv[1:])
-        return self, argv
-    
-    async def _symbolize_params(self, params):
+            command = sub_command
+        return command, elements
+
+    def _classify_params(self, params):
         """
-        Changes the identifiers of options and tags to symbols
+        Classifies each parameter string as the value of an argument, an option identifier
+        followed by the option's value or an identifier for one or more tags
 
-        params  : list  - A list of strings which represent the inputted parameters
-        Returns : list  - The list after having symbols added to it
+        params  : iterable  - The strings which represent the inputted parameters
+        Returns : generator - Yields a discord_cli.command.Parameter for each argument, option and tag in order
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
         """
 
-        result = []
-        
-        for param in params:
-            option = False
-            tags = False
-            names = None
+        arguments = self._argument_builder.arguments
+        argument_count = self._argument_builder.argument_count
+        option_letters = self._option_builder.letter_table
+        option_words = self._option_builder.word_table
+        tag_letters = self._tag_builder.letter_table
+        tag_words = self._tag_builder.word_table
 
+        arg_ptr = 0
+        params = iter(params)
+
+        for param in params:
             # If the parameter is a word identifier
             if param.startswith('--'):
                 word = param.replace('-', '')
-                
-                if word in self._option_builder.word_table:
-                    option = True
-                    names = [self._option_builder.word_table[word].name]
-                
-                elif word in self._tag_builder.word_table:
-                    tags = True
-                    names = [self._tag_builder.word_table[word].name]
-                
+
+                if word in option_words:
+                    yield self._option_parameter(option_words[word], params)
+                elif word in tag_words:
+                    yield Parameter(Parameter.TAG, tag_words[word], None)
                 else:
                     raise exceptions.Unexpected_Word_Error('\'{}\' has no option or tag associated with --{}'.format(self._command_string, word))
 
             # If the parameter is a letter identifier
             elif param.startswith('-') and len(param) > 1 and not param[1:].isdigit():
                 letters = param.replace('-', '')
-                
-                if len(letters) == 1 and letters in self._option_builder.letter_table:
-                    option = True
-                    names = [self._option_builder.letter_table[letters].name]
-                
+
+                if len(letters) == 1 and letters in option_letters:
+                    yield self._option_parameter(option_letters[letters], params)
                 else:
-                    names = []
-                    tags = True
+                    tags = []
                     for letter in letters:
-                        if letter in self._tag_builder.letter_table:
-                            names.append(self._tag_builder.letter_table[letter].name)
-                        
-                        else:
+                        if letter not in tag_letters:
                             raise exceptions.Unexpected_Letter_Error('\'{}\' has no option or tag associated with -{}'.format(self._command_string, letter))
-            
-            if option == True:
-                result.append('-OPTION:{}'.format(names[0]))
-            elif tags == True:
-                for name in names:
-                    result.append('-TAG:{}'.format(name))
+                        tags.append(Parameter(Parameter.TAG, tag_letters[letter], None))
+                    yield from tags
+
             else:
-                result.append(param)
-        
-        return result
+                if arg_ptr == argument_count:
+                    raise exceptions.Unexpected_Argument_Error('\'{}\' only expected {} arguments'.format(self._command_string, argument_count))
+                yield Parameter(Parameter.ARGUMENT, arguments[arg_ptr], param)
+                arg_ptr += 1
 
-    async def _parse_args(self, params):
+        if arg_ptr != argument_count:
+            raise exceptions.Expected_Arguments_Error('\'{}\' expected {} arguments, got {}'.format(self._command_string, argument_count, arg_ptr))
+
+    def _option_parameter(self, option, params):
         """
-        Finds all of the arguments in a command string
+        Takes the value of an option from the parameters which follow it's identifier
 
-        params  : list  - The symbolized list of parameters
-        Returns : dict  - A dictionary which relates an argument's name with it's value
+        option  : discord_cli.option_builder.Option - The option whose identifier was found
+        params  : iterator                          - The remaining parameter strings
+        Returns : discord_cli.command.Parameter     - The option along with it's value
 
-        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
+        Raises discord_cli.exceptions.Invalid_Option_Error if there is no value for the option
         """
 
-        args = {}
+        value = next(params, None)
+        if value is None:
+            raise exceptions.Invalid_Option_Error('Option \'{}\' requires a value'.format(option.name))
+        return Parameter(Parameter.OPTION, option, value)
 
-        for arg in self._argument_builder.arguments:
-            args[arg.name] = None
+    async def _parse_params(self, params):
+        """
+        Takes the parameters inputted as strings and parses them into the correct types and
+        assigns them to the correct argument, option and tag identifiers
 
-        param_ptr = 0
-        arg_ptr = 0
+        Each parameter string is classified once and bound as soon as it is classified.
+        Synchronous parsers are called directly and only asynchronous parsers are awaited.
+        I/O bound parsers are awaited concurrently after the other parameters are bound.
+        Arguments and options which are not given are None and tags which are not given are False.
 
-        while param_ptr < len(params):
-            param = params[param_ptr]
-
-            if param.startswith('-OPTION:'):
-                param_ptr += 2
-                continue
-            
-            if param.startswith('-TAG:'):
-                param_ptr += 1
-                continue
-            
-            if arg_ptr == self._argument_builder.argument_count:
-                raise exceptions.Unexpected_Argument_Error('\'{}\' only expected {} arguments'.format(self._command_string, self._argument_builder.argument_count))
-
-            argument = self._argument_builder.arguments[arg_ptr]
-            try:
-                args[argument.name] = await argument.parse(param)
-            except exceptions.Discord_CLI_Error as e:
-                raise type(e)('{} {}'.format(argument.name, str(e)))
-            
-            arg_ptr += 1
-            param_ptr += 1
-        
-        if arg_ptr != self._argument_builder.argument_count:
-            raise exceptions.Expected_Arguments_Error('\'{}\' expected {} arguments, got {}'.format(self._command_string, self._argument_builder.argument_count, arg_ptr))
+        If the command has been compiled and has not changed since, the compiled binder is used instead.
 
-        return args
-    
-    async def _parse_opts(self, params):
-        """
-        Finds all of the options in a command string
-
-        params  : list  - The symbolized list of parameters
-        Returns : dict  - A dictionary which relates an option's name with it's value
+        params  : iterable  - The strings which represent the inputted parameters
+        Returns : dict      - A dictionary which relates the name of a parameter to it's value
 
-        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        opts = {}
+        if self._binder is not None and self._binder_revision == self._revision:
+            return await self._binder(params)
 
+        result = {}
+        for arg in self._argument_builder.arguments:
+            result[arg.name] = None
         for opt in self._option_builder.options:
-            opts[opt.name] = None
-
-        param_ptr = 0
+            result[opt.name] = None
+        for tag in self._tag_builder.tags:
+            result[tag.name] = False
 
-        while param_ptr < len(params):
-            param = params[param_ptr]
+        # Parameters whose parsers are I/O bound are parsed together once every parameter has been classified
+        deferred = []
 
-            if not param.startswith('-OPTION:'):
-                param_ptr += 1
-                continue
-            
-            option = self._option_builder.name_table[param.replace('-OPTION:', '')]
+        try:
+            for parameter in self._classify_params(params):
+                target = parameter.target
+                if parameter.kind == Parameter.TAG:
+                    result[target.name] = True
+                    continue
+                parser = target.parser
+                if parser.io_bound:
+                    deferred.append(parameter)
+                    continue
+                try:
+                    if parser.asynchronous:
+                        result[target.name] = await parser.parse(parameter.value)
+                    else:
+                        result[target.name] = parser.parse_sync(parameter.value)
+                except exceptions.Discord_CLI_Error as e:
+                    raise type(e)('{} {}'.format(target.name, str(e)))
+        except exceptions.Discord_CLI_Error as e:
+            # An I/O bound parameter which came before the error may have failed first
+            await self._parse_deferred(deferred, result)
+            raise e
 
-            param_ptr += 1
-            if param_ptr == len(params):
-                raise exceptions.Invalid_Option_Error('Option \'{}\' requires a value'.format(option.name))
-            
-            try:
-                opts[option.name] = await option.parse(params[param_ptr])
-            except exceptions.Discord_CLI_Error as e:
-                raise type(e)('{} {}'.format(option.name, str(e)))
+        await self._parse_deferred(deferred, result)
+        return result
 
-            param_ptr += 1
-        
-        return opts
-    
-    async def _parse_tags(self, params):
+    async def _parse_deferred(self, deferred, result):
         """
-        Finds all of the tags in a command string
+        Parses parameters with I/O bound parsers concurrently, limited by the parser concurrency of this command.
+        If any of them fail, the error of the one which came first in the command string is raised.
 
-        params  : list  - The symbolized list of parameters
-        Returns : dict  - A dictionary which relates an tag's name with it's value
+        deferred    : list  - The discord_cli.command.Parameter instances to be parsed, in the order they were given
+        result      : dict  - The dictionary which the parsed values are added to
 
-        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        tags = {}
-
-        for tag in self._tag_builder.tags:
-            tags[tag.name] = False
-        
-        param_ptr = 0
-
-        while param_ptr < len(params):
-            param = params[param_ptr]
-
-            if not param.startswith('-TAG:'):
-                param_ptr += 1
-                continue
-            
-            tag_name = param.replace('-TAG:', '')
-            tags[tag_name] = True
+        if not deferred:
+            return
 
-            param_ptr += 1
-        
-        return tags
-
-    async def _parse_params(self, params):
-        """
-        Takes the parameters inputted as strings and parses them into the correct types and
-        assigns them to the correct argument, option and tag identifiers
+        semaphore = self._parser_semaphore
+        if semaphore is None and self._parser_concurrency is not None:
+            semaphore = self._parser_semaphore = asyncio.Semaphore(self._parser_concurrency)
 
-        params  : list  - A list of strings which represent the inputted parameters
-        Returns : dict  - A dictionary which relates the name of a parameter to it's value
+        async def parse(parameter):
+            if semaphore is None:
+                return await parameter.target.parser.parse(parameter.value)
+            async with semaphore:
+                return await parameter.target.parser.parse(parameter.value)
 
-        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
-        """
+        values = await asyncio.gather(*[parse(parameter) for parameter in deferred], return_exceptions = True)
 
-        symbolized_params = await self._symbolize_params(params)
-        args = await self._parse_args(symbolized_params)
-        opts = await self._parse_opts(symbolized_params)
-        tags = await self._parse_tags(symbolized_params)
-        return {**args, **opts, **tags}
+        for parameter, value in zip(deferred, values):
+            if isinstance(value, exceptions.Discord_CLI_Error):
+                raise type(value)('{} {}'.format(parameter.target.name, str(value)))
+            if isinstance(value, BaseException):
+                raise value
+            result[parameter.target.name] = value
 
     async def execute(self, client, message, params, *argv, **kwargs):
         """
@@ -393,7 +475,7 @@ class Command(object):
 
         client  : discord.Client    - The discord bot client
         message : discord.Message   - The message which contained the command string
-        params  : list              - A list of strings containing the parameter input strings
+        params  : iterable          - The parameter input strings
         argv                        - The arguments to be passed to the command function
         kwargs                      - The keyword arguments to be passed to the command function
         Returns : object            - The returned value from the command's function
@@ -401,11 +483,71 @@ class Command(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        if not callable(self._function):
-            raise exceptions.Command_Not_Executable_Error('No function is associated with \'{}\''.format(self._command_string))
+        self._check_executable()
         params = await self._parse_params(params)
         return await self._function(client, message, params, *argv, **kwargs)
 
+    def set_parser_concurrency(self, limit):
+        """
+        Sets how many I/O bound parsers of this command can be awaited at the same time.
+        The limit is shared between every execution of the command.
+
+        limit : int | None - The maximum amount of I/O bound parsers awaited at once (If None, there is no limit)
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if limit is not None:
+            if not isinstance(limit, int) or isinstance(limit, bool):
+                raise exceptions.Type_Error('limit expected int instance, {} found'.format(limit.__class__.__name__))
+            if limit < 1:
+                raise exceptions.Value_Error('limit must be greater than 0')
+
+        self._parser_concurrency = limit
+        self._parser_semaphore = None
+
+    @property
+    def io_bound(self):
+        """
+        Returns : bool - Whether any of the parsers of this command's arguments or options are I/O bound
+        """
+
+        return any(x.parser.io_bound for x in self._argument_builder.arguments) or any(x.parser.io_bound for x in self._option_builder.options)
+
+    def compile(self):
+        """
+        Generates a parameter binder specialised for this command, see discord_cli.compiler.
+        The binder is used until the command is changed, after which the
+        parameters are bound generically until the command is compiled again.
+
+        Commands with I/O bound parsers are not compiled, their parameters are always bound generically.
+        """
+
+        if self.io_bound:
+            self._binder = None
+            return
+        self._binder = compiler.compile_binder(self)
+        self._binder_revision = self._revision
+
+    def _check_executable(self):
+        """
+        Raises discord_cli.exceptions.Command_Not_Executable_Error if there is no function associated with this command
+        """
+
+        if not callable(self._function):
+            raise exceptions.Command_Not_Executable_Error('No function is associated with \'{}\''.format(self._command_string))
+
+    def _touch(self):
+        """
+        Marks this command and all of it's ancestors as changed so that anything
+        derived from the command tree, such as cached parse results, is rebuilt
+        """
+
+        command = self
+        while command is not None:
+            command._revision += 1
+            command = None if command._parent is None else command._parent()
+
     def command(self, name, description = None, function = None):
         """
         Adds a sub command to this command
@@ -426,8 +568,11 @@ class Command(object):
             raise exceptions.Command_Already_Exists_Error('\'{}\' already exists'.format(self._command_string + ' ' + name))
         command_string = name if self._command_string is None else self._command_string + ' ' + name
 
+        if self._sub_commands is _EMPTY_TABLE:
+            self._sub_commands = {}
         self._sub_commands[name] = Command(name, description, command_string = command_string, parent = self, function = function)
         self._sub_command_count += 1
+        self._touch()
         return self._sub_commands[name]
 
     def tree_string(self, details = False, prefix = '', include_name = True):
@@ -440,47 +585,130 @@ class Command(object):
         Returns         : str   - A string representing the command tree
         """
 
-        result = ''
+        return ''.join([line + '\n' for line in self.iter_tree_lines(details, prefix, include_name)])
+
+    def write_tree(self, stream, details = False, prefix = '', include_name = True):
+        """
+        Writes the command tree with this command as the root node to a text stream, one line at a time
+
+        stream          : io.TextIOBase - The stream to write to, such as a file or an io.StringIO
+        details         : bool          - Whether to show arguments, options, tags and permissions for commands
+        prefix          : str           - A string to add to the beginning of each line
+        include_name    : bool          - Whether to include the root node command name at the top of the tree
+        """
+
+        for line in self.iter_tree_lines(details, prefix, include_name):
+            stream.write(line + '\n')
+
+    def iter_tree_lines(self, details = False, prefix = '', include_name = True):
+        """
+        Gets the lines of the string representing the command tree with this command as the root node.
+        The lines are produced as they are needed, so the whole string is never held in memory.
+
+        details         : bool      - Whether to show arguments, options, tags and permissions for commands
+        prefix          : str       - A string to add to the beginning of each line
+        include_name    : bool      - Whether to include the root node command name at the top of the tree
+        Returns         : generator - Yields each line of the tree, without a line break
+        """
+
         if include_name:
-            result += prefix + '+ ' + self._name + '\n'
+            yield prefix + '+ ' + self._name
+
+        # Pre order traversal with an explicit stack, so deep trees do not hit the recursion limit.
+        # Each entry is a command, the prefix of it's lines and the prefix of the line which connects it to it's parent.
+        stack = [(self, prefix, None)]
+        while stack:
+            command, prefix, connector_prefix = stack.pop()
+            if connector_prefix is not None:
+                yield connector_prefix + '| '
+                yield connector_prefix + '+-+ ' + command._name
+
+            if details:
+                yield from command._tree_details(prefix + '| ' if command._sub_command_count != 0 else prefix + '  ')
+
+            children = []
+            for i, sub_command in enumerate(command._sub_commands.values()):
+                children.append((sub_command, prefix + '| ' if i < command._sub_command_count - 1 else prefix + '  ', prefix))
+            stack.extend(reversed(children))
+
+    def _tree_details(self, prefix):
+        """
+        Gets the lines showing the arguments, options, tags and permissions of this command in the command tree
+
+        prefix  : str       - A string to add to the beginning of each line
+        Returns : generator - Yields each line, without a line break
+        """
+
+        if self._argument_builder.argument_count != 0:
+            yield prefix + 'Arguments:'
+            for arg in self._argument_builder.arguments:
+                yield prefix + '  ' + str(arg)
         
-        command_prefix = prefix + '| ' if self._sub_command_count != 0 else prefix + '  '
+        if self._option_builder.option_count != 0:
+            yield prefix + 'Options:'
+            for opt in self._option_builder.options:
+                yield prefix + '  ' + str(opt)
         
-        if details:
-            if self._argument_builder.argument_count != 0:
-                result += command_prefix + 'Arguments:\n'
-                for arg in self._argument_builder.arguments:
-                    result += command_prefix + '  ' + str(arg) + '\n'
-            
-            if self._option_builder.option_count != 0:
-                result += command_prefix + 'Options:\n'
-                for opt in self._option_builder.options:
-                    result += command_prefix + '  ' + str(opt) + '\n'
-            
-            if self._tag_builder.tag_count != 0:
-                result += command_prefix + 'Tags:\n'
-                for tag in self._tag_builder.tags:
-                    result += command_prefix + '  ' + str(tag) + '\n'
-            
-            if self._permission_builder.permission_count != 0:
-                result += command_prefix + 'Permissions:\n'
-                for perm in self._permission_builder.permissions:
-                    result += command_prefix + '  ' + str(perm) + '\n'
-
-        for i, (command_name, command_obj) in enumerate(self._sub_commands.items()):
-            result += '{0}| \n{0}+-+ {1}\n'.format(prefix, command_name)
-            new_prefix = prefix + '| ' if i < self._sub_command_count - 1 else prefix + '  '
-            result += command_obj.tree_string(details = details, prefix = new_prefix, include_name = False)
+        if self._tag_builder.tag_count != 0:
+            yield prefix + 'Tags:'
+            for tag in self._tag_builder.tags:
+                yield prefix + '  ' + str(tag)
         
-        return result
+        if self._permission_builder.permission_count != 0:
+            yield prefix + 'Permissions:'
+            for perm in self._permission_builder.permissions:
+                yield prefix + '  ' + str(perm)
     
-    async def usage_message(self, client, message):
+    async def usage_message(self, client, message, context = None):
         """
         Gets a string which represents a usage message for this command
 
-        client  : discord.Client    - The discord bot client 
-        message : discord.Message   - A message from a user in a channel to specify permissions 
-        Returns : str               - The usage message string
+        client  : discord.Client                                - The discord bot client 
+        message : discord.Message                               - A message from a user in a channel to specify permissions 
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation (if None, a new context is used)
+        Returns : str                                           - The usage message string
+        """
+
+        if context is None:
+            context = permissions.Permission_Context(client, message)
+
+        sub_commands = []
+        for sub_command in self._sub_commands.values():
+            if await sub_command._permission_builder.evaluate(client, message, context):
+                sub_commands.append(sub_command)
+        return self._usage_message(sub_commands)
+
+    def _usage_message(self, sub_commands):
+        """
+        Gets a string which represents a usage message for this command
+
+        The usage line and the argument, option and tag sections only change with the command, so they
+        are rendered once per revision. Whole messages are kept for the last USAGE_CACHE_SIZE sets of
+        visible sub commands, as users with the same permissions see the same message.
+
+        sub_commands    : list  - The sub commands to be listed, which are the ones the user can see
+        Returns         : str   - The usage message string
+        """
+
+        if self._usage_revision != self._revision:
+            self._usage_static = self._static_usage_message()
+            self._usage_messages = LRU_Cache(self.USAGE_CACHE_SIZE)
+            self._usage_revision = self._revision
+
+        key = tuple(sub_commands)
+        message = self._usage_messages.get(key)
+        if message is None:
+            message = self._usage_static
+            if len(key) != 0:
+                message += '\nSubcommands:\n' + '\n'.join(['  ' + x.name for x in key])
+            self._usage_messages.put(key, message)
+        return message
+
+    def _static_usage_message(self):
+        """
+        Gets the part of the usage message which does not depend on the user
+
+        Returns : str - The usage line, description and the argument, option and tag sections
         """
 
         lines = []
@@ -513,13 +741,4 @@ class Command(object):
             for tag in self._tag_builder.tags:
                 lines.append('  ' + str(tag))
         
-        if self._sub_command_count != 0:
-            first = True
-            for _, sub_command in self._sub_commands.items():
-                if await sub_command._permission_builder.evaluate(client, message):
-                    if first:
-                        lines.append('Subcommands:')
-                        first = False
-                    lines.append('  {}'.format(sub_command.name))        
-        
-        return '\n'.join(lines)
\ No newline at end of file
+        return '\n'.join(lines)
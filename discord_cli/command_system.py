@@ -1,7 +1,12 @@
-import discord
+import gc
 
 from discord_cli.command import Command
 import discord_cli.exceptions as exceptions
+import discord_cli.permissions as permissions
+import discord_cli.tokenizer as tokenizer
+from discord_cli.visibility import Visibility_Engine
+from discord_cli.pagination import Paginator, MESSAGE_LIMIT
+from discord_cli.cache import LRU_Cache, Permission_Decision_Cache
 from inspect import iscoroutinefunction
 
 class Command_System(object):
@@ -10,16 +15,31 @@ class Command_System(object):
     The command system is a class which is used to generate and execute a set of commands
     """
     
-    def __init__(self, name = 'Command_System', description = None):
+    def __init__(self, name = 'Command_System', description = None, parse_cache_size = None):
         """
-        name            : str           - The name of the command system
-        description     : str | None    - A description of the command system
+        If parse_cache_size is given, the commands and parsed parameters of recently executed
+        command strings are kept so that identical command strings are not parsed again.
+        Only use the parse cache if the parsers of the commands always give the same
+        result for the same input. Commands with I/O bound parsers are never cached.
+
+        name                : str           - The name of the command system
+        description         : str | None    - A description of the command system
+        parse_cache_size    : int | None    - The maximum amount of command strings held in the parse cache
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
         self._root = Command(name, description)
         self._execution_error_callback = default_execution_error_callback
+
+        self._parse_cache = None if parse_cache_size is None else LRU_Cache(parse_cache_size)
+        self._parse_cache_revision = self._root.revision
+
+        self._permission_cache = None
+        self._permission_cache_revision = self._root.revision
+        self._concurrent_permissions = False
+
+        self._visibility = Visibility_Engine(self._root)
     
     def set_execution_error_callback(self, callback):
         """
@@ -47,6 +67,67 @@ class Command_System(object):
 
         return self._root.command(name, description, function)
     
+    @property
+    def parse_cache(self):
+        """
+        Returns : discord_cli.cache.LRU_Cache | None - The parse cache, if enabled
+        """
+
+        return self._parse_cache
+
+    def set_permission_cache(self, max_size, ttl = 60):
+        """
+        Enables the permission decision cache, which remembers whether a user met the permissions of
+        each command in a guild and channel for ttl seconds. See discord_cli.cache.Permission_Decision_Cache
+        for which events the bot should invalidate the cache on.
+
+        max_size    : int           - The maximum amount of decisions held by the cache
+        ttl         : int | float   - The amount of seconds a decision is kept for
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        self._permission_cache = Permission_Decision_Cache(max_size, ttl)
+        self._permission_cache_revision = self._root.revision
+
+    @property
+    def permission_cache(self):
+        """
+        Returns : discord_cli.cache.Permission_Decision_Cache | None - The permission decision cache, if enabled
+        """
+
+        return self._permission_cache
+
+    def set_concurrent_permissions(self, concurrent):
+        """
+        Sets whether the custom permissions of a command are evaluated concurrently. When enabled,
+        custom permissions which do not declare side effects are started together, and the ones
+        still running once the result is decided are cancelled, so checking them takes as long as
+        the slowest check rather than all of the checks one after another.
+
+        concurrent : bool - Whether custom permissions are evaluated concurrently
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if not isinstance(concurrent, bool):
+            raise exceptions.Type_Error('concurrent expected bool instance, {} found'.format(concurrent.__class__.__name__))
+        self._concurrent_permissions = concurrent
+
+    def _permission_context(self, client, message):
+        """
+        Creates the permission context for an invocation, clearing the permission cache if commands have changed
+
+        client  : discord.Client                                - The discord bot client
+        message : discord.Message                               - The message which caused the invocation
+        Returns : discord_cli.permissions.Permission_Context    - The context
+        """
+
+        if self._permission_cache is not None and self._permission_cache_revision != self._root.revision:
+            self._permission_cache.clear()
+            self._permission_cache_revision = self._root.revision
+        return permissions.Permission_Context(client, message, self._permission_cache, self._concurrent_permissions)
+
     @property
     def commands(self):
         """
@@ -63,6 +144,35 @@ class Command_System(object):
 
         return self._root._sub_command_count
     
+    def compile(self):
+        """
+        Generates a specialised parameter binder for every executable command in the command system
+
+        Commands which are changed afterwards go back to binding their parameters
+        generically until the command system is compiled again.
+        """
+
+        commands = [self._root]
+        while commands:
+            command = commands.pop()
+            if command.function is not None:
+                command.compile()
+            commands.extend(command.sub_commands.values())
+
+    def finalize(self):
+        """
+        Compiles the command system and moves it out of the garbage collector's reach
+
+        Call once the command tree has been built. Every object tracked by the garbage collector
+        at this point, the command tree included, is moved into the permanent generation with
+        gc.freeze, so later collections no longer scan it. The command tree can still be changed
+        afterwards, but objects created by those changes are collected as usual.
+        """
+
+        self.compile()
+        gc.collect()
+        gc.freeze()
+
     def tree_string(self, details = False):
         """
         Gets a string which shows the names of the commands in the whole command
@@ -77,59 +187,39 @@ class Command_System(object):
 
         return self._root.tree_string(details = details)
 
-    async def _split_command_string(self, command_string):
+    def write_tree(self, stream, details = False):
         """
-        Splits a command string into a list which contains individual
-        command identifiers and parameters
+        Writes the command tree of the whole command system to a text stream, one line at a time
 
-        command_string  : str   - The command string to be split
-        Returns         : list  - A list containing the individual command identifiers and parameters
+        stream  : io.TextIOBase - The stream to write to, such as a file or an io.StringIO
+        details : bool          - Whether to include details about each command
         """
 
-        result = []
-        char_ptr = -1
+        self._root.write_tree(stream, details = details)
 
-        current_string = ''
-
-        within_quotes = False
-        
-        escape_next_char = False
-        escape_char = False
+    def iter_tree_lines(self, details = False):
+        """
+        Gets the lines of the string which represents the command tree, as they are needed
 
-        while True:
-            char_ptr += 1
-            if char_ptr == len(command_string):
-                if current_string != '':
-                    result.append(current_string)
-                break
+        details : bool      - Whether to include details about each command
+        Returns : generator - Yields each line of the tree, without a line break
+        """
 
-            escape_char = escape_next_char
-            escape_next_char = False
+        return self._root.iter_tree_lines(details = details)
 
-            char = command_string[char_ptr]
+    def tree_pages(self, details = False, max_size = MESSAGE_LIMIT):
+        """
+        Splits the command tree into pages which break on line boundaries. The tree is
+        rendered lazily, only as far as the last page which has been asked for.
 
-            if char == ' ' and within_quotes == False and escape_char == False:
-                if current_string == '':
-                    continue    
-                result.append(current_string)
-                current_string = ''
-                continue
-            
-            if char == '\\' and escape_char == False:
-                escape_next_char = True
-                continue
+        details     : bool                                  - Whether to include details about each command
+        max_size    : int                                   - The maximum length of a page
+        Returns     : discord_cli.pagination.Paginator      - The pages of the command tree
 
-            if char == '"' and escape_char == False:
-                if within_quotes == False and current_string != '':
-                    raise exceptions.Value_Error('A quote used to start escaping text must follow a space')
-                if within_quotes == True and char_ptr + 1 < len(command_string) and command_string[char_ptr + 1] != ' ':
-                    raise exceptions.Value_Error('A quote used to end escaping text must be followed by a space')
-                within_quotes = not within_quotes
-                continue
-            
-            current_string += char
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
 
-        return result
+        return Paginator(self.iter_tree_lines(details = details), max_size)
 
     async def execute(self, client, message, command_string, *argv, **kwargs):
         """
@@ -146,15 +236,65 @@ class Command_System(object):
         """
 
         try:
-            command_elements = await self._split_command_string(command_string)
-            cmd_params = await self._root.get_command(client, message, *command_elements)
-            cmd, params = cmd_params
+            if self._parse_cache is not None:
+                return await self._execute_cached(client, message, command_string, *argv, **kwargs)
+            command_elements = tokenizer.iter_command_string(command_string)
+            context = self._permission_context(client, message)
+            cmd, params = await self._root.resolve_command(client, message, command_elements, context)
             if cmd is self._root:
                 raise exceptions.Command_Not_Found_Error('Command not found')
             return await cmd.execute(client, message, params, *argv, **kwargs)
         except exceptions.Discord_CLI_Error as e:
             return await self._execution_error_callback(e)
 
+    async def _execute_cached(self, client, message, command_string, *argv, **kwargs):
+        """
+        Executes a command string using the parse cache. If the command string has been
+        parsed before, the command and parameters are taken from the cache instead. The
+        permissions of the command and it's ancestors are checked either way.
+
+        client          : discord.Client    - The discord bot client executing the command
+        message         : discord.Message   - The message from the user containing the command being executed
+        command_string  : str               - The command string to be parsed and executed
+        argv                                - Arguments to be passed onto the command executable
+        kwargs                              - Keyword arguments to be passed onto the command's function
+        Returns         : object            - The return value of the command's function
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if self._parse_cache_revision != self._root.revision:
+            self._parse_cache.clear()
+            self._parse_cache_revision = self._root.revision
+
+        context = self._permission_context(client, message)
+
+        entry = self._parse_cache.get(command_string)
+        if entry is not None:
+            path, params = entry
+            for cmd in path:
+                if not await cmd._permission_builder.evaluate(client, message, context):
+                    raise exceptions.Insufficient_Permissions_Error('Insufficient permissions')
+            return await path[-1].function(client, message, dict(params), *argv, **kwargs)
+
+        command_elements = tokenizer.iter_command_string(command_string)
+        cmd, params = await self._root.resolve_command(client, message, command_elements, context)
+        if cmd is self._root:
+            raise exceptions.Command_Not_Found_Error('Command not found')
+        cmd._check_executable()
+        params = await cmd._parse_params(params)
+
+        path = []
+        ancestor = cmd
+        while ancestor is not self._root:
+            path.append(ancestor)
+            ancestor = ancestor.parent
+        path.reverse()
+
+        if not cmd.io_bound:
+            self._parse_cache.put(command_string, (path, dict(params)))
+        return await cmd.function(client, message, params, *argv, **kwargs)
+
     async def usage_message(self, client, message, command_string):
         """
         Gets the usage / help message for a command. The client and message are
@@ -168,16 +308,98 @@ class Command_System(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        command_elements = await self._split_command_string(command_string)
-        cmd_params = await self._root.get_command(client, message, *command_elements)
-        cmd, params = cmd_params
+        command_elements = tokenizer.iter_command_string(command_string)
+        context = self._permission_context(client, message)
+        cmd, _ = await self._root.resolve_command(client, message, command_elements, context)
         if cmd is self._root:
             raise exceptions.Command_Not_Found_Error('Command not found')
-        return await cmd.usage_message(client, message)
+        if context.decision_cache is None:
+            # Without a decision cache the bitset of the whole tree would be computed for every call,
+            # so only the permissions of the command's sub commands are evaluated
+            return await cmd.usage_message(client, message, context)
+        visible = await self._visibility.visible(context)
+        return cmd._usage_message(self._visibility.visible_sub_commands(cmd, visible))
+
+    async def usage_pages(self, client, message, command_string, max_size = MESSAGE_LIMIT):
+        """
+        Splits the usage / help message for a command into pages which break on line boundaries
+
+        client          : discord.Client                    - The discord bot client executing the command
+        message         : discord.Message                   - The message from the user containing the command being executed
+        command_string  : str                               - The command string which represents the command
+        max_size        : int                               - The maximum length of a page
+        Returns         : discord_cli.pagination.Paginator  - The pages of the usage message
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        return Paginator(await self.usage_message(client, message, command_string), max_size)
+
+    async def visible_commands(self, client, message):
+        """
+        Gets every command a user can see, which are the commands whose permissions the user
+        meets and whose ancestors the user can see
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - A message from the user
+        Returns : list              - The discord_cli.command.Command instances, in the order they were added
+        """
+
+        context = self._permission_context(client, message)
+        visible = await self._visibility.visible(context)
+        return self._visibility.visible_commands(visible)
+
+    async def complete(self, client, message, partial_command_string):
+        """
+        Gets the commands a user can see which complete a partial command string. The last element
+        of the string is completed unless the string ends with a space, in which case every visible
+        sub command of the command the string represents completes it.
+
+        client                  : discord.Client    - The discord bot client
+        message                 : discord.Message   - A message from the user
+        partial_command_string  : str               - The start of a command string
+        Returns                 : list              - The discord_cli.command.Command instances which complete the string
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        elements = tokenizer.split_command_string(partial_command_string)
+        prefix = ''
+        if len(elements) != 0 and not partial_command_string.endswith(' '):
+            prefix = elements.pop()
+
+        context = self._permission_context(client, message)
+        if context.decision_cache is None:
+            # As in usage_message, only the commands along the string and the sub commands of the last are evaluated
+            command = self._root
+            for element in elements:
+                command = command.sub_commands.get(element)
+                if command is None or not await command._permission_builder.evaluate(client, message, context):
+                    return []
+            return [x for x in command.sub_commands.values() if x.name.startswith(prefix) and await x._permission_builder.evaluate(client, message, context)]
+
+        visible = await self._visibility.visible(context)
+
+        command = self._root
+        for element in elements:
+            command = command.sub_commands.get(element)
+            if command is None or not visible >> self._visibility.bit(command) & 1:
+                return []
+        return [x for x in self._visibility.visible_sub_commands(command, visible) if x.name.startswith(prefix)]
 
 async def default_execution_error_callback(exception):
     """
     Returns a red discord embed with the error message in it
+
+    exception : discord_cli.exceptions.Discord_CLI_Error - The error raised while parsing the command
+
+    Raises the exception again if discord is not installed, as there is no embed to put it in
     """
 
+    # Imported here so that discord_cli can be imported, and commands built and parsed, without discord
+    try:
+        import discord
+    except ImportError:
+        raise exception from None
+
     return discord.Embed(title = 'Error parsing command', description = ':x:' + str(exception), color = 0xf04747)
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+The compiler generates a parameter binder specialised for a single command, in the same
+way that dataclasses generate __init__ methods. The argument positions, option and tag
+identifiers and default values of the command are written into the source of the binder
+so that binding a command string does not have to look anything up in the builders.
+Synchronous parsers are called directly and only asynchronous parsers are awaited.
+
+A compiled binder behaves exactly like discord_cli.command.Command._parse_params.
+"""
+
+import discord_cli.exceptions as exceptions
+
+def compile_binder(command):
+    """
+    Generates a coroutine function which binds the parameters of a command
+
+    command : discord_cli.command.Command   - The command to generate a binder for
+    Returns : function                      - A coroutine function which takes an iterable of parameter strings and returns the parameter dictionary
+    """
+
+    arguments = command._argument_builder.arguments
+    options = command._option_builder.options
+    tags = command._tag_builder.tags
+
+    # Objects referenced by the generated source, passed in as arguments of the factory
+    namespace = {
+        '_exceptions': exceptions,
+        '_command_string': command.command_string,
+    }
+    for i, argument in enumerate(arguments):
+        namespace['_argument_{}'.format(i)] = _parse_function(argument.parser)
+    for i, option in enumerate(options):
+        namespace['_option_{}'.format(i)] = _parse_function(option.parser)
+
+    option_index = {option.name: i for i, option in enumerate(options)}
+
+    lines = []
+    emit = lambda indent, line: lines.append('    ' * indent + line)
+
+    defaults = ['{!r}: None'.format(x.name) for x in arguments]
+    defaults += ['{!r}: None'.format(x.name) for x in options]
+    defaults += ['{!r}: False'.format(x.name) for x in tags]
+
+    emit(0, 'async def bind(params):')
+    emit(1, 'result = {' + ', '.join(defaults) + '}')
+    emit(1, 'arg_ptr = 0')
+    emit(1, 'params = iter(params)')
+    emit(1, 'for param in params:')
+
+    # Word identifiers
+    emit(2, 'if param.startswith(\'--\'):')
+    emit(3, 'word = param.replace(\'-\', \'\')')
+    keyword = 'if'
+    for option in options:
+        if option.word is not None:
+            emit(3, '{} word == {!r}:'.format(keyword, option.word))
+            _emit_option(emit, 4, option, option_index[option.name])
+            keyword = 'elif'
+    for tag in tags:
+        if tag.word is not None:
+            emit(3, '{} word == {!r}:'.format(keyword, tag.word))
+            emit(4, 'result[{!r}] = True'.format(tag.name))
+            keyword = 'elif'
+    _emit_otherwise(emit, 3, keyword, 'raise _exceptions.Unexpected_Word_Error(\'\\\'{}\\\' has no option or tag associated with --{}\'.format(_command_string, word))')
+
+    # Letter identifiers
+    emit(2, 'elif param.startswith(\'-\') and len(param) > 1 and not param[1:].isdigit():')
+    emit(3, 'letters = param.replace(\'-\', \'\')')
+    keyword = 'if'
+    for option in options:
+        emit(3, '{} letters == {!r}:'.format(keyword, option.letter))
+        _emit_option(emit, 4, option, option_index[option.name])
+        keyword = 'elif'
+    indent = 3
+    if keyword == 'elif':
+        emit(3, 'else:')
+        indent = 4
+    emit(indent, 'for letter in letters:')
+    keyword = 'if'
+    for tag in tags:
+        emit(indent + 1, '{} letter == {!r}:'.format(keyword, tag.letter))
+        emit(indent + 2, 'result[{!r}] = True'.format(tag.name))
+        keyword = 'elif'
+    _emit_otherwise(emit, indent + 1, keyword, 'raise _exceptions.Unexpected_Letter_Error(\'\\\'{}\\\' has no option or tag associated with -{}\'.format(_command_string, letter))')
+
+    # Arguments
+    emit(2, 'else:')
+    keyword = 'if'
+    for i, argument in enumerate(arguments):
+        emit(3, '{} arg_ptr == {}:'.format(keyword, i))
+        _emit_parse(emit, 4, argument.name, '_argument_{}'.format(i), 'param', argument.parser.asynchronous)
+        keyword = 'elif'
+    _emit_otherwise(emit, 3, keyword, 'raise _exceptions.Unexpected_Argument_Error(\'\\\'{{}}\\\' only expected {} arguments\'.format(_command_string))'.format(len(arguments)))
+    emit(3, 'arg_ptr += 1')
+
+    emit(1, 'if arg_ptr != {}:'.format(len(arguments)))
+    emit(2, 'raise _exceptions.Expected_Arguments_Error(\'\\\'{{}}\\\' expected {} arguments, got {{}}\'.format(_command_string, arg_ptr))'.format(len(arguments)))
+    emit(1, 'return result')
+
+    source = 'def _create_binder({}):\n{}\n    return bind\n'.format(
+        ', '.join(namespace),
+        '\n'.join('    ' + line for line in lines))
+
+    scope = {}
+    exec(compile(source, '<discord_cli binder for {!r}>'.format(command.command_string), 'exec'), scope)
+    # Taken out of the scope, which is it's globals, so that the binder is not part of a reference cycle
+    binder = scope.pop('_create_binder')(**namespace)
+    binder.__source__ = source
+    return binder
+
+def _parse_function(parser):
+    """
+    Returns : function - The method of a parser which the generated source calls to parse a value
+    """
+
+    return parser.parse if parser.asynchronous else parser.parse_sync
+
+def _emit_otherwise(emit, indent, keyword, line):
+    """
+    Emits a line as the else branch of a chain of if statements, or on it's own if the chain is empty
+    """
+
+    if keyword == 'elif':
+        emit(indent, 'else:')
+        indent += 1
+    emit(indent, line)
+
+def _emit_option(emit, indent, option, index):
+    """
+    Emits the source which takes and parses the value of an option
+    """
+
+    emit(indent, 'value = next(params, None)')
+    emit(indent, 'if value is None:')
+    emit(indent + 1, 'raise _exceptions.Invalid_Option_Error({!r})'.format('Option \'{}\' requires a value'.format(option.name)))
+    _emit_parse(emit, indent, option.name, '_option_{}'.format(index), 'value', option.parser.asynchronous)
+
+def _emit_parse(emit, indent, name, parse, value, asynchronous):
+    """
+    Emits the source which parses a value and stores it in the result under name
+    """
+
+    emit(indent, 'try:')
+    emit(indent + 1, 'result[{!r}] = {}{}({})'.format(name, 'await ' if asynchronous else '', parse, value))
+    emit(indent, 'except _exceptions.Discord_CLI_Error as e:')
+    emit(indent + 1, 'raise type(e)({!r} + str(e))'.format(name + ' '))
@@ -0,0 +1,208 @@
+"""
+A small date and time parsing engine used by discord_cli.parsers.Date_Parser and
+discord_cli.parsers.Time_Parser.
+
+Formats use the same directives as datetime.strptime, but are compiled once when a parser
+is built. Formats made up of fixed width numeric fields, such as '%d/%m/%Y' and '%H:%M:%S',
+are parsed by slicing the input. Other formats are parsed with a single precompiled
+regular expression. Neither path goes through the locale machinery of strptime.
+"""
+
+import re
+
+import discord_cli.exceptions as exceptions
+
+# directive : (regular expression, fixed width or None)
+_DIRECTIVES = {
+    'd': (r'\d\d', 2),
+    'm': (r'\d\d', 2),
+    'Y': (r'\d\d\d\d', 4),
+    'y': (r'\d\d', 2),
+    'H': (r'\d\d', 2),
+    'I': (r'\d\d', 2),
+    'M': (r'\d\d', 2),
+    'S': (r'\d\d', 2),
+    'f': (r'\d{1,6}', None),
+    'p': (r'[AaPp][Mm]', None),
+}
+
+DATE_DIRECTIVES = frozenset('dmYy')
+TIME_DIRECTIVES = frozenset('HIMSfp')
+
+_DIGITS = frozenset('0123456789')
+
+class Datetime_Format(object):
+
+    """
+    A datetime format which has been compiled into a parser for strings of that format.
+    """
+
+    def __init__(self, format, directives):
+        """
+        format      : str       - The format, using datetime.strptime directives
+        directives  : frozenset - The directives which are allowed in the format
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the format is not valid
+        """
+
+        if not isinstance(format, str):
+            raise exceptions.Type_Error('format expected str instance, {} found'.format(format.__class__.__name__))
+
+        # Alternating literal strings and directive letters, starting and ending with a literal
+        pieces = ['']
+        i = 0
+        while i < len(format):
+            char = format[i]
+            if char != '%':
+                pieces[-1] += char
+                i += 1
+                continue
+            if i + 1 == len(format):
+                raise exceptions.Value_Error('format cannot end with \'%\'')
+            directive = format[i + 1]
+            i += 2
+            if directive == '%':
+                pieces[-1] += '%'
+                continue
+            if directive not in directives:
+                raise exceptions.Value_Error('format directive \'%{}\' is not supported'.format(directive))
+            if directive in pieces[1::2]:
+                raise exceptions.Value_Error('format directive \'%{}\' is used more than once'.format(directive))
+            pieces.append(directive)
+            pieces.append('')
+
+        if len(pieces) == 1:
+            raise exceptions.Value_Error('format must contain at least one directive')
+
+        self._format = format
+
+        # Fixed width formats are parsed by slicing
+        self._length = None
+        if all(_DIRECTIVES[x][1] is not None for x in pieces[1::2]):
+            self._literals = []
+            self._fields = []
+            position = 0
+            for j, piece in enumerate(pieces):
+                if j % 2 == 0:
+                    if piece:
+                        self._literals.append((position, position + len(piece), piece))
+                    position += len(piece)
+                else:
+                    width = _DIRECTIVES[piece][1]
+                    self._fields.append((piece, position, position + width))
+                    position += width
+            self._length = position
+
+        pattern = ''.join(re.escape(piece) if j % 2 == 0 else '(?P<{}>{})'.format(piece, _DIRECTIVES[piece][0]) for j, piece in enumerate(pieces))
+        self._pattern = re.compile(pattern, re.ASCII)
+
+    @property
+    def format(self):
+        """
+        Returns : str - The format this was compiled from
+        """
+
+        return self._format
+
+    def match(self, string):
+        """
+        Splits a string of this format into it's fields
+
+        string  : str           - The string to be parsed
+        Returns : dict | None   - The string value of each directive, or None if the string is not of this format
+        """
+
+        if self._length is not None:
+            if len(string) != self._length:
+                return None
+            for start, end, literal in self._literals:
+                if string[start:end] != literal:
+                    return None
+            fields = {}
+            for directive, start, end in self._fields:
+                value = string[start:end]
+                if not _DIGITS.issuperset(value):
+                    return None
+                fields[directive] = value
+            return fields
+
+        match = self._pattern.fullmatch(string)
+        if match is None:
+            return None
+        return match.groupdict()
+
+def compile_formats(formats, directives):
+    """
+    Compiles a list of formats
+
+    formats     : list      - The formats, using datetime.strptime directives
+    directives  : frozenset - The directives which are allowed in the formats
+    Returns     : tuple     - The discord_cli.datetime_formats.Datetime_Format instances
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if the formats are not valid
+    """
+
+    if not isinstance(formats, (list, tuple)):
+        raise exceptions.Type_Error('formats expected list instance, {} found'.format(formats.__class__.__name__))
+    if len(formats) == 0:
+        raise exceptions.Value_Error('formats must not have length 0')
+    return tuple(Datetime_Format(format, directives) for format in formats)
+
+def match_formats(formats, string):
+    """
+    Splits a string into fields using the first format that it matches
+
+    formats : tuple         - The compiled formats to try in order
+    string  : str           - The string to be parsed
+    Returns : dict | None   - The string value of each directive, or None if no format matches
+    """
+
+    for format in formats:
+        fields = format.match(string)
+        if fields is not None:
+            return fields
+    return None
+
+def date_fields(fields):
+    """
+    Converts the fields of a date string into the arguments of datetime.date
+
+    fields  : dict  - The string value of each directive
+    Returns : tuple - The year, month and day
+    """
+
+    if 'Y' in fields:
+        year = int(fields['Y'])
+    elif 'y' in fields:
+        # Matches datetime.strptime: 69 - 99 are 1969 - 1999 and 00 - 68 are 2000 - 2068
+        year = int(fields['y'])
+        year += 1900 if year >= 69 else 2000
+    else:
+        year = 1900
+    return year, int(fields.get('m', 1)), int(fields.get('d', 1))
+
+def time_fields(fields):
+    """
+    Converts the fields of a time string into the arguments of datetime.time
+
+    fields  : dict  - The string value of each directive
+    Returns : tuple - The hour, minute, second and microsecond
+    """
+
+    if 'I' in fields:
+        hour = int(fields['I'])
+        if hour < 1 or hour > 12:
+            # Let datetime.time reject the hour
+            hour = 24
+        else:
+            hour %= 12
+            if fields.get('p', 'am').lower() == 'pm':
+                hour += 12
+    else:
+        hour = int(fields.get('H', 0))
+
+    microsecond = 0
+    if 'f' in fields:
+        microsecond = int(fields['f'].ljust(6, '0'))
+
+    return hour, int(fields.get('M', 0)), int(fields.get('S', 0)), microsecond
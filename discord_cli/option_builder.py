@@ -1,7 +1,12 @@
+from types import MappingProxyType
+
 import discord_cli.parsers as parsers
 import discord_cli.exceptions as exceptions
 import discord_cli.validation as validation
 
+# The tables of the empty option builder, which cannot be added to
+_EMPTY_TABLE = MappingProxyType({})
+
 class Option(object):
 
     """
@@ -14,6 +19,8 @@ class Option(object):
     The letter and word are identifiers used to specify the option
     within the command string.
     """
+
+    __slots__ = ('_name', '_description', '_letter', '_word', '_parser')
     
     def __init__(self, name, description, letter, word, parser):
         """
@@ -89,6 +96,14 @@ class Option(object):
         """
         return self._word
     
+    @property
+    def parser(self):
+        """
+        Returns : discord_cli.parsers.Base_Parser - The parser used to parse this option
+        """
+
+        return self._parser
+
     async def parse(self, input_string):
         """
         Parses an input string into the datatype specified by the parser
@@ -122,19 +137,30 @@ class Option_Builder(object):
 
     This class is referenced by the discord_cli.command.Command class
     after construction for parsing command strings ready to be executed.
+
+    Commands without options share EMPTY_OPTION_BUILDER, whose
+    tables are immutable, until their first option is added.
     """
 
+    __slots__ = ('_command', '_options', '_name_table', '_letter_table', '_word_table', '_option_count')
+
     def __init__(self, command):
         """
-        command : discord_cli.command.Command - The command the option builder belongs to
+        command : discord_cli.command.Command | None - The command the option builder belongs to (If None, the builder is empty and cannot be added to)
         """
 
         self._command = command
         
-        self._options = []
-        self._name_table = {}
-        self._letter_table = {}
-        self._word_table = {}
+        if command is None:
+            self._options = ()
+            self._name_table = _EMPTY_TABLE
+            self._letter_table = _EMPTY_TABLE
+            self._word_table = _EMPTY_TABLE
+        else:
+            self._options = []
+            self._name_table = {}
+            self._letter_table = {}
+            self._word_table = {}
         self._option_count = 0
     
     def _add_option(self, option):
@@ -167,6 +193,7 @@ class Option_Builder(object):
             self._word_table[option.word] = option
 
         self._option_count += 1
+        self._command._touch()
     
     def integer(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False):
         """
@@ -184,7 +211,7 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Integer_Parser(min, max, include_min, include_max)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Integer_Parser, min, max, include_min, include_max)))
     
     def word(self, name, description = None, letter = None, word = None, min_length = None, max_length = None, include_min_length = True, include_max_length = False):
         """
@@ -203,7 +230,7 @@ class Option_Builder(object):
         """
 
 
-        self._add_option(Option(name, description, letter, word, parsers.Word_Parser(min_length, max_length, include_min_length, include_max_length)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Word_Parser, min_length, max_length, include_min_length, include_max_length)))
     
     def float(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False):
         """
@@ -221,7 +248,7 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Float_Parser(min, max, include_min, include_max)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Float_Parser, min, max, include_min, include_max)))
 
     def string(self, name, description = None, letter = None, word = None, min_length = None, max_length = None, include_min_length = True, include_max_length = False):
         """
@@ -239,7 +266,7 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.String_Parser(min_length, max_length, include_min_length, include_max_length)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.String_Parser, min_length, max_length, include_min_length, include_max_length)))
 
     def user_mention(self, name, description = None, letter = None, word = None):
         """
@@ -252,7 +279,7 @@ class Option_Builder(object):
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
-        self._add_option(Option(name, description, letter, word, parsers.User_Mention_Parser()))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.User_Mention_Parser)))
 
     def channel_mention(self, name, description = None, letter = None, word = None):
         """
@@ -266,7 +293,7 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Channel_Mention_Parser()))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Channel_Mention_Parser)))
 
     def role_mention(self, name, description = None, letter = None, word = None):
         """
@@ -280,9 +307,9 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Role_Mention_Parser()))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Role_Mention_Parser)))
     
-    def date(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False):
+    def date(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False, formats = None):
         """
         Adds an date option into the array of options
 
@@ -290,17 +317,18 @@ class Option_Builder(object):
         description : str | None    - A description of the date option
         letter      : str | None    - The letter identifier for the option (If None, set to the first letter of the name) 
         word        : str | None    - The word identifier of the option
-        min         : str | None    - The lower bound of valid input in form '%d/%m/%Y'
-        max         : str | None    - The upper bound of valid input in form '%d/%m/%Y'
+        min         : str | None    - The lower bound of valid input in one of the formats
+        max         : str | None    - The upper bound of valid input in one of the formats
         include_min : bool          - Whether to include the minimum value as valid
         include_max : bool          - Whether to include the maximum value as valid
+        formats     : list | None   - The accepted formats using the directives %d, %m, %Y and %y (If None, ['%d/%m/%Y'])
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Date_Parser(min, max, include_min, include_max)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Date_Parser, min, max, include_min, include_max, formats)))
     
-    def time(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False):
+    def time(self, name, description = None, letter = None, word = None, min = None, max = None, include_min = True, include_max = False, formats = None):
         """
         Adds an time option into the array of options
 
@@ -308,15 +336,16 @@ class Option_Builder(object):
         description : str | None    - A description of the time option
         letter      : str | None    - The letter identifier for the option (If None, set to the first letter of the name) 
         word        : str | None    - The word identifier of the option
-        min         : str | None    - The lower bound of valid input in form '%H:%M:%S'
-        max         : str | None    - The upper bound of valid input in form '%H:%M:%S'
+        min         : str | None    - The lower bound of valid input in one of the formats
+        max         : str | None    - The upper bound of valid input in one of the formats
         include_min : bool          - Whether to include the minimum value as valid
         include_max : bool          - Whether to include the maximum value as valid
+        formats     : list | None   - The accepted formats using the directives %H, %I, %M, %S, %f and %p (If None, ['%H:%M:%S'])
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Time_Parser(min, max, include_min, include_max)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Time_Parser, min, max, include_min, include_max, formats)))
 
     def enum(self, name, values, description = None, letter = None, word = None):
         """
@@ -331,7 +360,7 @@ class Option_Builder(object):
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
         """
 
-        self._add_option(Option(name, description, letter, word, parsers.Enum_Parser(values)))
+        self._add_option(Option(name, description, letter, word, parsers.get_parser(parsers.Enum_Parser, values)))
 
     @property
     def options(self):
@@ -371,4 +400,7 @@ class Option_Builder(object):
         Returns : int - The amound of options in the array
         """
 
-        return self._option_count
\ No newline at end of file
+        return self._option_count
+
+# Shared by every command which has no options
+EMPTY_OPTION_BUILDER = Option_Builder(None)
@@ -0,0 +1,138 @@
+"""
+Splits long output, such as command trees and usage messages, into pages which fit in a discord
+message or embed. Pages break on line boundaries, and lines which do not fit on a page by
+themselves are split across pages.
+
+Pages are produced lazily: lines are read from their source only until the requested page is
+complete. Each page is joined into a string once it is complete, after which only the string is
+kept, so the lines of a long output are never held all at once.
+"""
+
+import discord_cli.exceptions as exceptions
+
+# The maximum length of the content of a discord message
+MESSAGE_LIMIT = 2000
+# The maximum length of the description of a discord embed
+EMBED_LIMIT = 4096
+
+class Paginator(object):
+
+    """
+    Splits lines of text into pages of at most max_size characters, including the line breaks between lines.
+    """
+
+    def __init__(self, lines, max_size = MESSAGE_LIMIT):
+        """
+        lines       : str | iterable    - The text, or the lines of the text without line breaks
+        max_size    : int               - The maximum length of a page
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if inputs are not valid
+        """
+
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise exceptions.Type_Error('max_size expected int instance, {} found'.format(max_size.__class__.__name__))
+        if max_size < 1:
+            raise exceptions.Value_Error('max_size must be greater than 0')
+
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+
+        self._max_size = max_size
+        self._source = iter(lines)
+        self._exhausted = False
+
+        # The pages completed so far
+        self._pages = []
+        # The lines of the page being filled, None if no page has been started
+        self._current = None
+        # The length of the page being filled
+        self._size = 0
+
+    @property
+    def max_size(self):
+        """
+        Returns : int - The maximum length of a page
+        """
+
+        return self._max_size
+
+    @property
+    def page_count(self):
+        """
+        Reads every line, joining each page as it is completed
+
+        Returns : int - The amount of pages
+        """
+
+        self._read_pages(None)
+        return len(self._pages)
+
+    def page(self, index):
+        """
+        Gets a page, reading lines only until it is complete
+
+        index   : int   - The index of the page, starting from 0
+        Returns : str   - The page
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if there is no page with the index
+        """
+
+        if not isinstance(index, int) or isinstance(index, bool):
+            raise exceptions.Type_Error('index expected int instance, {} found'.format(index.__class__.__name__))
+        if index < 0:
+            raise exceptions.Value_Error('index must not be negative')
+
+        self._read_pages(index + 1)
+        if index >= len(self._pages):
+            raise exceptions.Value_Error('there are only {} pages'.format(len(self._pages)))
+        return self._pages[index]
+
+    def __iter__(self):
+        """
+        Returns : generator - Yields each page in order, reading lines as they are needed
+        """
+
+        index = 0
+        while True:
+            self._read_pages(index + 1)
+            if index >= len(self._pages):
+                return
+            yield self._pages[index]
+            index += 1
+
+    def _read_pages(self, page_count):
+        """
+        Reads lines until page_count pages have been completed or there are no lines left
+
+        page_count : int | None - The amount of pages to complete (If None, every line is read)
+        """
+
+        pages = self._pages
+        if self._exhausted or (page_count is not None and len(pages) >= page_count):
+            return
+
+        max_size = self._max_size
+        current = self._current
+        size = self._size
+        for line in self._source:
+            # A line which does not fit on a page by itself is split across pages
+            parts = (line,) if len(line) <= max_size else [line[x:x + max_size] for x in range(0, len(line), max_size)]
+            for part in parts:
+                if current is not None and size + 1 + len(part) <= max_size:
+                    current.append(part)
+                    size += 1 + len(part)
+                    continue
+                # A page is complete once the page after it has been started
+                if current is not None:
+                    pages.append('\n'.join(current))
+                current = [part]
+                size = len(part)
+            if page_count is not None and len(pages) >= page_count:
+                self._current = current
+                self._size = size
+                return
+
+        if current is not None:
+            pages.append('\n'.join(current))
+        self._current = None
+        self._exhausted = True
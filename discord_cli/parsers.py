@@ -1,7 +1,14 @@
 import discord_cli.validation as validation
 import discord_cli.exceptions as exceptions
+import discord_cli.datetime_formats as datetime_formats
 
-from datetime import datetime
+from datetime import date, time
+from weakref import WeakValueDictionary
+
+# (parser type, configuration) : the shared parser with that configuration
+_parsers = WeakValueDictionary()
+# (parser type, arguments) : the shared parser built from those arguments
+_arguments = WeakValueDictionary()
 
 class Base_Parser(object):
     
@@ -12,17 +19,111 @@ class Base_Parser(object):
 
     The base parser cannot be instanciated on it's own. It is an abstract class and parse
     if a pure virtual function.
+
+    Parsers which do not need to await anything set asynchronous to False and implement
+    parse_sync, which is called directly when binding parameters. Parsers which need to
+    await something, such as a database lookup, implement the coroutine parse instead.
+    A derived class which overrides parse is treated as asynchronous unless it says otherwise,
+    and can await the parse of the class it derives from. The parse of a parser which implements
+    parse_sync calls it, so it can be awaited whether or not the parser sets asynchronous.
+
+    Asynchronous parsers which spend their time waiting on I/O can set io_bound to True.
+    The parameters of a command which use I/O bound parsers are parsed concurrently.
+
+    Parsers are equal, and hash the same, if they are of the same type and have the same
+    configuration, so the builders share a single parser between every parameter with the same
+    configuration, see discord_cli.parsers.get_parser. Shared parsers are immutable, other parsers,
+    such as those of derived classes, can change their attributes as usual. A derived class which
+    does not implement _key is only equal to itself.
     """
 
+    __slots__ = ('__weakref__', '_interned')
+
+    asynchronous = True
+    io_bound = False
+
+    def __init_subclass__(cls, **kwargs):
+        super(Base_Parser, cls).__init_subclass__(**kwargs)
+        if 'parse' in cls.__dict__ and 'asynchronous' not in cls.__dict__:
+            cls.asynchronous = True
+
     def __init__(self):
         if self.__class__ == Base_Parser:
             raise exceptions.Cannot_Create_Instance_Of_Base_Class_Error('Cannot create instance of Base_Parser')
+
+    def __setattr__(self, name, value):
+        """
+        Raises discord_cli.exceptions.Type_Error if the parser is shared, see discord_cli.parsers.intern_parser
+        """
+
+        if getattr(self, '_interned', False):
+            raise exceptions.Type_Error('Shared {} instances are immutable'.format(self.__class__.__name__))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        """
+        Raises discord_cli.exceptions.Type_Error if the parser is shared, see discord_cli.parsers.intern_parser
+        """
+
+        if getattr(self, '_interned', False):
+            raise exceptions.Type_Error('Shared {} instances are immutable'.format(self.__class__.__name__))
+        object.__delattr__(self, name)
+
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser, which identifies it among parsers of the same type
+        """
+
+        return (id(self),)
+
+    def __eq__(self, other):
+        """
+        Returns : bool - Whether other is a parser of the same type with the same configuration
+        """
+
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self):
+        """
+        Returns : int - The hash of the parser's type and configuration
+        """
+
+        return hash((type(self),) + self._key())
     
     async def parse(self, input_string):
+        """
+        Converts the input string into the datatype of the parser
+
+        input_string    : str       - The string to be parsed
+        Returns         : object    - The parsed value
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
+        """
+
+        # Dispatches on whether parse_sync is implemented rather than on asynchronous, which is set
+        # for any derived class overriding parse, so that it's parse can still await this one
+        if type(self).parse_sync is Base_Parser.parse_sync:
+            raise NotImplementedError
+        return self.parse_sync(input_string)
+
+    def parse_sync(self, input_string):
+        """
+        Converts the input string into the datatype of the parser without awaiting anything
+
+        input_string    : str       - The string to be parsed
+        Returns         : object    - The parsed value
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
+        """
+
         raise NotImplementedError
 
 class Integer_Parser(Base_Parser):
 
+    __slots__ = ('_min', '_max', '_include_min', '_include_max', '_in_bounds')
+
+    asynchronous = False
+
     def __init__(self, min, max, include_min, include_max):
         """
         min         : int | None    - The lower bound of valid input
@@ -63,8 +164,10 @@ class Integer_Parser(Base_Parser):
 
         self._include_min = include_min
         self._include_max = include_max
+
+        self._in_bounds = validation.compile_bounds_matcher(self._min, self._max, self._include_min, self._include_max)
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts the input string into an integer
 
@@ -74,11 +177,22 @@ class Integer_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_integer(input_string)
-        result = int(input_string)
-        await validation.async_validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
+        try:
+            result = int(input_string)
+        except ValueError:
+            validation.validate_integer(input_string)
+            raise
+        if not self._in_bounds(result):
+            validation.validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
         return result
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (self._min, self._max, self._include_min, self._include_max)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -88,6 +202,10 @@ class Integer_Parser(Base_Parser):
     
 class Word_Parser(Base_Parser):
 
+    __slots__ = ('_min_length', '_max_length', '_include_min_length', '_include_max_length', '_matcher')
+
+    asynchronous = False
+
     def __init__(self, min_length, max_length, include_min_length, include_max_length):
         """
         min_length          : int | None    - The lower bound of valid input length
@@ -128,8 +246,10 @@ class Word_Parser(Base_Parser):
 
         self._include_min_length = include_min_length
         self._include_max_length = include_max_length
+
+        self._matcher = validation.compile_word_matcher(self._min_length, self._max_length, self._include_min_length, self._include_max_length)
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts the input string into an word
 
@@ -139,13 +259,23 @@ class Word_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_word(input_string)
+        if isinstance(input_string, str) and self._matcher(input_string):
+            return input_string
+
+        validation.validate_word(input_string)
         try:
-            await validation.async_validate_bounds(len(input_string), self._min_length, self._max_length, self._include_min_length, self._include_max_length)
+            validation.validate_bounds(len(input_string), self._min_length, self._max_length, self._include_min_length, self._include_max_length)
         except exceptions.Discord_CLI_Error as e:
             raise type(e)('length {}'.format(str(e)))
         return input_string
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (self._min_length, self._max_length, self._include_min_length, self._include_max_length)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -156,6 +286,10 @@ class Word_Parser(Base_Parser):
 # Float
 class Float_Parser(Base_Parser):
 
+    __slots__ = ('_min', '_max', '_include_min', '_include_max', '_in_bounds')
+
+    asynchronous = False
+
     def __init__(self, min, max, include_min, include_max):
         """
         min         : int | None    - The lower bound of valid input
@@ -196,8 +330,10 @@ class Float_Parser(Base_Parser):
 
         self._include_min = include_min
         self._include_max = include_max
+
+        self._in_bounds = validation.compile_bounds_matcher(self._min, self._max, self._include_min, self._include_max)
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts the input string into an float
 
@@ -207,11 +343,22 @@ class Float_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_float(input_string)
-        result = float(input_string)
-        await validation.async_validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
+        try:
+            result = float(input_string)
+        except ValueError:
+            validation.validate_float(input_string)
+            raise
+        if not self._in_bounds(result):
+            validation.validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
         return result
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (self._min, self._max, self._include_min, self._include_max)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -222,6 +369,10 @@ class Float_Parser(Base_Parser):
 # String
 class String_Parser(Base_Parser):
 
+    __slots__ = ('_min_length', '_max_length', '_include_min_length', '_include_max_length', '_matcher')
+
+    asynchronous = False
+
     def __init__(self, min_length, max_length, include_min_length, include_max_length):
         """
         min_length          : int | None    - The lower bound of valid input length
@@ -262,8 +413,10 @@ class String_Parser(Base_Parser):
 
         self._include_min_length = include_min_length
         self._include_max_length = include_max_length
+
+        self._matcher = validation.compile_string_matcher(self._min_length, self._max_length, self._include_min_length, self._include_max_length)
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts the input string into an string
 
@@ -273,13 +426,23 @@ class String_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_string(input_string)
+        if isinstance(input_string, str) and self._matcher(input_string):
+            return input_string
+
+        validation.validate_string(input_string)
         try:
-            await validation.async_validate_bounds(len(input_string), self._min_length, self._max_length, self._include_min_length, self._include_max_length)
+            validation.validate_bounds(len(input_string), self._min_length, self._max_length, self._include_min_length, self._include_max_length)
         except exceptions.Discord_CLI_Error as e:
             raise type(e)('length {}'.format(str(e)))
         return input_string
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (self._min_length, self._max_length, self._include_min_length, self._include_max_length)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -292,10 +455,14 @@ class String_Parser(Base_Parser):
 # With nickname         <@!95584437231689728>
 class User_Mention_Parser(Base_Parser):
 
+    __slots__ = ()
+
+    asynchronous = False
+
     def __init__(self):
         super(User_Mention_Parser, self).__init__()
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts a user mention string into a user id
 
@@ -305,11 +472,18 @@ class User_Mention_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_user_mention(input_string)
-        for c in '<@!>':
-            input_string = input_string.replace(c, '')
-        return int(input_string)
+        match = validation.USER_MENTION_PATTERN.fullmatch(input_string) if isinstance(input_string, str) else None
+        if match is None:
+            validation.validate_user_mention(input_string)
+        return int(match.group(1))
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return ()
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -322,10 +496,14 @@ class User_Mention_Parser(Base_Parser):
 
 class Channel_Mention_Parser(Base_Parser):
 
+    __slots__ = ()
+
+    asynchronous = False
+
     def __init__(self):
         super(Channel_Mention_Parser, self).__init__()
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts a channel mention string into a channel id
 
@@ -335,11 +513,18 @@ class Channel_Mention_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_channel_mention(input_string)
-        for c in '<#>':
-            input_string = input_string.replace(c, '')
-        return int(input_string)
+        match = validation.CHANNEL_MENTION_PATTERN.fullmatch(input_string) if isinstance(input_string, str) else None
+        if match is None:
+            validation.validate_channel_mention(input_string)
+        return int(match.group(1))
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return ()
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -351,10 +536,14 @@ class Channel_Mention_Parser(Base_Parser):
 # <@&357235474869387276>
 class Role_Mention_Parser(Base_Parser):
 
+    __slots__ = ()
+
+    asynchronous = False
+
     def __init__(self):
         super(Role_Mention_Parser, self).__init__()
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts a role mention string into a role id
 
@@ -364,11 +553,18 @@ class Role_Mention_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error is input is invalid
         """
 
-        await validation.async_validate_role_mention(input_string)
-        for c in '<@&>':
-            input_string = input_string.replace(c, '')
-        return int(input_string)
+        match = validation.ROLE_MENTION_PATTERN.fullmatch(input_string) if isinstance(input_string, str) else None
+        if match is None:
+            validation.validate_role_mention(input_string)
+        return int(match.group(1))
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return ()
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -377,36 +573,44 @@ class Role_Mention_Parser(Base_Parser):
         return 'role_mention'
 
 # Date
-# In the format %d/%m/%Y for now, may become customizable in future
+# In the format %d/%m/%Y unless other formats are given
 class Date_Parser(Base_Parser):
+
+    __slots__ = ('_formats', '_min', '_max', '_include_min', '_include_max', '_in_bounds')
+
+    asynchronous = False
     
-    def __init__(self, min, max, include_min, include_max):
+    def __init__(self, min, max, include_min, include_max, formats = None):
         """
-        min         : str | None    - The lower bound of valid input in the form '%d/%m/%Y'
-        max         : str | None    - The upper bound of valid input in the form '%d/%m/%Y'
+        min         : str | None    - The lower bound of valid input in one of the formats
+        max         : str | None    - The upper bound of valid input in one of the formats
         include_min : bool          - Whether to include the minimum as valid
         include_max : bool          - Whether to include the maximum as valid
+        formats     : list | None   - The accepted formats using the directives %d, %m, %Y and %y (If None, ['%d/%m/%Y'])
 
         raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
         """
 
         super(Date_Parser, self).__init__()
+
+        try:
+            self._formats = datetime_formats.compile_formats(['%d/%m/%Y'] if formats is None else formats, datetime_formats.DATE_DIRECTIVES)
+        except exceptions.Discord_CLI_Error as e:
+            raise type(e)('Date {}'.format(str(e)))
         
         if min is not None:
             try:
-                validation.validate_date(min)
+                self._min = self._to_date(min)
             except exceptions.Discord_CLI_Error as e:
                 raise type(e)('min {}'.format(str(e)))
-            self._min = datetime.strptime(min, '%d/%m/%Y')
         else:
             self._min = None
         
         if max is not None:
             try:
-                validation.validate_date(max)
+                self._max = self._to_date(max)
             except exceptions.Discord_CLI_Error as e:
                 raise type(e)('max {}'.format(str(e)))
-            self._max = datetime.strptime(max, '%d/%m/%Y')
         else:
             self._max = None
 
@@ -420,22 +624,48 @@ class Date_Parser(Base_Parser):
 
         self._include_min = include_min
         self._include_max = include_max
+
+        self._in_bounds = validation.compile_bounds_matcher(self._min, self._max, self._include_min, self._include_max)
+
+    def _to_date(self, input_string):
+        """
+        input_string    : str           - A string that represents a date in one of the formats
+        Returns         : datetime.date - The date which the string represents
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
+        """
+
+        validation.validate_string(input_string)
+        fields = datetime_formats.match_formats(self._formats, input_string)
+        if fields is None:
+            raise exceptions.Value_Error('must represent a date')
+        try:
+            return date(*datetime_formats.date_fields(fields))
+        except ValueError:
+            raise exceptions.Value_Error('must represent a date')
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
-        Converts the input string into datetime.datetime instance
+        Converts the input string into a datetime.date instance
 
-        input_string    : str               - The string to be converted to a datetime instance in the form '%d/%m/%Y'
-        Returns         : datetime.datetime - A datetime object which the input string represents
+        input_string    : str           - The string to be converted to a date in one of the formats
+        Returns         : datetime.date - The date which the input string represents
 
         Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
         """
 
-        await validation.async_validate_date(input_string)
-        result = datetime.strptime(input_string, '%d/%m/%Y')
-        await validation.async_validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
+        result = self._to_date(input_string)
+        if not self._in_bounds(result):
+            validation.validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
         return result
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (tuple(x.format for x in self._formats), self._min, self._max, self._include_min, self._include_max)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -444,36 +674,44 @@ class Date_Parser(Base_Parser):
         return 'date'
 
 # Time
-# In the format %H:%M:%S for now, may become customizable in future
+# In the format %H:%M:%S unless other formats are given
 class Time_Parser(Base_Parser):
 
-    def __init__(self, min, max, include_min, include_max):
+    __slots__ = ('_formats', '_min', '_max', '_include_min', '_include_max', '_in_bounds')
+
+    asynchronous = False
+
+    def __init__(self, min, max, include_min, include_max, formats = None):
         """
-        min         : str | None    - The lower bound of valid input in the form '%H:%M:%S'
-        max         : str | None    - The upper bound of valid input in the form '%H:%M:%S'
+        min         : str | None    - The lower bound of valid input in one of the formats
+        max         : str | None    - The upper bound of valid input in one of the formats
         include_min : bool          - Whether to include the minimum as valid
         include_max : bool          - Whether to include the maximum as valid
+        formats     : list | None   - The accepted formats using the directives %H, %I, %M, %S, %f and %p (If None, ['%H:%M:%S'])
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
         """
 
         super(Time_Parser, self).__init__()
+
+        try:
+            self._formats = datetime_formats.compile_formats(['%H:%M:%S'] if formats is None else formats, datetime_formats.TIME_DIRECTIVES)
+        except exceptions.Discord_CLI_Error as e:
+            raise type(e)('Time {}'.format(str(e)))
         
         if min is not None:
             try:
-                validation.validate_time(min)
+                self._min = self._to_time(min)
             except exceptions.Discord_CLI_Error as e:
                 raise type(e)('min {}'.format(str(e)))
-            self._min = datetime.strptime(min, '%H:%M:%S')
         else:
             self._min = None
         
         if max is not None:
             try:
-                validation.validate_time(max)
+                self._max = self._to_time(max)
             except exceptions.Discord_CLI_Error as e:
                 raise type(e)('max {}'.format(str(e)))
-            self._max = datetime.strptime(max, '%H:%M:%S')
         else:
             self._max = None
 
@@ -487,22 +725,48 @@ class Time_Parser(Base_Parser):
 
         self._include_min = include_min
         self._include_max = include_max
+
+        self._in_bounds = validation.compile_bounds_matcher(self._min, self._max, self._include_min, self._include_max)
+
+    def _to_time(self, input_string):
+        """
+        input_string    : str           - A string that represents a time in one of the formats
+        Returns         : datetime.time - The time which the string represents
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
+        """
+
+        validation.validate_string(input_string)
+        fields = datetime_formats.match_formats(self._formats, input_string)
+        if fields is None:
+            raise exceptions.Value_Error('must represent a time')
+        try:
+            return time(*datetime_formats.time_fields(fields))
+        except ValueError:
+            raise exceptions.Value_Error('must represent a time')
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
-        Converts the input string into a datetime.datetime instance
+        Converts the input string into a datetime.time instance
 
-        input_string    : str               - A string that represents a time in the form '%H:%M:%S'
-        Returns         : datetime.datetime - A dateimte instance that is represented by the input string
+        input_string    : str           - A string that represents a time in one of the formats
+        Returns         : datetime.time - The time which the input string represents
 
         Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
         """
 
-        await validation.async_validate_time(input_string)
-        result = datetime.strptime(input_string, '%H:%M:%S')
-        await validation.async_validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
+        result = self._to_time(input_string)
+        if not self._in_bounds(result):
+            validation.validate_bounds(result, self._min, self._max, self._include_min, self._include_max)
         return result
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (tuple(x.format for x in self._formats), self._min, self._max, self._include_min, self._include_max)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
@@ -513,6 +777,10 @@ class Time_Parser(Base_Parser):
 # Enum
 class Enum_Parser(Base_Parser):
 
+    __slots__ = ('_values', '_matcher')
+
+    asynchronous = False
+
     def __init__(self, values):
         """
         values : list - A list of strings which are to be used as the identifiers for the enums
@@ -530,9 +798,10 @@ class Enum_Parser(Base_Parser):
                 validation.validate_word(string)
         except exceptions.Discord_CLI_Error as e:
             raise type(e)('Enum values elements ' + str(e))
-        self._values = values
+        self._values = tuple(values)
+        self._matcher = validation.compile_enum_matcher(self._values)
     
-    async def parse(self, input_string):
+    def parse_sync(self, input_string):
         """
         Converts an input string into an enum
 
@@ -542,14 +811,72 @@ class Enum_Parser(Base_Parser):
         Raises discord_cli.exceptions.Discord_CLI_Error if input is invalid
         """
 
-        await validation.async_validate_string(input_string)
+        if isinstance(input_string, str) and self._matcher(input_string):
+            return input_string
+
+        validation.validate_string(input_string)
         if input_string not in self._values:
-            raise exceptions.Value_Error('must be element in {}'.format(str(self._values)))
+            raise exceptions.Value_Error('must be element in {}'.format(str(list(self._values))))
         return input_string
     
+    def _key(self):
+        """
+        Returns : tuple - The configuration of the parser
+        """
+
+        return (self._values,)
+
     def __str__(self):
         """
         Returns : str - The datatype of the parser
         """
 
-        return 'enum'
\ No newline at end of file
+        return 'enum'
+
+def get_parser(parser_type, *args):
+    """
+    Gets the shared parser of a type with a configuration, building it the first time it is asked for.
+    A parser which has been built from the same arguments before is returned without validating them again.
+
+    parser_type : type                              - The type of the parser, such as discord_cli.parsers.Integer_Parser
+    args                                            - The arguments the parser is built with
+    Returns     : discord_cli.parsers.Base_Parser   - The parser
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if the arguments are not valid
+    """
+
+    key = _arguments_key(parser_type, args)
+    parser = None if key is None else _arguments.get(key)
+    if parser is None:
+        parser = intern_parser(parser_type(*args))
+        if key is not None:
+            _arguments[key] = parser
+    return parser
+
+def intern_parser(parser):
+    """
+    Makes a parser shared, after which it's attributes can no longer be changed
+
+    parser  : discord_cli.parsers.Base_Parser   - A parser
+    Returns : discord_cli.parsers.Base_Parser   - The shared parser equal to parser, which is parser if there was none
+    """
+
+    parser = _parsers.setdefault((type(parser),) + parser._key(), parser)
+    object.__setattr__(parser, '_interned', True)
+    return parser
+
+def _arguments_key(parser_type, args):
+    """
+    Returns : tuple | None - A key which identifies the arguments of a parser, or None if they cannot be used as a key
+    """
+
+    # The types are part of the key, so that arguments which are equal but would not pass validation, such as 1 for True, are not mistaken for each other
+    key = [parser_type]
+    for arg in args:
+        key.append((type(arg), tuple(arg) if isinstance(arg, list) else arg))
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
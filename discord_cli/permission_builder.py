@@ -1,4 +1,5 @@
 import discord_cli.permissions as permissions
+import discord_cli.permission_compiler as permission_compiler
 import discord_cli.exceptions as exceptions
 
 class Permission_Builder(object):
@@ -13,17 +14,31 @@ class Permission_Builder(object):
     Note: If you wish for a user to have to meet multiple criteria to
     be granted access to a command, use a
     discord_cli.permissions.And_Permission_Operator instance.
+
+    The permissions are compiled into a single permission the first time they
+    are evaluated, see discord_cli.permission_compiler. They are compiled again
+    every REPLAN_INTERVAL evaluations, so that the order they are evaluated in
+    follows the measured cost of custom permissions.
+
+    Commands without permissions share EMPTY_PERMISSION_BUILDER
+    until their first permission is added.
     """
 
+    __slots__ = ('_command', '_permissions', '_permission_count', '_compiled', '_evaluations')
+
+    REPLAN_INTERVAL = 1000
+
     def __init__(self, command):
         """
-        command : discord_cli.command.Command - The command the permission builder belongs to
+        command : discord_cli.command.Command | None - The command the permission builder belongs to (If None, the builder is empty and cannot be added to)
         """
 
         self._command = command
 
-        self._permissions = []
+        self._permissions = [] if command is not None else ()
         self._permission_count = 0
+        self._compiled = None
+        self._evaluations = 0
     
     def permission(self, permission):
         """
@@ -37,6 +52,8 @@ class Permission_Builder(object):
 
         self._permissions.append(permission)
         self._permission_count += 1
+        self._compiled = None
+        self._command._touch()
     
     @property
     def permissions(self):
@@ -46,6 +63,16 @@ class Permission_Builder(object):
 
         return self._permissions
     
+    @property
+    def compiled(self):
+        """
+        Returns : discord_cli.permissions.Base_Permission | None - The compiled permissions, or None if there are no permissions
+        """
+
+        if self._compiled is None and self._permission_count != 0:
+            self._compiled = permission_compiler.compile_permissions(self._permissions)
+        return self._compiled
+
     @property
     def permission_count(self):
         """
@@ -54,12 +81,13 @@ class Permission_Builder(object):
 
         return self._permission_count
     
-    async def evaluate(self, client, message):
+    async def evaluate(self, client, message, context = None):
         """
         Checks if a user meets the criteria specified by the permissions in the list
 
-        client  : discord.Client    - The discord bot client
-        message : discord.Message   - The message which envoked the command to be executed
+        client  : discord.Client                                - The discord bot client
+        message : discord.Message                               - The message which envoked the command to be executed
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation (if None, a new context is used)
 
         Raises discord_cli.exceptions.Discord_CLI_Error if inputs are invalid
         """
@@ -67,8 +95,24 @@ class Permission_Builder(object):
         if self._permission_count == 0:
             return True
 
-        for permission in self._permissions:
-            if await permission.evaluate(client, message):
-                return True
-                
-        return False
\ No newline at end of file
+        if context is None:
+            context = permissions.Permission_Context(client, message)
+
+        self._evaluations += 1
+        if self._evaluations >= self.REPLAN_INTERVAL:
+            self._evaluations = 0
+            self._compiled = None
+
+        cache = context.decision_cache
+        if cache is None:
+            return await context.evaluate(self.compiled)
+
+        key = (self,) + context.decision_key
+        decision = cache.get(key)
+        if decision is None:
+            decision = bool(await context.evaluate(self.compiled))
+            cache.put(key, decision)
+        return decision
+
+# Shared by every command which has no permissions
+EMPTY_PERMISSION_BUILDER = Permission_Builder(None)
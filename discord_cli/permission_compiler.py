@@ -0,0 +1,314 @@
+"""
+The permission compiler turns a tree of permissions built with the & and | operators into
+an equivalent tree which is cheaper to evaluate.
+
+Chains of the same operator are flattened into a single discord_cli.permissions.All_Permission
+or discord_cli.permissions.Any_Permission. Discord permissions within a group are merged into a
+single discord_cli.permissions.Discord_Permission_Mask, so that the permissions of the user in
+the channel are looked up once for the whole group rather than once per permission.
+
+User and guild permissions within a group are merged into a discord_cli.permissions.User_Set_Permission
+or discord_cli.permissions.Guild_Set_Permission, so an allowlist written as an or of hundreds of user
+permissions becomes a single set lookup. Role set permissions within an or are merged in the same way.
+
+Constants are folded: a permission which can never be met, such as an empty user set, or is always
+met, such as a mask which requires no discord permissions, becomes a discord_cli.permissions.Constant_Permission.
+A constant which decides a group, such as False within an and, removes the pure permissions around it,
+and a constant which does not is removed. The same pure permission appearing more than once in a
+group is only evaluated once.
+
+The permissions of each group are then planned: they are ordered by how likely they are to decide
+the result of the group for their cost, so that cheap permissions which are likely to fail an and,
+or be met in an or, are evaluated first. The written order is used as a tie breaker.
+
+A permission which needs a guild, such as a discord permission, is not moved ahead of a custom
+permission written before it, which may be checking that the message was sent in a guild.
+
+Only pure permissions are moved. Permissions which are not pure, such as a
+discord_cli.permissions.Custom_Permission which declares side effects, stay where they were written,
+and no permission is moved or merged across them, so they are called in the same order and under
+the same conditions as before.
+"""
+
+import discord_cli.permissions as permissions
+
+# The largest amount of terms a mask may have after merging an and of masks
+MAX_MASK_TERMS = 64
+# The smallest probability used when planning, so that certain permissions are not free
+MIN_PROBABILITY = 0.01
+
+def compile_permission(permission):
+    """
+    Compiles a permission tree
+
+    permission  : discord_cli.permissions.Base_Permission   - The root of the tree
+    Returns     : discord_cli.permissions.Base_Permission   - A permission which is met under exactly the same criteria
+    """
+
+    # Post order traversal with an explicit stack, so deep trees do not hit the recursion limit.
+    # Each chain of the same operator is combined once, rather than once per operator in it.
+    output = []
+    stack = [(permission, None)]
+    while stack:
+        node, operand_count = stack.pop()
+        if operand_count is not None:
+            operands = output[len(output) - operand_count:]
+            del output[len(output) - operand_count:]
+            group = permissions.All_Permission if isinstance(node, permissions.And_Permission_Operator) else permissions.Any_Permission
+            output.append(_combine(group, operands))
+        elif isinstance(node, permissions.Permission_Operator):
+            operands = _chain(node)
+            stack.append((node, len(operands)))
+            stack.extend((x, None) for x in reversed(operands))
+        elif isinstance(node, permissions.Discord_Permission) and node.flag is not None:
+            output.append(permissions.Discord_Permission_Mask((node.flag,)))
+        else:
+            output.append(_fold(node))
+    return output.pop()
+
+def _chain(operator):
+    """
+    Collects the operands of a chain of the same operator, such as a | b | c
+
+    operator    : discord_cli.permissions.Permission_Operator   - The operator at the root of the chain
+    Returns     : list                                          - The permissions joined by the chain, in the order they are evaluated
+    """
+
+    operands = []
+    stack = [operator]
+    while stack:
+        node = stack.pop()
+        if type(node) is type(operator):
+            stack.extend(reversed(node.permissions))
+        else:
+            operands.append(node)
+    return operands
+
+def compile_permissions(permission_list):
+    """
+    Compiles a list of permissions of which a user need only meet one
+
+    permission_list : list                                      - The discord_cli.permissions.Base_Permission instances
+    Returns         : discord_cli.permissions.Base_Permission   - A permission which is met under exactly the same criteria
+    """
+
+    return _combine(permissions.Any_Permission, [compile_permission(x) for x in permission_list])
+
+def _combine(group, children):
+    """
+    Flattens and merges the compiled children of a group
+
+    group       : type      - discord_cli.permissions.All_Permission or discord_cli.permissions.Any_Permission
+    children    : list      - The compiled permissions to be grouped, in the order they are evaluated
+    Returns     : discord_cli.permissions.Base_Permission - The group, or it's only permission
+    """
+
+    flat = []
+    for child in children:
+        if type(child) is group:
+            flat.extend(child.permissions)
+        else:
+            flat.append(child)
+
+    # The kinds of permission which can be merged : the index of the permission they are merged into
+    merge_index = {}
+    # The index of a permission : the permissions to be merged into it, merged together once they are all known
+    merges = {}
+    result = []
+    for child in flat:
+        kind = _merge_kind(group, child)
+        if kind is None:
+            result.append(child)
+            if not child.pure:
+                merge_index.clear()
+            continue
+        index = merge_index.get(kind)
+        if index is not None:
+            if kind is not permissions.Discord_Permission_Mask or group is permissions.Any_Permission:
+                merges.setdefault(index, [result[index]]).append(child)
+                continue
+            merged = _merge_masks(group, [result[index], child])
+            if merged is not None:
+                result[index] = merged
+                continue
+        merge_index[kind] = len(result)
+        result.append(child)
+
+    for index, merged in merges.items():
+        result[index] = _merge(group, _merge_kind(group, merged[0]), merged)
+
+    result = _fold_group(group, result)
+    if len(result) == 1:
+        return result[0]
+    return group(_plan(group, result))
+
+def _fold(permission):
+    """
+    Returns : discord_cli.permissions.Base_Permission - The constant a permission is equivalent to, or the permission
+    """
+
+    if isinstance(permission, permissions.Discord_Permission_Mask) and 0 in permission.terms:
+        return permissions.Constant_Permission(True)
+    if isinstance(permission, permissions.Id_Set_Permission) and len(permission.ids) == 0:
+        return permissions.Constant_Permission(False)
+    return permission
+
+def _fold_group(group, children):
+    """
+    Folds the constants of a group and removes pure permissions which appear more than once.
+    The permissions which are not pure are kept, so they are evaluated under the same conditions.
+
+    group       : type  - discord_cli.permissions.All_Permission or discord_cli.permissions.Any_Permission
+    children    : list  - The permissions of the group, in the order they are evaluated
+    Returns     : list  - The remaining permissions, with a single constant if the group is always decided
+    """
+
+    result = []
+    # The ids of the pure permissions since the last permission which is not pure
+    seen = set()
+    for child in children:
+        child = _fold(child)
+        if isinstance(child, permissions.Constant_Permission):
+            if child.value is not group.decisive:
+                continue
+            # The group is decided here, so the pure permissions before it do not matter and nothing after it is evaluated
+            while len(result) != 0 and result[-1].pure:
+                result.pop()
+            result.append(child)
+            return result
+        if child.pure:
+            if id(child) in seen:
+                continue
+            seen.add(id(child))
+        else:
+            seen.clear()
+        result.append(child)
+
+    if len(result) == 0:
+        # An empty and is met, and an empty or is not
+        result.append(permissions.Constant_Permission(not group.decisive))
+    return result
+
+def _plan(group, children):
+    """
+    Orders the children of a group so that the ones most likely to decide it for their cost are evaluated first.
+    Children which are not pure, and the order of children either side of them, are left in place.
+
+    group       : type  - discord_cli.permissions.All_Permission or discord_cli.permissions.Any_Permission
+    children    : list  - The permissions of the group, in the order they were written
+    Returns     : list  - The permissions of the group, in the order they are to be evaluated
+    """
+
+    if group is permissions.All_Permission:
+        rank = lambda x: x.cost / max(1.0 - x.probability, MIN_PROBABILITY)
+    else:
+        rank = lambda x: x.cost / max(x.probability, MIN_PROBABILITY)
+
+    result = []
+    segment = []
+    for child in children:
+        if child.pure:
+            segment.append(child)
+            continue
+        result.extend(_order(segment, rank))
+        result.append(child)
+        segment = []
+    result.extend(_order(segment, rank))
+    return result
+
+def _order(segment, rank):
+    """
+    Sorts pure permissions by rank, except that a permission which needs a guild is not moved
+    ahead of a permission written before it which can guard it
+
+    segment : list      - The pure permissions, in the order they were written
+    rank    : function  - Takes a permission and returns it's rank, the lowest of which is evaluated first
+    Returns : list      - The permissions, in the order they are to be evaluated
+    """
+
+    ordered = sorted(range(len(segment)), key = lambda x: rank(segment[x]))
+    if not any(x.needs_guild for x in segment) or not any(x.can_guard for x in segment):
+        return [segment[x] for x in ordered]
+
+    result = []
+    placed = set()
+    while ordered:
+        # The permission written first of those left can always be placed, as everything written before it has been
+        for position, index in enumerate(ordered):
+            if not segment[index].needs_guild or all(x in placed for x in range(index) if segment[x].can_guard):
+                break
+        del ordered[position]
+        placed.add(index)
+        result.append(segment[index])
+    return result
+
+def _merge_kind(group, permission):
+    """
+    Returns : type | None - The type of permission a permission can be merged into within a group, or None if it cannot be merged
+    """
+
+    if isinstance(permission, permissions.Discord_Permission_Mask):
+        return permissions.Discord_Permission_Mask
+    if isinstance(permission, (permissions.User_Permission, permissions.User_Set_Permission)):
+        return permissions.User_Set_Permission
+    if isinstance(permission, (permissions.Guild_Permission, permissions.Guild_Set_Permission)):
+        return permissions.Guild_Set_Permission
+    # A user can have roles from every set, so role sets are only merged within an or
+    if isinstance(permission, permissions.Role_Set_Permission) and group is permissions.Any_Permission:
+        return permissions.Role_Set_Permission
+    return None
+
+def _merge(group, kind, merged):
+    """
+    Merges permissions of the same kind under the operator of a group
+
+    Returns : discord_cli.permissions.Base_Permission - The merged permission
+    """
+
+    if kind is permissions.Discord_Permission_Mask:
+        return _merge_masks(group, merged)
+
+    # A message has one user and one guild, so an and of their ids is an intersection
+    ids = [_ids(x) for x in merged]
+    if group is permissions.Any_Permission:
+        return kind(frozenset().union(*ids))
+    return kind(ids[0].intersection(*ids[1:]))
+
+def _ids(permission):
+    """
+    Returns : frozenset - The ids which meet a user, guild or id set permission
+    """
+
+    if isinstance(permission, permissions.User_Permission):
+        return frozenset((permission.user_id,))
+    if isinstance(permission, permissions.Guild_Permission):
+        return frozenset((permission.guild_id,))
+    return permission.ids
+
+def _merge_masks(group, masks):
+    """
+    Merges masks under the operator of a group
+
+    Returns : discord_cli.permissions.Discord_Permission_Mask | None - The merged mask, or None if it would have too many terms
+    """
+
+    if group is permissions.Any_Permission:
+        terms = [x for mask in masks for x in mask.terms]
+    else:
+        terms = [0]
+        for mask in masks:
+            if len(terms) * len(mask.terms) > MAX_MASK_TERMS:
+                return None
+            terms = [x | y for x in terms for y in mask.terms]
+    return permissions.Discord_Permission_Mask(_absorb(terms))
+
+def _absorb(terms):
+    """
+    Removes duplicate terms and terms which are implied by another term
+
+    terms   : list  - The bitmasks of a mask
+    Returns : list  - The remaining bitmasks, in their original order
+    """
+
+    terms = list(dict.fromkeys(terms))
+    return [x for x in terms if not any(y & x == y for y in terms if y != x)]
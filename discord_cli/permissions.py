@@ -1,3 +1,5 @@
+import time
+import asyncio
 from inspect import iscoroutinefunction
 import discord_cli.exceptions as exceptions
 
@@ -7,8 +9,29 @@ class Base_Permission(object):
     The base permission class defines which methods a permission class must have.
     A class which derives this class represents a set of criteria a user must meet
     to be granted access to some feature; most likely to execute and/or view a command.
+
+    A pure permission has no side effects and depends only on the message, so it may be
+    evaluated in any order relative to other pure permissions when a tree is compiled.
+
+    cost is an estimate of how long the permission takes to evaluate, in microseconds, and
+    probability is an estimate of how likely it is to be met. When a tree is compiled, pure
+    permissions are ordered so that the ones most likely to decide the result for the least
+    cost are evaluated first.
+
+    A permission which needs a guild reads the guild or the member of the message, which raises
+    for a direct message. A permission which can guard, such as a custom permission checking that
+    the message was sent in a guild, may decide a group before the permissions after it are reached.
+    A permission which needs a guild is never moved ahead of one written before it which can guard it.
     """
 
+    __slots__ = ()
+
+    pure = False
+    cost = 10.0
+    probability = 0.5
+    needs_guild = False
+    can_guard = False
+
     def __init__(self):
         """
         The base class cannot be instanciated. It serves only functionality for derived classes.
@@ -52,12 +75,26 @@ class Base_Permission(object):
 
         raise NotImplementedError('Cannot run evaluate on base permission class')
 
+    async def evaluate_in(self, context):
+        """
+        Checks whether the user meets the criteria within a permission context. Derived classes
+        which can make use of the context, such as operators and discord permissions, overwrite
+        this. By default it calls evaluate.
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether the criteria is met
+        """
+
+        return await self.evaluate(context.client, context.message)
+
 class Permission_Operator(Base_Permission):
 
     """
     The permission operator represents some boolean operation applied to the results of two permissions.
     """
 
+    __slots__ = ('_perm1', '_perm2')
+
     def __init__(self, perm1, perm2):
         """
         The permission operator cannot be instanciated. It serves only functionality for derived classes.
@@ -82,7 +119,27 @@ class Permission_Operator(Base_Permission):
         self._perm1 = perm1
         self._perm2 = perm2
 
+    @property
+    def permissions(self):
+        """
+        Returns : tuple - The permissions on the left and right of the operator
+        """
+
+        return (self._perm1, self._perm2)
+
+    def _parenthesize(self, permission):
+        """
+        Returns : bool - Whether one of the operator's permissions is written in brackets
+        """
+
+        return isinstance(permission, (Permission_Operator, Permission_Group))
+
 class And_Permission_Operator(Permission_Operator):
+
+    __slots__ = ()
+
+    decisive = False
+    separator = ' and '
     
     def __init__(self, perm1, perm2):
         """
@@ -104,22 +161,31 @@ class And_Permission_Operator(Permission_Operator):
         Raises discord_cli.exceptions.Discord_CLI_Error if the inputs are invalid
         """
         
-        return await self._perm1.evaluate(client, message) and await self._perm2.evaluate(client, message)
+        return await _evaluate_tree(self, _operand_evaluator(client, message), _expand)
+
+    async def evaluate_in(self, context):
+        """
+        Checks whether the user meets the criteria for both permissions within a permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether both criteria are met
+        """
+
+        return await context.evaluate(self)
 
     def __str__(self):
         """
         Returns : str - A string which represents the criteria to be met
         """
 
-        left_str = str(self._perm1)
-        right_str = str(self._perm2)
-        if isinstance(self._perm1, Permission_Operator):
-            left_str = '(' + left_str + ')'
-        if isinstance(self._perm2, Permission_Operator):
-            right_str = '(' + right_str + ')'
-        return left_str + ' and ' + right_str
+        return _tree_string(self)
 
 class Or_Permission_Operator(Permission_Operator):
+
+    __slots__ = ()
+
+    decisive = True
+    separator = ' or '
     
     def __init__(self, perm1, perm2):
         """
@@ -141,26 +207,459 @@ class Or_Permission_Operator(Permission_Operator):
         Raises discord_cli.exceptions.Discord_CLI_Error if the inputs are invalid
         """
 
-        return await self._perm1.evaluate(client, message) or await self._perm2.evaluate(client, message)
+        return await _evaluate_tree(self, _operand_evaluator(client, message), _expand)
+
+    async def evaluate_in(self, context):
+        """
+        Checks whether the user meets the criteria for either permission within a permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether either criteria is met
+        """
+
+        return await context.evaluate(self)
 
     def __str__(self):
         """
         Returns : str - A string which represents the criteria to be met
         """
 
-        left_str = str(self._perm1)
-        right_str = str(self._perm2)
-        if isinstance(self._perm1, Permission_Operator):
-            left_str = '(' + left_str + ')'
-        if isinstance(self._perm2, Permission_Operator):
-            right_str = '(' + right_str + ')'
-        return left_str + ' or ' + right_str
+        return _tree_string(self)
+
+def _expand(permission):
+    """
+    Returns : tuple | None - The permissions of an operator or group, or None if the permission is neither
+    """
+
+    if isinstance(permission, (Permission_Operator, Permission_Group)):
+        return permission.permissions
+    return None
+
+def _operand_evaluator(client, message):
+    """
+    Returns : function - Takes a permission and returns the coroutine which evaluates it for a message
+    """
+
+    return lambda permission: permission.evaluate(client, message)
+
+async def _evaluate_tree(permission, evaluate_operand, expand, remember = None):
+    """
+    Evaluates a tree of operators and groups without recursion, so that the depth of
+    the tree is not limited by the recursion limit. The permissions of each operator
+    and group are evaluated in order until one of them decides the result.
+
+    permission          : discord_cli.permissions.Base_Permission   - The root of the tree
+    evaluate_operand    : function                                  - Takes a permission which is not expanded and returns a coroutine which evaluates it
+    expand              : function                                  - Takes a permission and returns it's permissions if it is to be walked, or None
+    remember            : function | None                           - Called with each operator and group walked, and it's result
+    Returns             : bool                                      - Whether the criteria is met
+    """
+
+    # Each frame holds an operator or group, it's permissions and the index of the next one to be evaluated
+    frames = []
+    result = None
+    node = permission
+    while True:
+        if node is not None:
+            permissions = expand(node)
+            if permissions is None:
+                result = await evaluate_operand(node)
+            else:
+                frames.append([node, permissions, 0])
+            node = None
+
+        if len(frames) == 0:
+            return result
+
+        frame = frames[-1]
+        composite, permissions, index = frame
+        if index == len(permissions) or index != 0 and bool(result) is composite.decisive:
+            frames.pop()
+            # An empty and is met, and an empty or is not
+            result = bool(result) if index != 0 else not composite.decisive
+            if remember is not None:
+                remember(composite, result)
+            continue
+
+        frame[2] = index + 1
+        node = permissions[index]
+
+def _tree_string(permission):
+    """
+    Writes a tree of operators and groups without recursion, joining the strings of it's
+    operands once rather than at every level of the tree.
+
+    permission  : discord_cli.permissions.Base_Permission   - The root of the tree
+    Returns     : str                                       - A string which represents the criteria to be met
+    """
+
+    pieces = []
+    # Holds strings to be written and permissions to be expanded, the next one last
+    stack = [permission]
+    while len(stack) != 0:
+        item = stack.pop()
+        if isinstance(item, str):
+            pieces.append(item)
+            continue
+        permissions = _expand(item)
+        if permissions is None:
+            pieces.append(str(item))
+            continue
+        items = []
+        for i, child in enumerate(permissions):
+            if i != 0:
+                items.append(item.separator)
+            if item._parenthesize(child):
+                items.extend(('(', child, ')'))
+            else:
+                items.append(child)
+        items.reverse()
+        stack.extend(items)
+    return ''.join(pieces)
+
+class Permission_Context(object):
+
+    """
+    The permission context holds what is known about the user of a single invocation, such as
+    an execution or a help message, while permissions are evaluated for it.
+
+    The user's permissions in the channel are looked up at most once, and the result of each
+    permission is remembered so that permissions shared between commands, such as the same
+    Custom_Permission instance added to many commands, are only evaluated once.
+
+    The context also carries the decision cache of the command system, if it has one, which
+    permission builders use to remember their decisions between invocations.
+
+    If concurrent is True, the custom permissions of a group which do not declare side effects
+    are evaluated together, and those still running once the group is decided are cancelled.
+    """
+
+    __slots__ = ('_client', '_message', '_decision_cache', '_concurrent', '_decision_key', '_channel_permissions', '_results')
+
+    def __init__(self, client, message, decision_cache = None, concurrent = False):
+        """
+        client          : discord.Client                                        - The discord bot client
+        message         : discord.Message                                       - The message which caused the invocation
+        decision_cache  : discord_cli.cache.Permission_Decision_Cache | None    - The decision cache to be used by permission builders
+        concurrent      : bool                                                  - Whether custom permissions are evaluated concurrently
+        """
+
+        self._client = client
+        self._message = message
+        self._decision_cache = decision_cache
+        self._concurrent = concurrent
+        self._decision_key = None
+        self._channel_permissions = None
+        # id(permission) : (permission, result), the permission is kept so it's id is not reused
+        self._results = {}
+
+    @property
+    def client(self):
+        """
+        Returns : discord.Client - The discord bot client
+        """
+
+        return self._client
+
+    @property
+    def message(self):
+        """
+        Returns : discord.Message - The message which caused the invocation
+        """
+
+        return self._message
+
+    @property
+    def decision_cache(self):
+        """
+        Returns : discord_cli.cache.Permission_Decision_Cache | None - The decision cache to be used by permission builders
+        """
+
+        return self._decision_cache
+
+    @property
+    def concurrent(self):
+        """
+        Returns : bool - Whether custom permissions are evaluated concurrently
+        """
+
+        return self._concurrent
+
+    @property
+    def decision_key(self):
+        """
+        Returns : tuple - The ids of the user, guild and channel of the message, which decisions are cached under
+        """
+
+        if self._decision_key is None:
+            guild = self._message.guild
+            self._decision_key = (self._message.author.id, None if guild is None else guild.id, self._message.channel.id)
+        return self._decision_key
+
+    @property
+    def channel_permissions(self):
+        """
+        Returns : discord.Permissions - The permissions of the author of the message in the channel it was sent in
+        """
+
+        if self._channel_permissions is None:
+            self._channel_permissions = self._message.author.permissions_in(self._message.channel)
+        return self._channel_permissions
+
+    async def evaluate(self, permission):
+        """
+        Evaluates a permission, or returns it's result if it has already been evaluated in this context
+
+        permission  : discord_cli.permissions.Base_Permission   - The permission to be evaluated
+        Returns     : bool                                      - Whether the criteria is met
+        """
+
+        entry = self._results.get(id(permission))
+        if entry is not None:
+            return entry[1]
+        if self._expand(permission) is None:
+            result = await permission.evaluate_in(self)
+        else:
+            result = await _evaluate_tree(permission, self.evaluate, self._expand, self._remember)
+        self._results[id(permission)] = (permission, result)
+        return result
+
+    def _expand(self, permission):
+        """
+        Returns : tuple | None - The permissions of an operator or group which is evaluated by walking the tree, or None
+        """
+
+        if id(permission) in self._results:
+            return None
+        # Groups are evaluated on their own when they may evaluate their custom permissions concurrently
+        if self._concurrent and isinstance(permission, Permission_Group):
+            return None
+        return _expand(permission)
+
+    def _remember(self, permission, result):
+        """
+        Remembers the result of an operator or group evaluated by walking the tree
+        """
+
+        self._results[id(permission)] = (permission, result)
+
+    async def evaluate_concurrently(self, permissions, decisive):
+        """
+        Evaluates permissions concurrently until one of them gives the decisive result.
+        The permissions which are still being evaluated at that point are cancelled.
+
+        permissions : list      - The discord_cli.permissions.Base_Permission instances to be evaluated
+        decisive    : bool      - The result which decides the outcome, False for an and and True for an or
+        Returns     : bool      - Whether any of the permissions gave the decisive result
+        """
+
+        pending = []
+        for permission in permissions:
+            entry = self._results.get(id(permission))
+            if entry is None:
+                pending.append(permission)
+            elif bool(entry[1]) is decisive:
+                return True
+
+        if len(pending) == 1:
+            return bool(await self.evaluate(pending[0])) is decisive
+
+        tasks = [asyncio.ensure_future(self.evaluate(x)) for x in pending]
+        try:
+            for task in asyncio.as_completed(tasks):
+                if bool(await task) is decisive:
+                    return True
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+
+class Permission_Group(Base_Permission):
+
+    """
+    The permission group represents some boolean operation applied to the results of any amount of permissions.
+    Permission groups are created when a permission tree is compiled, see discord_cli.permission_compiler.
+    """
+
+    __slots__ = ('_permissions', 'pure', 'cost', 'probability', 'needs_guild', 'can_guard')
+
+    def __init__(self, permissions):
+        """
+        The permission group cannot be instanciated. It serves only functionality for derived classes.
+
+        permissions : list - The discord_cli.permissions.Base_Permission instances, in the order they are evaluated
+
+        Raises discord_cli.exceptions.Cannot_Create_Instance_Of_Base_Class_Error if attempted to instanciate.
+        Raises discord_cli.exceptions.Type_Error if any permission is not instance of discord_cli.permission.Base_Permission
+        """
+
+        if self.__class__ == Permission_Group:
+            raise exceptions.Cannot_Create_Instance_Of_Base_Class_Error('Cannot create instance of Permission_Group')
+
+        super(Permission_Group, self).__init__()
+
+        for permission in permissions:
+            if not isinstance(permission, Base_Permission):
+                raise exceptions.Type_Error('Permission group permissions expected Base_Permission instances, {} found'.format(permission.__class__.__name__))
+
+        self._permissions = tuple(permissions)
+        self.pure = all(permission.pure for permission in self._permissions)
+        self.cost = sum(permission.cost for permission in self._permissions)
+        self.needs_guild = any(permission.needs_guild for permission in self._permissions)
+        self.can_guard = any(permission.can_guard for permission in self._permissions)
+
+    @property
+    def permissions(self):
+        """
+        Returns : tuple - The permissions in the group, in the order they are evaluated
+        """
+
+        return self._permissions
+
+    async def _evaluate_concurrently_in(self, context, decisive):
+        """
+        Evaluates the permissions of the group, with it's custom permissions which do not declare side effects
+        evaluated concurrently once the other permissions around them have been evaluated
+
+        context     : discord_cli.permissions.Permission_Context    - The context of the invocation
+        decisive    : bool                                          - The result which decides the group, False for all and True for any
+        Returns     : bool                                          - Whether the group was decided
+        """
+
+        custom = []
+        for permission in self._permissions:
+            if permission.pure and isinstance(permission, Custom_Permission):
+                custom.append(permission)
+                continue
+            # The custom permissions may be guarding a permission which needs a guild, so they are evaluated before it
+            if (not permission.pure or permission.needs_guild) and len(custom) != 0:
+                if await context.evaluate_concurrently(custom, decisive):
+                    return True
+                custom = []
+            if bool(await context.evaluate(permission)) is decisive:
+                return True
+        return len(custom) != 0 and await context.evaluate_concurrently(custom, decisive)
+
+    def _parenthesize(self, permission):
+        """
+        Returns : bool - Whether one of the group's permissions is written in brackets
+        """
+
+        if isinstance(permission, (Permission_Operator, Permission_Group)):
+            return True
+        return ' ' in str(permission)
+
+class All_Permission(Permission_Group):
+
+    __slots__ = ()
+
+    decisive = False
+    separator = ' and '
+
+    def __init__(self, permissions):
+        """
+        permissions : list - The discord_cli.permissions.Base_Permission instances, in the order they are evaluated
+
+        Raises discord_cli.exceptions.Type_Error if any permission is not instance of discord_cli.permission.Base_Permission
+        """
+
+        super(All_Permission, self).__init__(permissions)
+        self.probability = 1.0
+        for permission in self._permissions:
+            self.probability *= permission.probability
+
+    async def evaluate(self, client, message):
+        """
+        Checks whether a user in a channel meets the criteria for all of the permissions
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - A message from the user in the channel
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the inputs are invalid
+        """
+
+        return await _evaluate_tree(self, _operand_evaluator(client, message), _expand)
+
+    async def evaluate_in(self, context):
+        """
+        Checks whether the user meets the criteria for all of the permissions within a permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether all of the criteria are met
+        """
+
+        if context.concurrent:
+            return not await self._evaluate_concurrently_in(context, False)
+
+        return await context.evaluate(self)
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return _tree_string(self)
+
+class Any_Permission(Permission_Group):
+
+    __slots__ = ()
+
+    decisive = True
+    separator = ' or '
+
+    def __init__(self, permissions):
+        """
+        permissions : list - The discord_cli.permissions.Base_Permission instances, in the order they are evaluated
+
+        Raises discord_cli.exceptions.Type_Error if any permission is not instance of discord_cli.permission.Base_Permission
+        """
+
+        super(Any_Permission, self).__init__(permissions)
+        unmet = 1.0
+        for permission in self._permissions:
+            unmet *= 1.0 - permission.probability
+        self.probability = 1.0 - unmet
+
+    async def evaluate(self, client, message):
+        """
+        Checks whether a user in a channel meets the criteria for any of the permissions
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - A message from the user in the channel
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the inputs are invalid
+        """
+
+        return await _evaluate_tree(self, _operand_evaluator(client, message), _expand)
+
+    async def evaluate_in(self, context):
+        """
+        Checks whether the user meets the criteria for any of the permissions within a permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether any of the criteria are met
+        """
+
+        if context.concurrent:
+            return await self._evaluate_concurrently_in(context, True)
+
+        return await context.evaluate(self)
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return _tree_string(self)
 
 class Permission_Operand(Base_Permission):
     """
     The permission operand represents some single criteria for a user to meet.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         The permission operand cannot be instanciated. It serves only functionality for derived classes.
@@ -171,8 +670,62 @@ class Permission_Operand(Base_Permission):
             raise exceptions.Cannot_Create_Instance_Of_Base_Class_Error('Cannot create instance of Permission_Operand')
         super(Permission_Operand, self).__init__()
 
+class Constant_Permission(Permission_Operand):
+
+    """
+    The constant permission is either met by everyone or by no one. Constant permissions are
+    folded away when a permission tree is compiled, see discord_cli.permission_compiler.
+    """
+
+    __slots__ = ('_value', 'probability')
+
+    pure = True
+    cost = 0.0
+
+    def __init__(self, value):
+        """
+        value : bool - Whether the criteria is met
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        super(Constant_Permission, self).__init__()
+        if not isinstance(value, bool):
+            raise exceptions.Type_Error('Constant permission value expected bool instance, {} found'.format(value.__class__.__name__))
+        self._value = value
+        self.probability = 1.0 if value else 0.0
+
+    @property
+    def value(self):
+        """
+        Returns : bool - Whether the criteria is met
+        """
+
+        return self._value
+
+    async def evaluate(self, client, message):
+        """
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - The message sent by a user
+        Returns : bool              - Whether the criteria is met
+        """
+
+        return self._value
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return 'everyone' if self._value else 'no one'
+
 class User_Permission(Permission_Operand):
 
+    __slots__ = ('_user_id',)
+
+    pure = True
+    cost = 0.1
+
     def __init__(self, user_id):
         """
         user_id : int - The id of the user that meets this criteria
@@ -183,6 +736,14 @@ class User_Permission(Permission_Operand):
         super(User_Permission, self).__init__()
         self._user_id = user_id
 
+    @property
+    def user_id(self):
+        """
+        Returns : int - The id of the user that meets this criteria
+        """
+
+        return self._user_id
+
     async def evaluate(self, client, message):
         """
         Checks if the user that sent the message has the specified user id
@@ -203,6 +764,12 @@ class User_Permission(Permission_Operand):
 
 class Guild_Permission(Permission_Operand):
 
+    __slots__ = ('_guild_id',)
+
+    pure = True
+    cost = 0.1
+    needs_guild = True
+
     def __init__(self, guild_id):
         """
         user_id : int - The id of the user that meets this criteria
@@ -213,6 +780,14 @@ class Guild_Permission(Permission_Operand):
         super(Guild_Permission, self).__init__()
         self._guild_id = guild_id
 
+    @property
+    def guild_id(self):
+        """
+        Returns : int - The id of the guild that meets this criteria
+        """
+
+        return self._guild_id
+
     async def evaluate(self, client, message):
         """
         Checks if the guild the message was sent within matches a specified id
@@ -231,11 +806,175 @@ class Guild_Permission(Permission_Operand):
 
         return 'guild:{}'.format(self._guild_id)
 
+class Id_Set_Permission(Permission_Operand):
+
+    """
+    The id set permission represents a criteria which is met if some id of the message is in a set of ids.
+    Membership is tested in constant time, however many ids are in the set.
+    """
+
+    __slots__ = ('_ids',)
+
+    pure = True
+    cost = 0.1
+
+    def __init__(self, ids):
+        """
+        The id set permission cannot be instanciated. It serves only functionality for derived classes.
+
+        ids : iterable - The ids (int) which meet this criteria
+
+        Raises discord_cli.exceptions.Cannot_Create_Instance_Of_Base_Class_Error if attempted to instanciate.
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        if self.__class__ == Id_Set_Permission:
+            raise exceptions.Cannot_Create_Instance_Of_Base_Class_Error('Cannot create instance of Id_Set_Permission')
+        super(Id_Set_Permission, self).__init__()
+
+        try:
+            self._ids = frozenset(ids)
+        except TypeError:
+            raise exceptions.Type_Error('{} ids expected iterable of ids, {} found'.format(self.__class__.__name__, ids.__class__.__name__))
+
+    @property
+    def ids(self):
+        """
+        Returns : frozenset - The ids which meet this criteria
+        """
+
+        return self._ids
+
+    def _join(self, prefix):
+        """
+        Returns : str - The ids prefixed with the kind of id, in ascending order
+        """
+
+        return prefix + ':' + ','.join(str(x) for x in sorted(self._ids))
+
+class User_Set_Permission(Id_Set_Permission):
+
+    __slots__ = ()
+
+    def __init__(self, user_ids):
+        """
+        user_ids : iterable - The ids (int) of the users that meet this criteria
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        super(User_Set_Permission, self).__init__(user_ids)
+
+    async def evaluate(self, client, message):
+        """
+        Checks if the user that sent the message has one of the specified user ids
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - The message sent by a user
+        Returns : bool              - Whether the user's id is one of the specified ids
+        """
+
+        return message.author.id in self._ids
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return self._join('users')
+
+class Guild_Set_Permission(Id_Set_Permission):
+
+    __slots__ = ()
+
+    needs_guild = True
+
+    def __init__(self, guild_ids):
+        """
+        guild_ids : iterable - The ids (int) of the guilds that meet this criteria
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        super(Guild_Set_Permission, self).__init__(guild_ids)
+
+    async def evaluate(self, client, message):
+        """
+        Checks if the guild the message was sent within has one of the specified ids
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - The message sent in a guild
+        Returns : bool              - Whether the message was sent in one of the guilds with the specified ids
+        """
+
+        return message.guild.id in self._ids
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return self._join('guilds')
+
+class Role_Set_Permission(Id_Set_Permission):
+
+    __slots__ = ()
+
+    cost = 1.0
+    needs_guild = True
+
+    def __init__(self, role_ids):
+        """
+        role_ids : iterable - The ids (int) of the roles that meet this criteria
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        super(Role_Set_Permission, self).__init__(role_ids)
+
+    async def evaluate(self, client, message):
+        """
+        Checks if the user that sent the message has any of the specified roles
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - The message sent by a member of a guild
+        Returns : bool              - Whether the user has a role with one of the specified ids
+        """
+
+        return not self._ids.isdisjoint(role.id for role in message.author.roles)
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        return self._join('roles')
+
 class Custom_Permission(Permission_Operand):
 
-    def __init__(self, permission_function):
+    """
+    A custom permission's cost and probability are measured while it is evaluated, unless a cost
+    is declared. Until it has been measured it is assumed to be expensive.
+
+    Custom permissions may be evaluated in a different order to the one written, or not at all
+    if the result has already been decided. A custom permission which has side effects that
+    must happen in the written order should declare them, which keeps it in place.
+    """
+
+    __slots__ = ('_permission_function', '_declared_cost', '_measured_cost', '_side_effects', 'pure', 'probability')
+
+    can_guard = True
+
+    # The cost assumed before a custom permission has been measured
+    DEFAULT_COST = 100.0
+    # The weight of the latest measurement in the moving averages
+    SMOOTHING = 0.2
+
+    def __init__(self, permission_function, cost = None, side_effects = False):
         """
-        permission_function : function - The function which evaluates some criteria
+        permission_function : function              - The function which evaluates some criteria
+        cost                : int | float | None    - The declared cost in microseconds (if None, the cost is measured)
+        side_effects        : bool                  - Whether the function has side effects which depend on the order permissions are evaluated in
         
         The function must be a corroutine function
         The function must accept, and only accept, the parameters:
@@ -250,7 +989,40 @@ class Custom_Permission(Permission_Operand):
         super(Custom_Permission, self).__init__()
         if not iscoroutinefunction(permission_function):
             raise exceptions.Not_Async_Function_Error('Custom permission function must be an async function')
+        if cost is not None:
+            if not isinstance(cost, (int, float)) or isinstance(cost, bool):
+                raise exceptions.Type_Error('Custom permission cost expected int or float instance, {} found'.format(cost.__class__.__name__))
+            if cost < 0:
+                raise exceptions.Value_Error('Custom permission cost must not be negative')
+        if not isinstance(side_effects, bool):
+            raise exceptions.Type_Error('Custom permission side_effects expected bool instance, {} found'.format(side_effects.__class__.__name__))
+
         self._permission_function = permission_function
+        self._declared_cost = cost
+        self._measured_cost = None
+        self._side_effects = side_effects
+        self.pure = not side_effects
+        self.probability = 0.5
+
+    @property
+    def cost(self):
+        """
+        Returns : float - The declared cost, or the measured cost
+        """
+
+        if self._declared_cost is not None:
+            return self._declared_cost
+        if self._measured_cost is not None:
+            return self._measured_cost
+        return self.DEFAULT_COST
+
+    @property
+    def side_effects(self):
+        """
+        Returns : bool - Whether the permission has side effects which depend on the order permissions are evaluated in
+        """
+
+        return self._side_effects
 
     async def evaluate(self, client, message):
         """
@@ -263,7 +1035,16 @@ class Custom_Permission(Permission_Operand):
         Raises Exception if input is invalid
         """
 
-        return await self._permission_function(client, message)
+        start = time.perf_counter()
+        result = await self._permission_function(client, message)
+        elapsed = (time.perf_counter() - start) * 1e6
+
+        if self._measured_cost is None:
+            self._measured_cost = elapsed
+        else:
+            self._measured_cost += self.SMOOTHING * (elapsed - self._measured_cost)
+        self.probability += self.SMOOTHING * ((1.0 if result else 0.0) - self.probability)
+        return result
 
     def __str__(self):
         """
@@ -276,8 +1057,19 @@ class Discord_Permission(Permission_Operand):
 
     """
     The discord permission class represents a discord permission user must have in a channel.
+
+    flag is the bit of the permission within discord.Permissions.value. Permission trees
+    are compiled so that every discord permission in them is checked against a single
+    discord.Permissions lookup, see discord_cli.permission_compiler.
     """
 
+    __slots__ = ()
+
+    pure = True
+    cost = 1.0
+    needs_guild = True
+    flag = None
+
     def __init__(self):
         """
         The discord permission class cannot be instanciated. It serves only functionality for derived classes.
@@ -288,8 +1080,23 @@ class Discord_Permission(Permission_Operand):
             raise exceptions.Cannot_Create_Instance_Of_Base_Class_Error('Cannot create instance of Discord_Permission')
         super(Discord_Permission, self).__init__()
 
+    async def evaluate_in(self, context):
+        """
+        Checks if a user has the discord permission, using the channel permissions of the permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether the user has the permission
+        """
+
+        if self.flag is None:
+            return await self.evaluate(context.client, context.message)
+        return context.channel_permissions.value & self.flag == self.flag
+
 class Create_Instant_Invite(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 0
+
     def __init__(self):
         super(Create_Instant_Invite, self).__init__()
     
@@ -313,6 +1120,9 @@ class Create_Instant_Invite(Discord_Permission):
 
 class Kick_Members(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 1
+
     def __init__(self):
         super(Kick_Members, self).__init__()
     
@@ -336,6 +1146,9 @@ class Kick_Members(Discord_Permission):
 
 class Ban_Members(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 2
+
     def __init__(self):
         super(Ban_Members, self).__init__()
 
@@ -359,6 +1172,9 @@ class Ban_Members(Discord_Permission):
 
 class Administrator(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 3
+
     def __init__(self):
         super(Administrator, self).__init__()
 
@@ -382,6 +1198,9 @@ class Administrator(Discord_Permission):
 
 class Manage_Channels(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 4
+
     def __init__(self):
         super(Manage_Channels, self).__init__()
 
@@ -405,6 +1224,9 @@ class Manage_Channels(Discord_Permission):
 
 class Manage_Guild(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 5
+
     def __init__(self):
         super(Manage_Guild, self).__init__()
 
@@ -428,6 +1250,9 @@ class Manage_Guild(Discord_Permission):
 
 class Add_Reactions(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 6
+
     def __init__(self):
         super(Add_Reactions, self).__init__()
     
@@ -451,6 +1276,9 @@ class Add_Reactions(Discord_Permission):
 
 class View_Audit_Log(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 7
+
     def __init__(self):
         super(View_Audit_Log, self).__init__()
 
@@ -474,6 +1302,9 @@ class View_Audit_Log(Discord_Permission):
 
 class Read_Messages(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 10
+
     def __init__(self):
         super(Read_Messages, self).__init__()
     
@@ -497,6 +1328,9 @@ class Read_Messages(Discord_Permission):
 
 class Send_Messages(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 11
+
     def __init__(self):
         super(Send_Messages, self).__init__()
     
@@ -520,6 +1354,9 @@ class Send_Messages(Discord_Permission):
 
 class Send_TTS_Messages(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 12
+
     def __init__(self):
         super(Send_TTS_Messages, self).__init__()
     
@@ -543,6 +1380,9 @@ class Send_TTS_Messages(Discord_Permission):
 
 class Manage_Messages(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 13
+
     def __init__(self):
         super(Manage_Messages, self).__init__()
     
@@ -566,6 +1406,9 @@ class Manage_Messages(Discord_Permission):
 
 class Embed_Links(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 14
+
     def __init__(self):
         super(Embed_Links, self).__init__()
     
@@ -589,6 +1432,9 @@ class Embed_Links(Discord_Permission):
 
 class Attach_Files(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 15
+
     def __init__(self):
         super(Attach_Files, self).__init__()
     
@@ -612,6 +1458,9 @@ class Attach_Files(Discord_Permission):
 
 class Read_Message_History(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 16
+
     def __init__(self):
         super(Read_Message_History, self).__init__()
     
@@ -635,6 +1484,9 @@ class Read_Message_History(Discord_Permission):
 
 class Mention_Everyone(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 17
+
     def __init__(self):
         super(Mention_Everyone, self).__init__()
     
@@ -658,6 +1510,9 @@ class Mention_Everyone(Discord_Permission):
 
 class External_Emojis(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 18
+
     def __init__(self):
         super(External_Emojis, self).__init__()
     
@@ -681,6 +1536,9 @@ class External_Emojis(Discord_Permission):
 
 class Change_Nickname(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 26
+
     def __init__(self):
         super(Change_Nickname, self).__init__()
     
@@ -704,6 +1562,9 @@ class Change_Nickname(Discord_Permission):
 
 class Manage_Nicknames(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 27
+
     def __init__(self):
         super(Manage_Nicknames, self).__init__()
     
@@ -727,6 +1588,9 @@ class Manage_Nicknames(Discord_Permission):
 
 class Manage_Roles(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 28
+
     def __init__(self):
         super(Manage_Roles, self).__init__()
     
@@ -750,6 +1614,9 @@ class Manage_Roles(Discord_Permission):
 
 class Manage_Webhooks(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 29
+
     def __init__(self):
         super(Manage_Webhooks, self).__init__()
     
@@ -773,6 +1640,9 @@ class Manage_Webhooks(Discord_Permission):
 
 class Manage_Emojis(Discord_Permission):
 
+    __slots__ = ()
+    flag = 1 << 30
+
     def __init__(self):
         super(Manage_Emojis, self).__init__()
     
@@ -792,4 +1662,90 @@ class Manage_Emojis(Discord_Permission):
         Returns : str - A string which represents the criteria to be met
         """
 
-        return 'manage_emojis'
\ No newline at end of file
+        return 'manage_emojis'
+
+class Discord_Permission_Mask(Permission_Operand):
+
+    """
+    The discord permission mask represents any combination of discord permissions, in disjunctive
+    normal form. Each term is a bitmask of discord permissions which the user must all have, and
+    the user must satisfy at least one of the terms. The permissions of the user are looked up once.
+    """
+
+    __slots__ = ('_terms',)
+
+    pure = True
+    cost = 1.0
+    needs_guild = True
+
+    def __init__(self, terms):
+        """
+        terms : iterable - The bitmasks (int) of which the user must satisfy at least one
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if the input is invalid
+        """
+
+        super(Discord_Permission_Mask, self).__init__()
+
+        terms = tuple(terms)
+        if len(terms) == 0:
+            raise exceptions.Value_Error('Discord permission mask terms must not have length 0')
+        for term in terms:
+            if not isinstance(term, int) or isinstance(term, bool):
+                raise exceptions.Type_Error('Discord permission mask terms expected int instances, {} found'.format(term.__class__.__name__))
+
+        self._terms = terms
+
+    @property
+    def terms(self):
+        """
+        Returns : tuple - The bitmasks of which the user must satisfy at least one
+        """
+
+        return self._terms
+
+    async def evaluate(self, client, message):
+        """
+        Checks if a user has all of the discord permissions of any term
+
+        client  : discord.Client    - The discord bot client
+        message : discord.Message   - The message that envoked the command
+        Returns : bool              - Whether the user has all of the permissions of any term
+        """
+
+        return self._match(message.author.permissions_in(message.channel).value)
+
+    async def evaluate_in(self, context):
+        """
+        Checks if a user has all of the discord permissions of any term, using the channel permissions of the permission context
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : bool                                          - Whether the user has all of the permissions of any term
+        """
+
+        return self._match(context.channel_permissions.value)
+
+    def _match(self, value):
+        """
+        value   : int   - The value of the user's discord.Permissions
+        Returns : bool  - Whether the value contains all of the bits of any term
+        """
+
+        for term in self._terms:
+            if value & term == term:
+                return True
+        return False
+
+    def __str__(self):
+        """
+        Returns : str - A string which represents the criteria to be met
+        """
+
+        names = {cls.flag: str(cls()) for cls in Discord_Permission.__subclasses__() if cls.flag is not None}
+        terms = []
+        for term in self._terms:
+            bits = [names.get(1 << i, 'permission:{}'.format(1 << i)) for i in range(term.bit_length()) if term >> i & 1]
+            terms.append(' and '.join(bits))
+        if len(terms) == 1:
+            return terms[0]
+        return ' or '.join('(' + x + ')' if ' ' in x else x for x in terms)
@@ -0,0 +1,454 @@
+"""
+Snapshots save a fully built command system so that it can be loaded again without calling the
+builders. Building a command system validates every name, description, letter and word and checks
+each parameter against the others of it's command. A snapshot is only taken of a command system
+which has passed those checks, so loading it skips them.
+
+A snapshot is a dictionary of JSON compatible values:
+
+    format      : 'discord_cli.snapshot'
+    version     : SNAPSHOT_VERSION, snapshots of other versions are not loaded
+    commands    : the commands in pre order, the first of which is the root of the command system
+    parsers     : the parsers of the arguments and options, each of which is saved once
+    permissions : the permissions of the commands, each after the permissions it is made of
+
+Command functions and the functions of custom permissions are saved as import paths of the form
+'module:qualified.name', so they must be defined at the top level of a module or class. Discord
+permissions are saved as the import path of their class. Permissions which are used by more than
+one command, or more than once in a tree, are saved once and are shared again once loaded.
+
+Loading a snapshot imports the modules named in it, so only load snapshots from trusted sources.
+"""
+
+import gc
+import json
+import importlib
+from datetime import date, time
+
+import discord_cli.exceptions as exceptions
+import discord_cli.parsers as parsers
+import discord_cli.permissions as permissions
+import discord_cli.validation as validation
+import discord_cli.datetime_formats as datetime_formats
+
+from discord_cli.command import Command
+from discord_cli.command_system import Command_System
+from discord_cli.argument_builder import Argument, Argument_Builder
+from discord_cli.option_builder import Option, Option_Builder
+from discord_cli.tag_builder import Tag, Tag_Builder
+from discord_cli.permission_builder import Permission_Builder
+
+SNAPSHOT_FORMAT = 'discord_cli.snapshot'
+SNAPSHOT_VERSION = 1
+
+# Parser type : name of the parser in a snapshot
+_PARSER_KINDS = {
+    parsers.Integer_Parser: 'integer',
+    parsers.Float_Parser: 'float',
+    parsers.Word_Parser: 'word',
+    parsers.String_Parser: 'string',
+    parsers.User_Mention_Parser: 'user_mention',
+    parsers.Channel_Mention_Parser: 'channel_mention',
+    parsers.Role_Mention_Parser: 'role_mention',
+    parsers.Date_Parser: 'date',
+    parsers.Time_Parser: 'time',
+    parsers.Enum_Parser: 'enum',
+}
+_PARSER_TYPES = {kind: parser_type for parser_type, kind in _PARSER_KINDS.items()}
+
+# Id set permission type : name of the permission in a snapshot
+_ID_SET_KINDS = {
+    permissions.User_Set_Permission: 'user_set',
+    permissions.Guild_Set_Permission: 'guild_set',
+    permissions.Role_Set_Permission: 'role_set',
+}
+_ID_SET_TYPES = {kind: permission_type for permission_type, kind in _ID_SET_KINDS.items()}
+
+def export_snapshot(command_system):
+    """
+    Takes a snapshot of a command system
+
+    command_system  : discord_cli.command_system.Command_System - The command system
+    Returns         : dict                                      - The snapshot
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if a function, parser or permission cannot be saved
+    """
+
+    permission_table = _Permission_Table()
+    # The settings of a parser : the index of the parser
+    parser_indices = {}
+    commands = []
+    indices = {}
+    # Pre order traversal with an explicit stack, so deep trees do not hit the recursion limit
+    stack = [command_system._root]
+    while stack:
+        command = stack.pop()
+        indices[command] = len(commands)
+        commands.append({
+            'name': command.name,
+            'description': command.description,
+            'parent': None if command.parent is None else indices[command.parent],
+            'function': None if command.function is None else _import_path(command.function),
+            'arguments': [[x.name, x.description, _parser_index(x.parser, parser_indices)] for x in command._argument_builder.arguments],
+            'options': [[x.name, x.description, x.letter, x.word, _parser_index(x.parser, parser_indices)] for x in command._option_builder.options],
+            'tags': [[x.name, x.description, x.letter, x.word] for x in command._tag_builder.tags],
+            'first_is_text': command._argument_builder.first_is_text,
+            'permissions': [permission_table.add(x) for x in command._permission_builder.permissions],
+            'parser_concurrency': command._parser_concurrency,
+        })
+        stack.extend(reversed(list(command.sub_commands.values())))
+
+    return {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'commands': commands,
+        'parsers': [list(x) for x in parser_indices],
+        'permissions': permission_table.nodes,
+    }
+
+def import_snapshot(snapshot, parse_cache_size = None):
+    """
+    Loads a command system from a snapshot without validating it again
+
+    snapshot            : dict                                      - The snapshot
+    parse_cache_size    : int | None                                - The maximum amount of command strings held in the parse cache
+    Returns             : discord_cli.command_system.Command_System - The command system
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if the snapshot is not a supported version or an import path cannot be loaded
+    """
+
+    if not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT:
+        raise exceptions.Value_Error('snapshot is not a discord_cli snapshot')
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise exceptions.Value_Error('snapshot version {} is not supported, expected version {}'.format(snapshot.get('version'), SNAPSHOT_VERSION))
+
+    # Loading creates a large amount of objects at once, which would otherwise set off the cyclic
+    # garbage collector many times over without there being anything for it to collect
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _import_commands(snapshot, parse_cache_size)
+    finally:
+        if enabled:
+            gc.enable()
+
+def _import_commands(snapshot, parse_cache_size):
+    """
+    Builds the command system of a snapshot whose version has been checked
+
+    snapshot            : dict                                      - The snapshot
+    parse_cache_size    : int | None                                - The maximum amount of command strings held in the parse cache
+    Returns             : discord_cli.command_system.Command_System - The command system
+    """
+
+    entries = snapshot['commands']
+    root_entry = entries[0]
+    command_system = Command_System(root_entry['name'], root_entry['description'], parse_cache_size)
+
+    permission_nodes = _import_permissions(snapshot['permissions'])
+    # Parameters with the same parser share a single parser, which is only built once
+    parser_table = [_import_parser(x) for x in snapshot['parsers']]
+    functions = {}
+
+    commands = []
+    for entry in entries:
+        function = entry['function']
+        if function is not None:
+            if function not in functions:
+                functions[function] = _resolve(function)
+            function = functions[function]
+
+        if entry['parent'] is None:
+            command = command_system._root
+            command._function = function
+        else:
+            parent = commands[entry['parent']]
+            name = entry['name']
+            command_string = name if parent._command_string is None else parent._command_string + ' ' + name
+            command = Command.__new__(Command)
+            command._initialize(name, entry['description'], parent, command_string, function)
+            if parent._sub_command_count == 0:
+                parent._sub_commands = {}
+            parent._sub_commands[name] = command
+            parent._sub_command_count += 1
+        commands.append(command)
+
+        # Builders are only created for commands which have something in them, like the builders do
+        if entry['arguments']:
+            argument_builder = command._argument_builder = Argument_Builder(command)
+            for name, description, parser in entry['arguments']:
+                argument = Argument.__new__(Argument)
+                argument._name = name
+                argument._description = description
+                argument._parser = parser_table[parser]
+                argument_builder._arguments.append(argument)
+                argument_builder._name_table[name] = argument
+            argument_builder._argument_count = len(argument_builder._arguments)
+            argument_builder._first_is_text = entry['first_is_text']
+
+        if entry['options']:
+            option_builder = command._option_builder = Option_Builder(command)
+            for name, description, letter, word, parser in entry['options']:
+                option = Option.__new__(Option)
+                option._name = name
+                option._description = description
+                option._letter = letter
+                option._word = word
+                option._parser = parser_table[parser]
+                option_builder._options.append(option)
+                option_builder._name_table[name] = option
+                option_builder._letter_table[letter] = option
+                if word is not None:
+                    option_builder._word_table[word] = option
+            option_builder._option_count = len(option_builder._options)
+
+        if entry['tags']:
+            tag_builder = command._tag_builder = Tag_Builder(command)
+            for name, description, letter, word in entry['tags']:
+                tag = Tag.__new__(Tag)
+                tag._name = name
+                tag._description = description
+                tag._letter = letter
+                tag._word = word
+                tag_builder._tags.append(tag)
+                tag_builder._name_table[name] = tag
+                tag_builder._letter_table[letter] = tag
+                if word is not None:
+                    tag_builder._word_table[word] = tag
+            tag_builder._tag_count = len(tag_builder._tags)
+
+        if entry['permissions']:
+            permission_builder = command._permission_builder = Permission_Builder(command)
+            permission_builder._permissions.extend(permission_nodes[x] for x in entry['permissions'])
+            permission_builder._permission_count = len(permission_builder._permissions)
+
+        command._parser_concurrency = entry['parser_concurrency']
+
+    # Anything derived from the empty root of the command system is rebuilt
+    command_system._root._touch()
+    return command_system
+
+def dump(command_system, stream):
+    """
+    Writes a snapshot of a command system to a text stream as JSON
+
+    command_system  : discord_cli.command_system.Command_System - The command system
+    stream          : io.TextIOBase                             - The stream to write to, such as a file
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if a function, parser or permission cannot be saved
+    """
+
+    json.dump(export_snapshot(command_system), stream, separators = (',', ':'))
+
+def load(stream, parse_cache_size = None):
+    """
+    Loads a command system from a snapshot written to a text stream by discord_cli.snapshot.dump
+
+    stream              : io.TextIOBase                             - The stream to read from, such as a file
+    parse_cache_size    : int | None                                - The maximum amount of command strings held in the parse cache
+    Returns             : discord_cli.command_system.Command_System - The command system
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if the snapshot is not a supported version or an import path cannot be loaded
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        snapshot = json.load(stream)
+    finally:
+        if enabled:
+            gc.enable()
+    return import_snapshot(snapshot, parse_cache_size)
+
+def _import_path(obj):
+    """
+    obj     : object    - A function or class defined at the top level of a module or class
+    Returns : str       - The import path of the object, of the form 'module:qualified.name'
+
+    Raises discord_cli.exceptions.Value_Error if the object cannot be imported by it's path
+    """
+
+    path = '{}:{}'.format(getattr(obj, '__module__', None), getattr(obj, '__qualname__', None))
+    try:
+        found = _resolve(path)
+    except exceptions.Discord_CLI_Error:
+        found = None
+    if found is not obj:
+        raise exceptions.Value_Error('{!r} cannot be saved in a snapshot as it cannot be imported from {}'.format(obj, path))
+    return path
+
+def _resolve(path):
+    """
+    path    : str       - An import path of the form 'module:qualified.name'
+    Returns : object    - The object the path refers to
+
+    Raises discord_cli.exceptions.Value_Error if the path cannot be imported
+    """
+
+    module_name, _, qualified_name = path.partition(':')
+    try:
+        obj = importlib.import_module(module_name)
+        for name in qualified_name.split('.'):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError, ValueError):
+        raise exceptions.Value_Error('cannot import {} from a snapshot'.format(path))
+    return obj
+
+def _parser_index(parser, parser_indices):
+    """
+    parser          : discord_cli.parsers.Base_Parser   - The parser of an argument or option
+    parser_indices  : dict                              - The index of each parser saved so far, by it's settings
+    Returns         : int                               - The index of the parser
+
+    Raises discord_cli.exceptions.Type_Error if the parser cannot be saved
+    """
+
+    kind = _PARSER_KINDS.get(type(parser))
+    if kind is None:
+        raise exceptions.Type_Error('{} cannot be saved in a snapshot'.format(parser.__class__.__name__))
+    if kind in ('integer', 'float'):
+        spec = (kind, parser._min, parser._max, parser._include_min, parser._include_max)
+    elif kind in ('word', 'string'):
+        spec = (kind, parser._min_length, parser._max_length, parser._include_min_length, parser._include_max_length)
+    elif kind in ('date', 'time'):
+        bounds = tuple(None if x is None else x.isoformat() for x in (parser._min, parser._max))
+        spec = (kind,) + bounds + (parser._include_min, parser._include_max, tuple(x.format for x in parser._formats))
+    elif kind == 'enum':
+        spec = (kind, tuple(parser._values))
+    else:
+        spec = (kind,)
+    return parser_indices.setdefault(spec, len(parser_indices))
+
+def _import_parser(spec):
+    """
+    spec    : list                              - The kind of the parser followed by it's settings
+    Returns : discord_cli.parsers.Base_Parser   - The parser, shared with any equal parser
+    """
+
+    kind = spec[0]
+    parser = _PARSER_TYPES[kind].__new__(_PARSER_TYPES[kind])
+    if kind in ('integer', 'float'):
+        _, parser._min, parser._max, parser._include_min, parser._include_max = spec
+        parser._in_bounds = validation.compile_bounds_matcher(parser._min, parser._max, parser._include_min, parser._include_max)
+    elif kind in ('word', 'string'):
+        _, parser._min_length, parser._max_length, parser._include_min_length, parser._include_max_length = spec
+        compile_matcher = validation.compile_word_matcher if kind == 'word' else validation.compile_string_matcher
+        parser._matcher = compile_matcher(parser._min_length, parser._max_length, parser._include_min_length, parser._include_max_length)
+    elif kind in ('date', 'time'):
+        _, minimum, maximum, parser._include_min, parser._include_max, formats = spec
+        value_type, directives = (date, datetime_formats.DATE_DIRECTIVES) if kind == 'date' else (time, datetime_formats.TIME_DIRECTIVES)
+        parser._formats = datetime_formats.compile_formats(list(formats), directives)
+        parser._min = None if minimum is None else value_type.fromisoformat(minimum)
+        parser._max = None if maximum is None else value_type.fromisoformat(maximum)
+        parser._in_bounds = validation.compile_bounds_matcher(parser._min, parser._max, parser._include_min, parser._include_max)
+    elif kind == 'enum':
+        parser._values = tuple(spec[1])
+        parser._matcher = validation.compile_enum_matcher(parser._values)
+    return parsers.intern_parser(parser)
+
+class _Permission_Table(object):
+
+    """
+    Collects the permission trees of a command system into a list of nodes, in which the permissions
+    of an operator or group come before it. Each permission is added once, however often it is used.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        # id of a permission : index of it's node
+        self._indices = {}
+        # Keeps the permissions alive, so their ids are not reused while the table is built
+        self._permissions = []
+
+    def add(self, permission):
+        """
+        permission  : discord_cli.permissions.Base_Permission   - The root of a permission tree
+        Returns     : int                                       - The index of the permission's node
+
+        Raises discord_cli.exceptions.Discord_CLI_Error if a permission cannot be saved
+        """
+
+        # Post order traversal with an explicit stack, so deep trees do not hit the recursion limit
+        stack = [(permission, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in self._indices:
+                continue
+            children = node.permissions if isinstance(node, (permissions.Permission_Operator, permissions.Permission_Group)) else ()
+            if not expanded and children:
+                stack.append((node, True))
+                stack.extend((x, False) for x in reversed(children))
+                continue
+            self._indices[id(node)] = len(self.nodes)
+            self._permissions.append(node)
+            self.nodes.append(self._export(node, [self._indices[id(x)] for x in children]))
+        return self._indices[id(permission)]
+
+    def _export(self, permission, children):
+        """
+        permission  : discord_cli.permissions.Base_Permission   - A permission whose children have been added
+        children    : list                                      - The indices of the nodes of the permission's children
+        Returns     : list                                      - The kind of the permission followed by it's settings
+        """
+
+        if isinstance(permission, permissions.And_Permission_Operator):
+            return ['and'] + children
+        if isinstance(permission, permissions.Or_Permission_Operator):
+            return ['or'] + children
+        if isinstance(permission, permissions.All_Permission):
+            return ['all', children]
+        if isinstance(permission, permissions.Any_Permission):
+            return ['any', children]
+        if isinstance(permission, permissions.Constant_Permission):
+            return ['constant', permission.value]
+        if type(permission) is permissions.User_Permission:
+            return ['user', permission.user_id]
+        if type(permission) is permissions.Guild_Permission:
+            return ['guild', permission.guild_id]
+        if type(permission) in _ID_SET_KINDS:
+            return [_ID_SET_KINDS[type(permission)], sorted(permission.ids)]
+        if type(permission) is permissions.Custom_Permission:
+            return ['custom', _import_path(permission._permission_function), permission._declared_cost, permission.side_effects]
+        if isinstance(permission, permissions.Discord_Permission):
+            return ['discord', _import_path(type(permission))]
+        if type(permission) is permissions.Discord_Permission_Mask:
+            return ['mask', list(permission.terms)]
+        raise exceptions.Type_Error('{} cannot be saved in a snapshot'.format(permission.__class__.__name__))
+
+def _import_permissions(nodes):
+    """
+    nodes   : list  - The permission nodes of a snapshot
+    Returns : list  - The discord_cli.permissions.Base_Permission of each node
+
+    Raises discord_cli.exceptions.Discord_CLI_Error if an import path cannot be loaded
+    """
+
+    result = []
+    for node in nodes:
+        kind = node[0]
+        if kind == 'and':
+            permission = permissions.And_Permission_Operator(result[node[1]], result[node[2]])
+        elif kind == 'or':
+            permission = permissions.Or_Permission_Operator(result[node[1]], result[node[2]])
+        elif kind == 'all':
+            permission = permissions.All_Permission([result[x] for x in node[1]])
+        elif kind == 'any':
+            permission = permissions.Any_Permission([result[x] for x in node[1]])
+        elif kind == 'constant':
+            permission = permissions.Constant_Permission(node[1])
+        elif kind == 'user':
+            permission = permissions.User_Permission(node[1])
+        elif kind == 'guild':
+            permission = permissions.Guild_Permission(node[1])
+        elif kind in _ID_SET_TYPES:
+            permission = _ID_SET_TYPES[kind](node[1])
+        elif kind == 'custom':
+            permission = permissions.Custom_Permission(_resolve(node[1]), node[2], node[3])
+        elif kind == 'discord':
+            permission = _resolve(node[1])()
+        elif kind == 'mask':
+            permission = permissions.Discord_Permission_Mask(node[1])
+        else:
+            raise exceptions.Value_Error('snapshot has a permission of unknown kind {!r}'.format(kind))
+        result.append(permission)
+    return result
@@ -1,12 +1,19 @@
+from types import MappingProxyType
+
 import discord_cli.validation as validation
 import discord_cli.exceptions as exceptions
 
+# The tables of the empty tag builder, which cannot be added to
+_EMPTY_TABLE = MappingProxyType({})
+
 class Tag(object):
 
     """
     The tag class represents a single tag that is a component of a command
     """
 
+    __slots__ = ('_name', '_description', '_letter', '_word')
+
     def __init__(self, name, description, letter, word):
         """
         name        : str           - The name of the tag
@@ -97,19 +104,30 @@ class Tag_Builder(object):
 
     """
     The tag builder serves as a list of tags which belong to a command.
+
+    Commands without tags share EMPTY_TAG_BUILDER, whose tables are
+    immutable, until their first tag is added.
     """
 
+    __slots__ = ('_command', '_tags', '_name_table', '_letter_table', '_word_table', '_tag_count')
+
     def __init__(self, command):
         """
-        command : discord_cli.command.Command - The command the tags belong to
+        command : discord_cli.command.Command | None - The command the tags belong to (If None, the builder is empty and cannot be added to)
         """
 
         self._command = command
         
-        self._tags = []
-        self._name_table = {}
-        self._letter_table = {}
-        self._word_table = {}
+        if command is None:
+            self._tags = ()
+            self._name_table = _EMPTY_TABLE
+            self._letter_table = _EMPTY_TABLE
+            self._word_table = _EMPTY_TABLE
+        else:
+            self._tags = []
+            self._name_table = {}
+            self._letter_table = {}
+            self._word_table = {}
         self._tag_count = 0
     
     def tag(self, name, description, letter, word):
@@ -148,6 +166,7 @@ class Tag_Builder(object):
         if new_tag.word is not None:
             self._word_table[new_tag.word] = new_tag
         self._tag_count += 1
+        self._command._touch()
     
     @property
     def tags(self):
@@ -187,4 +206,7 @@ class Tag_Builder(object):
         Returns : int - The amount of tags in the list
         """
 
-        return self._tag_count
\ No newline at end of file
+        return self._tag_count
+
+# Shared by every command which has no tags
+EMPTY_TAG_BUILDER = Tag_Builder(None)
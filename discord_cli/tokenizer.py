@@ -0,0 +1,82 @@
+import re
+
+import discord_cli.exceptions as exceptions
+
+# The only characters which change the state of the tokenizer. Everything between two
+# of them is copied into the current element as a single slice of the command string.
+_SPECIAL_CHARACTERS = re.compile(r'[ "\\]')
+
+def split_command_string(command_string):
+    """
+    Splits a command string into a list which contains individual
+    command identifiers and parameters
+
+    command_string  : str   - The command string to be split
+    Returns         : list  - A list containing the individual command identifiers and parameters
+
+    Raises discord_cli.exceptions.Value_Error if quotes are not used correctly
+    """
+
+    return list(iter_command_string(command_string))
+
+def iter_command_string(command_string):
+    """
+    Lazily splits a command string into individual command identifiers and parameters
+
+    Elements are separated by spaces. Text within double quotes can contain spaces
+    and a backslash escapes the character that follows it.
+
+    The command string is scanned once, jumping between special characters, and each
+    element is built by joining the slices between them so the cost is linear in the
+    length of the command string. Scanning stops after each element until the next one
+    is requested, so text after the last element consumed is never looked at.
+
+    command_string  : str       - The command string to be split
+    Returns         : generator - Yields the individual command identifiers and parameters in order
+
+    Raises discord_cli.exceptions.Value_Error when an incorrectly used quote is reached
+    """
+
+    pieces = []
+
+    length = len(command_string)
+    start = 0
+    within_quotes = False
+
+    search = _SPECIAL_CHARACTERS.search
+    match = search(command_string)
+
+    while match is not None:
+        index = match.start()
+        char = command_string[index]
+
+        if char == ' ' and within_quotes:
+            match = search(command_string, index + 1)
+            continue
+
+        if index != start:
+            pieces.append(command_string[start:index])
+        start = index + 1
+
+        if char == '\\':
+            # The escaped character is left at the start of the next slice
+            match = search(command_string, index + 2)
+            continue
+
+        if char == ' ':
+            if pieces:
+                yield ''.join(pieces)
+                pieces = []
+        else:
+            if not within_quotes and pieces:
+                raise exceptions.Value_Error('A quote used to start escaping text must follow a space')
+            if within_quotes and index + 1 < length and command_string[index + 1] != ' ':
+                raise exceptions.Value_Error('A quote used to end escaping text must be followed by a space')
+            within_quotes = not within_quotes
+
+        match = search(command_string, index + 1)
+
+    if start < length:
+        pieces.append(command_string[start:])
+    if pieces:
+        yield ''.join(pieces)
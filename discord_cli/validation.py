@@ -1,6 +1,16 @@
 import re
 import discord_cli.exceptions as exceptions
 
+# Anchored patterns, compiled once and matched against the whole string
+COMMAND_NAME_PATTERN = re.compile('[a-zA-Z_]+')
+WORD_PATTERN = re.compile('[a-zA-Z]+')
+USER_MENTION_PATTERN = re.compile(r'<@!?(\d+)>')
+CHANNEL_MENTION_PATTERN = re.compile(r'<#(\d+)>')
+ROLE_MENTION_PATTERN = re.compile(r'<@&(\d+)>')
+# Matched against the start of the string only, which is all validate_date and validate_time have ever checked
+DATE_PATTERN = re.compile(r'\d\d/\d\d/\d\d')
+TIME_PATTERN = re.compile(r'\d\d:\d\d:\d\d')
+
 def validate_string(string):
     """
     Checks if the input is a string of non-zero length
@@ -25,7 +35,7 @@ def validate_command_name(string):
     """
 
     validate_string(string)
-    if re.match('.*[^a-zA-Z_].*', string):
+    if not COMMAND_NAME_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must only contain letters and underscores')
 
 def validate_word(string):
@@ -38,7 +48,7 @@ def validate_word(string):
     """
 
     validate_string(string)
-    if re.match('.*[^a-zA-Z].*', string):
+    if not WORD_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a word')
 
 def validate_float(obj):
@@ -116,7 +126,7 @@ def validate_user_mention(string):
     """
 
     validate_string(string)
-    if not re.match('<@!?\d+>', string):
+    if not USER_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a user mention')
 
 def validate_channel_mention(string):
@@ -129,7 +139,7 @@ def validate_channel_mention(string):
     """
 
     validate_string(string)
-    if not re.match('<#\d+>', string):
+    if not CHANNEL_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a channel mention')
 
 def validate_role_mention(string):
@@ -142,7 +152,7 @@ def validate_role_mention(string):
     """
     
     validate_string(string)
-    if not re.match('<@&\d+>', string):
+    if not ROLE_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a role mention')
 
 def validate_date(string):
@@ -155,7 +165,7 @@ def validate_date(string):
     """
 
     validate_string(string)
-    if not re.match('\d\d/\d\d/\d\d', string):
+    if not DATE_PATTERN.match(string):
         raise exceptions.Value_Error('must represent a date')
 
 def validate_time(string):
@@ -168,9 +178,109 @@ def validate_time(string):
     """
 
     validate_string(string)
-    if not re.match('\d\d:\d\d:\d\d', string):
+    if not TIME_PATTERN.match(string):
         raise exceptions.Value_Error('must represent a time')
 
+"""
+Compiled matchers ==============================================================================================
+
+Parsers compile a matcher for their configuration when they are built. A matcher fuses every check
+of the parser into a single call which returns whether a string is valid. When it returns False, the
+parser runs the validators above to find out why, so the error messages are unchanged.
+"""
+
+def _length_range(min_length, max_length, include_min_length, include_max_length):
+    """
+    Converts length bounds into the smallest and largest valid lengths of a non-empty string
+
+    Returns : int, int | None - The smallest and largest valid lengths (None if there is no largest)
+    """
+
+    lower = 1
+    if min_length is not None:
+        lower = max(lower, min_length if include_min_length else min_length + 1)
+
+    upper = None
+    if max_length is not None:
+        upper = max_length if include_max_length else max_length - 1
+
+    return lower, upper
+
+def _never(value):
+    return False
+
+def _always(value):
+    return True
+
+def compile_bounds_matcher(min, max, include_min, include_max):
+    """
+    Compiles a matcher which checks that a value lies within an interval, see validate_bounds
+
+    min         : object    - The lower bound of the interval (if None, assumed to be negative infinity)
+    max         : object    - The upper bound of the interval (if None, assumed to be positive infinity)
+    include_min : bool      - Whether the lower bound is not a strict inequality
+    include_max : bool      - Whether the upper bound is not a strict inequality
+    Returns     : function  - Takes a value and returns whether it is within the interval
+    """
+
+    if min is None and max is None:
+        return _always
+    if min is None:
+        return (lambda value: value <= max) if include_max else (lambda value: value < max)
+    if max is None:
+        return (lambda value: value >= min) if include_min else (lambda value: value > min)
+    if include_min and include_max:
+        return lambda value: min <= value <= max
+    if include_min:
+        return lambda value: min <= value < max
+    if include_max:
+        return lambda value: min < value <= max
+    return lambda value: min < value < max
+
+def compile_word_matcher(min_length, max_length, include_min_length, include_max_length):
+    """
+    Compiles a matcher which checks that a string is a word within length bounds
+
+    min_length          : int | None    - The lower bound of valid length
+    max_length          : int | None    - The upper bound of valid length
+    include_min_length  : bool          - Whether the minimum length is valid
+    include_max_length  : bool          - Whether the maximum length is valid
+    Returns             : function      - Takes a string and returns whether it is valid
+    """
+
+    lower, upper = _length_range(min_length, max_length, include_min_length, include_max_length)
+    if upper is not None and upper < lower:
+        return _never
+    return re.compile('[a-zA-Z]{{{},{}}}'.format(lower, '' if upper is None else upper)).fullmatch
+
+def compile_string_matcher(min_length, max_length, include_min_length, include_max_length):
+    """
+    Compiles a matcher which checks that a string is non-empty and within length bounds
+
+    min_length          : int | None    - The lower bound of valid length
+    max_length          : int | None    - The upper bound of valid length
+    include_min_length  : bool          - Whether the minimum length is valid
+    include_max_length  : bool          - Whether the maximum length is valid
+    Returns             : function      - Takes a string and returns whether it is valid
+    """
+
+    lower, upper = _length_range(min_length, max_length, include_min_length, include_max_length)
+    if upper is None:
+        return lambda string: len(string) >= lower
+    if upper < lower:
+        return _never
+    return lambda string: lower <= len(string) <= upper
+
+def compile_enum_matcher(values):
+    """
+    Compiles a matcher which checks that a string is one of a set of values
+
+    values  : list      - The valid strings
+    Returns : function  - Takes a string and returns whether it is valid
+    """
+
+    return frozenset(values).__contains__
+
 """
 Async counterparts =============================================================================================
 
@@ -186,12 +296,12 @@ async def async_validate_string(string):
 
 async def async_validate_command_name(string):
     await async_validate_string(string)
-    if re.match('.*[^a-zA-Z_].*', string):
+    if not COMMAND_NAME_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must only contain letters and underscores')
 
 async def async_validate_word(string):
     await async_validate_string(string)
-    if re.match('.*[^a-zA-Z].*', string):
+    if not WORD_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a word')
 
 async def async_validate_float(string):
@@ -228,25 +338,25 @@ async def async_validate_bounds(value, min, max, include_min, include_max):
 
 async def async_validate_user_mention(string):
     await async_validate_string(string)
-    if not re.match('<@!?\d+>', string):
+    if not USER_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a user mention')
 
 async def async_validate_channel_mention(string):
     await async_validate_string(string)
-    if not re.match('<#\d+>', string):
+    if not CHANNEL_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a channel mention')
 
 async def async_validate_role_mention(string):
     await async_validate_string(string)
-    if not re.match('<@&\d+>', string):
+    if not ROLE_MENTION_PATTERN.fullmatch(string):
         raise exceptions.Value_Error('must represent a role mention')
 
 async def async_validate_date(string):
     await async_validate_string(string)
-    if not re.match('\d\d/\d\d/\d\d', string):
+    if not DATE_PATTERN.match(string):
         raise exceptions.Value_Error('must represent a date')
 
 async def async_validate_time(string):
     await async_validate_string(string)
-    if not re.match('\d\d:\d\d:\d\d', string):
+    if not TIME_PATTERN.match(string):
         raise exceptions.Value_Error('must represent a time')
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+The visibility engine works out which commands of a command tree a user can see, so that help
+messages, command listings and autocomplete do not evaluate permissions command by command.
+
+Every command below the root is given a bit index, in the same order the commands are listed in.
+The commands a user can see are computed once as a bitset: a command is visible if the user meets
+it's permissions and it's parent is visible. Listing the visible subcommands of a command is then
+a bitwise and of that bitset with a precomputed mask of the command's subcommands.
+
+Bitsets are cached in the permission decision cache of the command system, if it has one, under
+the same user, guild and channel as the permission decisions. They expire, are invalidated and are
+cleared along with the decisions.
+
+Without a decision cache, a bitset would be computed from scratch for every request, evaluating the
+permissions of the whole tree. The command system then only uses bitsets to list every visible
+command, and evaluates the permissions of the few commands it needs for help messages and completion.
+"""
+
+class Visibility_Engine(object):
+
+    """
+    Assigns the commands of a command tree bit indices and computes the bitset of commands a user can see.
+    The bit indices are assigned again whenever the command tree changes.
+    """
+
+    def __init__(self, root):
+        """
+        root : discord_cli.command.Command - The root of the command tree
+        """
+
+        self._root = root
+        self._revision = None
+
+        # Commands in bit index order, which is the order they are listed in
+        self._commands = []
+        # Command : bit index
+        self._bits = {}
+        # Bit index : bit index after the command's last descendant
+        self._subtree_ends = []
+        # Command : bitset of it's sub commands
+        self._sub_command_masks = {}
+        # Identifies the current bit indices in the keys of cached bitsets
+        self._layout = None
+
+    def _build(self):
+        """
+        Assigns bit indices to the commands of the tree if it has changed since they were last assigned
+        """
+
+        if self._revision == self._root.revision:
+            return
+
+        commands = []
+        subtree_ends = []
+        sub_command_masks = {self._root: 0}
+        # Pre order traversal with an explicit stack. None marks the end of a command's subtree.
+        stack = list(reversed(list(self._root.sub_commands.values())))
+        open_commands = []
+        while stack:
+            command = stack.pop()
+            if command is None:
+                subtree_ends[open_commands.pop()] = len(commands)
+                continue
+            bit = len(commands)
+            commands.append(command)
+            subtree_ends.append(None)
+            sub_command_masks[command] = 0
+            sub_command_masks[command.parent] |= 1 << bit
+            open_commands.append(bit)
+            stack.append(None)
+            stack.extend(reversed(list(command.sub_commands.values())))
+
+        self._commands = commands
+        self._bits = {command: bit for bit, command in enumerate(commands)}
+        self._subtree_ends = subtree_ends
+        self._sub_command_masks = sub_command_masks
+        self._layout = object()
+        self._revision = self._root.revision
+
+    @property
+    def command_count(self):
+        """
+        Returns : int - The amount of commands which have a bit index
+        """
+
+        self._build()
+        return len(self._commands)
+
+    def bit(self, command):
+        """
+        command : discord_cli.command.Command   - A command in the tree, other than the root
+        Returns : int                           - The bit index of the command
+        """
+
+        self._build()
+        return self._bits[command]
+
+    def sub_command_mask(self, command):
+        """
+        command : discord_cli.command.Command   - A command in the tree
+        Returns : int                           - The bitset of the command's sub commands
+        """
+
+        self._build()
+        return self._sub_command_masks[command]
+
+    async def visible(self, context):
+        """
+        Gets the bitset of the commands a user can see, from the permission decision cache if possible
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : int                                           - The bitset of the visible commands
+        """
+
+        self._build()
+
+        cache = context.decision_cache
+        if cache is None:
+            return await self._compute(context)
+
+        key = (self._layout,) + context.decision_key
+        visible = cache.get(key)
+        if visible is None:
+            visible = await self._compute(context)
+            cache.put(key, visible)
+        return visible
+
+    async def _compute(self, context):
+        """
+        Evaluates the permissions of the commands in bit index order, skipping the descendants of commands which are not visible
+
+        context : discord_cli.permissions.Permission_Context    - The context of the invocation
+        Returns : int                                           - The bitset of the visible commands
+        """
+
+        client = context.client
+        message = context.message
+        commands = self._commands
+
+        visible = 0
+        bit = 0
+        while bit < len(commands):
+            if await commands[bit]._permission_builder.evaluate(client, message, context):
+                visible |= 1 << bit
+                bit += 1
+            else:
+                bit = self._subtree_ends[bit]
+        return visible
+
+    def visible_sub_commands(self, command, visible):
+        """
+        command : discord_cli.command.Command   - A command in the tree
+        visible : int                           - The bitset of the visible commands
+        Returns : list                          - The visible sub commands of the command, in the order they are listed in
+        """
+
+        return self._select(visible & self.sub_command_mask(command))
+
+    def visible_commands(self, visible):
+        """
+        visible : int   - The bitset of the visible commands
+        Returns : list  - Every visible command in the tree, in the order they are listed in
+        """
+
+        self._build()
+        return self._select(visible)
+
+    def _select(self, bits):
+        """
+        bits    : int   - A bitset of commands
+        Returns : list  - The commands in the bitset, in bit index order
+        """
+
+        commands = []
+        while bits:
+            lowest = bits & -bits
+            commands.append(self._commands[lowest.bit_length() - 1])
+            bits ^= lowest
+        return commands
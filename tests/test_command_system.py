@@ -0,0 +1,72 @@
+import asyncio
+import sys
+import types
+import unittest
+from unittest import mock
+
+import discord_cli as dcli
+import discord_cli.exceptions as exceptions
+
+class Snowflake(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class Message(object):
+
+    def __init__(self):
+        self.author = Snowflake(1)
+        self.guild = Snowflake(2)
+        self.channel = Snowflake(3)
+
+class Embed(object):
+
+    """
+    Stands in for a discord.Embed
+    """
+
+    def __init__(self, title, description, color):
+        self.title = title
+        self.description = description
+        self.color = color
+
+async def function(client, message, params):
+    return params
+
+def command_system():
+    cs = dcli.Command_System('Test')
+    cs.command('count', function = function).argument.integer('amount')
+    return cs
+
+class Execution_Error_Callback_Test(unittest.TestCase):
+
+    def test_execute(self):
+        self.assertEqual(asyncio.run(command_system().execute(None, Message(), 'count 3')), {'amount': 3})
+
+    def test_error_without_discord(self):
+        # A None entry in sys.modules makes importing discord raise ImportError
+        with mock.patch.dict(sys.modules, {'discord': None}):
+            with self.assertRaises(exceptions.Command_Not_Found_Error):
+                asyncio.run(command_system().execute(None, Message(), 'missing'))
+            with self.assertRaises(exceptions.Discord_CLI_Error):
+                asyncio.run(command_system().execute(None, Message(), 'count x'))
+
+    def test_error_with_discord(self):
+        discord = types.ModuleType('discord')
+        discord.Embed = Embed
+        with mock.patch.dict(sys.modules, {'discord': discord}):
+            embed = asyncio.run(command_system().execute(None, Message(), 'missing'))
+        self.assertIsInstance(embed, Embed)
+        self.assertEqual(embed.description, ':x:Command not found')
+
+    def test_custom_callback_without_discord(self):
+        async def callback(exception):
+            return str(exception)
+
+        cs = command_system()
+        cs.set_execution_error_callback(callback)
+        with mock.patch.dict(sys.modules, {'discord': None}):
+            self.assertEqual(asyncio.run(cs.execute(None, Message(), 'missing')), 'Command not found')
+
+if __name__ == '__main__':
+    unittest.main()
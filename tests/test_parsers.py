@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+
+import discord_cli.exceptions as exceptions
+import discord_cli.parsers as parsers
+
+class Counting_Parser(parsers.Base_Parser):
+
+    """
+    A custom parser which changes it's own attributes while parsing
+    """
+
+    asynchronous = False
+
+    def __init__(self):
+        super(Counting_Parser, self).__init__()
+        self.hits = 0
+
+    def parse_sync(self, input_string):
+        self.hits += 1
+        return input_string
+
+class Doubled_Integer_Parser(parsers.Integer_Parser):
+
+    """
+    A derived parser which overrides parse and awaits the parse of it's base class
+    """
+
+    async def parse(self, input_string):
+        return 2 * await super(Doubled_Integer_Parser, self).parse(input_string)
+
+class Upper_Parser(parsers.Base_Parser):
+
+    """
+    A custom parser which implements parse_sync without setting asynchronous to False
+    """
+
+    def parse_sync(self, input_string):
+        return input_string.upper()
+
+class Parse_Test(unittest.TestCase):
+
+    def test_derived_parse_awaits_base_parse(self):
+        parser = Doubled_Integer_Parser(None, None, True, True)
+        self.assertTrue(parser.asynchronous)
+        self.assertEqual(asyncio.run(parser.parse('21')), 42)
+        with self.assertRaises(exceptions.Discord_CLI_Error):
+            asyncio.run(parser.parse('x'))
+
+    def test_parse_calls_parse_sync(self):
+        parser = Upper_Parser()
+        self.assertTrue(parser.asynchronous)
+        self.assertEqual(asyncio.run(parser.parse('abc')), 'ABC')
+
+    def test_parse_without_parse_sync(self):
+        class Unimplemented_Parser(parsers.Base_Parser):
+            pass
+
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(Unimplemented_Parser().parse('abc'))
+
+class Get_Parser_Test(unittest.TestCase):
+
+    def test_equal_configurations_share_a_parser(self):
+        parser = parsers.get_parser(parsers.Integer_Parser, 1, 10, True, True)
+        self.assertIs(parsers.get_parser(parsers.Integer_Parser, 1, 10, True, True), parser)
+        self.assertIsNot(parsers.get_parser(parsers.Integer_Parser, 1, 11, True, True), parser)
+        self.assertEqual(parsers.Integer_Parser(1, 10, True, True), parser)
+        self.assertEqual(hash(parsers.Integer_Parser(1, 10, True, True)), hash(parser))
+
+    def test_shared_parsers_are_immutable(self):
+        parser = parsers.get_parser(parsers.Enum_Parser, ['a', 'b'])
+        with self.assertRaises(exceptions.Type_Error):
+            parser._values = ('c',)
+        with self.assertRaises(exceptions.Type_Error):
+            del parser._matcher
+
+    def test_arguments_are_validated_regardless_of_the_cache(self):
+        parsers.get_parser(parsers.Enum_Parser, ['a', 'b'])
+        with self.assertRaises(exceptions.Type_Error):
+            parsers.get_parser(parsers.Enum_Parser, ('a', 'b'))
+        parsers.get_parser(parsers.Integer_Parser, 1, 10, True, True)
+        with self.assertRaises(exceptions.Type_Error):
+            parsers.get_parser(parsers.Integer_Parser, 1, 10, 1, True)
+
+class Custom_Parser_Test(unittest.TestCase):
+
+    def test_custom_parsers_can_change_their_attributes(self):
+        parser = Counting_Parser()
+        parser.parse_sync('a')
+        parser.parse_sync('b')
+        self.assertEqual(parser.hits, 2)
+
+    def test_custom_parsers_are_only_equal_to_themselves(self):
+        parser = Counting_Parser()
+        self.assertEqual(parser, parser)
+        self.assertNotEqual(parser, Counting_Parser())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+
+import discord_cli.permissions as permissions
+from discord_cli.permission_compiler import compile_permission
+
+class Snowflake(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class User(object):
+
+    """
+    Stands in for a discord.User, the author of a direct message, which has no roles or channel permissions
+    """
+
+    def __init__(self, id):
+        self.id = id
+
+class Permissions(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.administrator = value & permissions.Administrator.flag == permissions.Administrator.flag
+
+class Member(User):
+
+    """
+    Stands in for a discord.Member, the author of a message sent in a guild
+    """
+
+    def __init__(self, id, value, role_ids = ()):
+        super(Member, self).__init__(id)
+        self.value = value
+        self.roles = [Snowflake(x) for x in role_ids]
+
+    def permissions_in(self, channel):
+        return Permissions(self.value)
+
+class Message(object):
+
+    def __init__(self, author, guild_id):
+        self.author = author
+        self.guild = None if guild_id is None else Snowflake(guild_id)
+        self.channel = Snowflake(100)
+
+async def in_guild(client, message):
+    return message.guild is not None
+
+async def in_direct_message(client, message):
+    return message.guild is None
+
+def direct_message():
+    return Message(User(1), None)
+
+def guild_message():
+    return Message(Member(1, permissions.Administrator.flag, (5,)), 7)
+
+class Guard_Test(unittest.TestCase):
+
+    def evaluate(self, permission, message, concurrent = False):
+        context = permissions.Permission_Context(None, message, concurrent = concurrent)
+        return asyncio.run(context.evaluate(compile_permission(permission)))
+
+    def guarded(self):
+        return [
+            permissions.Custom_Permission(in_guild) & permissions.Administrator(),
+            permissions.Custom_Permission(in_guild) & permissions.Guild_Permission(7),
+            permissions.Custom_Permission(in_guild) & permissions.Guild_Set_Permission([7, 8]),
+            permissions.Custom_Permission(in_guild) & permissions.Role_Set_Permission([5]),
+            permissions.Custom_Permission(in_guild) & (permissions.Kick_Members() | permissions.Administrator()),
+            permissions.User_Permission(1) & permissions.Custom_Permission(in_guild) & permissions.Administrator(),
+        ]
+
+    def test_guard_in_direct_message(self):
+        for concurrent in (False, True):
+            for permission in self.guarded():
+                self.assertIs(bool(self.evaluate(permission, direct_message(), concurrent)), False, str(permission))
+
+    def test_guard_in_guild(self):
+        for concurrent in (False, True):
+            for permission in self.guarded():
+                self.assertIs(bool(self.evaluate(permission, guild_message(), concurrent)), True, str(permission))
+
+    def test_or_guard_in_direct_message(self):
+        permission = permissions.Custom_Permission(in_direct_message) | permissions.Administrator()
+        self.assertIs(bool(self.evaluate(permission, direct_message())), True)
+
+    def test_guard_is_evaluated_first(self):
+        compiled = compile_permission(permissions.Custom_Permission(in_guild) & permissions.Administrator())
+        self.assertIsInstance(compiled.permissions[0], permissions.Custom_Permission)
+
+    def test_permissions_which_do_not_need_a_guild_are_still_moved(self):
+        compiled = compile_permission(permissions.Custom_Permission(in_guild) & permissions.User_Permission(1))
+        self.assertIsInstance(compiled.permissions[0], permissions.User_Permission)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import discord_cli.permissions as permissions
+from discord_cli.cache import Permission_Decision_Cache
+from discord_cli.command import Command
+
+class Snowflake(object):
+
+    def __init__(self, id):
+        self.id = id
+
+class Message(object):
+
+    """
+    Stands in for a discord.Message, with only the ids the decision cache is keyed by
+    """
+
+    def __init__(self, user_id, guild_id, channel_id):
+        self.author = Snowflake(user_id)
+        self.guild = None if guild_id is None else Snowflake(guild_id)
+        self.channel = Snowflake(channel_id)
+
+class Counting_Check(object):
+
+    """
+    A custom permission function which counts how often it is called
+    """
+
+    def __init__(self, result = True):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self, client, message):
+        self.calls += 1
+        return self.result
+
+def custom_permission(check):
+    async def permission_function(client, message):
+        return await check(client, message)
+    return permissions.Custom_Permission(permission_function)
+
+class Permission_Decision_Cache_Test(unittest.TestCase):
+
+    def test_get_and_put(self):
+        cache = Permission_Decision_Cache(4, ttl = 60)
+        self.assertIsNone(cache.get(('builder', 1, 2, 3)))
+        cache.put(('builder', 1, 2, 3), True)
+        self.assertIs(cache.get(('builder', 1, 2, 3)), True)
+        cache.put(('builder', 1, 2, 4), False)
+        self.assertIs(cache.get(('builder', 1, 2, 4)), False)
+        self.assertEqual(len(cache), 2)
+
+    def test_hits_and_misses(self):
+        cache = Permission_Decision_Cache(4, ttl = 60)
+        self.assertEqual(cache.hit_rate, 0.0)
+        cache.get(('builder', 1, 2, 3))
+        cache.put(('builder', 1, 2, 3), True)
+        cache.get(('builder', 1, 2, 3))
+        cache.get(('builder', 1, 2, 3))
+        cache.get(('builder', 5, 2, 3))
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_ttl_expiry(self):
+        cache = Permission_Decision_Cache(4, ttl = 10)
+        with mock.patch('discord_cli.cache.time.monotonic', return_value = 100.0) as monotonic:
+            cache.put(('builder', 1, 2, 3), True)
+            monotonic.return_value = 109.5
+            self.assertIs(cache.get(('builder', 1, 2, 3)), True)
+            monotonic.return_value = 110.0
+            self.assertIsNone(cache.get(('builder', 1, 2, 3)))
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = Permission_Decision_Cache(2, ttl = 60)
+        cache.put(('builder', 1, 2, 3), True)
+        cache.put(('builder', 2, 2, 3), True)
+        # Using the first decision makes the second the least recently used
+        cache.get(('builder', 1, 2, 3))
+        cache.put(('builder', 3, 2, 3), False)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIs(cache.get(('builder', 1, 2, 3)), True)
+        self.assertIsNone(cache.get(('builder', 2, 2, 3)))
+        self.assertIs(cache.get(('builder', 3, 2, 3)), False)
+
+    def fill(self, cache):
+        # (user, guild, channel)
+        for key in ((1, 10, 100), (1, 10, 101), (1, 11, 110), (2, 10, 100), (3, None, 200)):
+            cache.put(('builder',) + key, True)
+
+    def remaining(self, cache):
+        return {key[1:] for key in cache._entries}
+
+    def test_invalidate_member(self):
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        self.fill(cache)
+        cache.invalidate_member(1, 10)
+        self.assertEqual(self.remaining(cache), {(1, 11, 110), (2, 10, 100), (3, None, 200)})
+        cache.invalidate_member(1)
+        self.assertEqual(self.remaining(cache), {(2, 10, 100), (3, None, 200)})
+        self.assertEqual(cache.invalidations, 3)
+        cache.invalidate_member(4)
+        self.assertEqual(cache.invalidations, 3)
+
+    def test_invalidate_guild(self):
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        self.fill(cache)
+        cache.invalidate_guild(10)
+        self.assertEqual(self.remaining(cache), {(1, 11, 110), (3, None, 200)})
+        self.assertEqual(cache.invalidations, 3)
+
+    def test_invalidate_channel(self):
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        self.fill(cache)
+        cache.invalidate_channel(100)
+        self.assertEqual(self.remaining(cache), {(1, 10, 101), (1, 11, 110), (3, None, 200)})
+        self.assertEqual(cache.invalidations, 2)
+        # A channel invalidated again after it's decisions were made again
+        cache.put(('builder', 1, 10, 100), False)
+        cache.invalidate_channel(100)
+        self.assertIsNone(cache.get(('builder', 1, 10, 100)))
+
+class Permission_Builder_Evaluate_Test(unittest.TestCase):
+
+    def evaluate(self, command, message, cache):
+        context = permissions.Permission_Context(None, message, cache)
+        return asyncio.run(command._permission_builder.evaluate(None, message, context))
+
+    def test_decision_is_cached(self):
+        check = Counting_Check(True)
+        command = Command('command')
+        command.permission(custom_permission(check))
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        message = Message(1, 10, 100)
+
+        self.assertIs(self.evaluate(command, message, cache), True)
+        self.assertIs(self.evaluate(command, message, cache), True)
+        self.assertEqual(check.calls, 1)
+        self.assertEqual(cache.hits, 1)
+
+        # Another user in the same channel is evaluated separately
+        self.assertIs(self.evaluate(command, Message(2, 10, 100), cache), True)
+        self.assertEqual(check.calls, 2)
+
+    def test_without_cache(self):
+        check = Counting_Check(True)
+        command = Command('command')
+        command.permission(custom_permission(check))
+        message = Message(1, 10, 100)
+
+        self.evaluate(command, message, None)
+        self.evaluate(command, message, None)
+        self.assertEqual(check.calls, 2)
+
+    def test_decision_is_not_shared_between_builders(self):
+        allowed = Command('allowed')
+        allowed.permission(custom_permission(Counting_Check(True)))
+        denied = Command('denied')
+        denied.permission(custom_permission(Counting_Check(False)))
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        message = Message(1, 10, 100)
+
+        self.assertIs(self.evaluate(allowed, message, cache), True)
+        self.assertIs(self.evaluate(denied, message, cache), False)
+        self.assertIs(self.evaluate(allowed, message, cache), True)
+        self.assertEqual(len(cache), 2)
+
+    def test_invalidated_decision_is_evaluated_again(self):
+        check = Counting_Check(True)
+        command = Command('command')
+        command.permission(custom_permission(check))
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        message = Message(1, 10, 100)
+
+        self.assertIs(self.evaluate(command, message, cache), True)
+        check.result = False
+        self.assertIs(self.evaluate(command, message, cache), True)
+        cache.invalidate_member(1, 10)
+        self.assertIs(self.evaluate(command, message, cache), False)
+        self.assertEqual(check.calls, 2)
+
+    def test_direct_message(self):
+        check = Counting_Check(True)
+        command = Command('command')
+        command.permission(custom_permission(check))
+        cache = Permission_Decision_Cache(16, ttl = 60)
+        message = Message(1, None, 100)
+
+        self.assertIs(self.evaluate(command, message, cache), True)
+        self.assertIs(self.evaluate(command, message, cache), True)
+        self.assertEqual(check.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()